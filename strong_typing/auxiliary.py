@@ -165,6 +165,34 @@ class SpecialConversion:
     "Indicates that the annotated type is subject to custom conversion rules."
 
 
+@typeannotation
+class Discriminator:
+    """
+    Name of the JSON property that identifies the member type of a (tagged) union type.
+
+    Applies to a union type, e.g. `Annotated[Union[A, B], Discriminator("kind")]`. The value of the property for each
+    member type is taken from a `Tag` annotation on the member type, or the `Literal` type of the matching property.
+    """
+
+    property_name: str
+
+
+@typeannotation
+class Tag:
+    "Value of the discriminator property that identifies a member type in a tagged union, e.g. `Annotated[A, Tag(1)]`."
+
+    value: Union[bool, int, str]
+
+
+@typeannotation
+class Interned:
+    """
+    Indicates that strings of the annotated type are interned when de-serialized, e.g. `Annotated[str, Interned()]`.
+
+    Recurring values of a low-cardinality field (e.g. a country code or a status) then share a single Python object.
+    """
+
+
 int8: TypeAlias = Annotated[int, Signed(True), Storage(1), IntegerRange(-128, 127)]
 int16: TypeAlias = Annotated[int, Signed(True), Storage(2), IntegerRange(-32768, 32767)]
 int32: TypeAlias = Annotated[
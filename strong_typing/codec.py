@@ -0,0 +1,122 @@
+"""
+Type-safe data interchange for Python data classes.
+
+:see: https://github.com/hunyadi/strong_typing
+"""
+
+import datetime
+import re
+import sys
+import uuid
+
+from .exception import JsonValueError
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+_UUID = uuid.UUID
+_SAFE_UNKNOWN = uuid.SafeUUID.unknown
+
+
+def uuid_from_str(s: str) -> uuid.UUID:
+    """
+    Parses a UUID string.
+
+    A string in the canonical 8-4-4-4-12 layout of hexadecimal digits is converted directly to an integer. Other forms
+    accepted by the constructor of `uuid.UUID` (e.g. with curly braces or a `urn:uuid:` prefix) take the general path.
+
+    :raises ValueError: The string is not a valid UUID.
+    """
+
+    if len(s) == 36 and s[8] == "-" and s[13] == "-" and s[18] == "-" and s[23] == "-" and s.isascii():
+        digits = s.replace("-", "")
+        # reject characters that `int` would accept, e.g. `_`, `+` or whitespace
+        if len(digits) == 32 and digits.isalnum():
+            # bypass argument processing in `uuid.UUID.__init__`
+            obj = _new_object(_UUID)
+            _set_attribute(obj, "int", int(digits, 16))
+            _set_attribute(obj, "is_safe", _SAFE_UNKNOWN)
+            return obj
+
+    return _UUID(s)
+
+
+if sys.version_info >= (3, 11):
+
+    def datetime_from_str(s: str) -> datetime.datetime:
+        """
+        Parses a timestamp string in ISO 8601 format.
+
+        :raises ValueError: The string is not a valid timestamp.
+        """
+
+        # `fromisoformat` accepts the military time zone "Zulu" for UTC
+        return datetime.datetime.fromisoformat(s)
+
+else:
+
+    def datetime_from_str(s: str) -> datetime.datetime:
+        """
+        Parses a timestamp string in ISO 8601 format.
+
+        :raises ValueError: The string is not a valid timestamp.
+        """
+
+        if s.endswith("Z"):
+            s = f"{s[:-1]}+00:00"  # Python's isoformat() does not support military time zones like "Zulu" for UTC
+        return datetime.datetime.fromisoformat(s)
+
+
+def datetime_to_str(obj: datetime.datetime) -> str:
+    "Returns the ISO 8601 string representation of a timestamp, with the suffix `Z` for UTC."
+
+    if obj.tzinfo is datetime.timezone.utc:
+        # skip checking the suffix produced by `isoformat` for the most common time zone
+        return f"{obj.isoformat()[:-6]}Z"
+
+    fmt = obj.isoformat()
+    if fmt.endswith("+00:00"):
+        fmt = f"{fmt[:-6]}Z"  # Python's isoformat() does not support military time zones like "Zulu" for UTC
+    return fmt
+
+
+_ISO8601_DURATION = re.compile(
+    r"^P"  # starts with 'P'
+    r"(?:(?P<weeks>\d+)W)?"  # optional weeks
+    r"(?:(?P<days>\d+)D)?"  # optional days
+    r"(?:T"  # start of time part
+    r"(?:(?P<hours>\d+)H)?"  # optional hours
+    r"(?:(?P<minutes>\d+)M)?"  # optional minutes
+    r"(?:(?P<seconds>\d+)(?:\.(?P<fractional>\d{1,9}))?S)?"  # optional seconds (integer and fractional part)
+    r")?$",  # end of time part
+    flags=re.ASCII,
+)
+
+
+def timedelta_from_str(s: str) -> datetime.timedelta:
+    """
+    Parses a duration string in ISO 8601 format.
+
+    Format string is limited to weeks, days, hours, minutes, seconds and sub-second fractional part up to microsecond
+    precision.
+
+    :raises JsonValueError: The string is not a valid duration, or has a precision finer than a microsecond.
+    """
+
+    match = _ISO8601_DURATION.match(s)
+    if not match:
+        raise JsonValueError(
+            "`timedelta` type expects ISO 8601 duration format string (with limitations) but received: {}", s
+        )
+
+    weeks, days, hours, minutes, seconds, fractional = match.groups()
+
+    # sub-second component
+    nanoseconds = int(fractional.ljust(9, "0")) if fractional else 0
+    if nanoseconds % 1000 != 0:  # timedelta type supports microsecond precision only
+        raise JsonValueError("`timedelta` type supports microsecond precision only but received: {}", s)
+
+    return datetime.timedelta(
+        days=7 * int(weeks or 0) + int(days or 0),
+        seconds=3600 * int(hours or 0) + 60 * int(minutes or 0) + int(seconds or 0),
+        microseconds=nanoseconds // 1000,
+    )
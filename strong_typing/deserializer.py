@@ -11,17 +11,23 @@ import base64
 import dataclasses
 import datetime
 import enum
+import functools
 import inspect
 import ipaddress
-import re
+import keyword
+import math
+import operator
 import sys
 import types
 import typing
 import uuid
+import weakref
 from dataclasses import dataclass
 from types import ModuleType
-from typing import Any, Callable, Generic, Literal, NamedTuple, Optional, TypeVar, Union
+from typing import Any, Callable, Generic, Iterable, Literal, NamedTuple, Optional, TypeVar, Union
 
+from .auxiliary import Discriminator, Interned, Tag
+from .codec import datetime_from_str, timedelta_from_str, uuid_from_str
 from .core import JsonType
 from .exception import JsonKeyError, JsonTypeError, JsonValueError
 from .inspection import (
@@ -29,6 +35,7 @@ from .inspection import (
     create_object,
     enum_value_types,
     evaluate_type,
+    get_annotation,
     get_class_properties,
     get_class_property,
     get_resolved_hints,
@@ -38,12 +45,14 @@ from .inspection import (
     is_type_annotated,
     is_type_literal,
     is_type_optional,
+    is_type_union,
     unwrap_annotated_type,
     unwrap_literal_values,
     unwrap_optional_type,
 )
-from .mapping import python_field_to_json_property
+from .mapping import get_json_property_type, python_field_to_json_property
 from .name import python_type_to_str
+from .projection import Projection, format_projection, parse_projection
 
 E = TypeVar("E", bound=enum.Enum)
 T = TypeVar("T")
@@ -52,6 +61,16 @@ K = TypeVar("K")
 V = TypeVar("V")
 
 
+class _ParseFailure:
+    "Signals that a JSON value is not compatible with a type, returned by `try_parse` instead of raising an exception."
+
+    def __repr__(self) -> str:
+        return "FAILURE"
+
+
+FAILURE: Any = _ParseFailure()
+
+
 class Deserializer(abc.ABC, Generic[T]):
     "Parses a JSON value into a Python type."
 
@@ -71,105 +90,238 @@ class Deserializer(abc.ABC, Generic[T]):
         :returns: The Python object that the JSON value de-serializes to.
         """
 
+    def try_parse(self, data: JsonType) -> Any:
+        """
+        Parses a JSON value into a Python type, signalling incompatible input without an exception where possible.
+
+        Used when probing alternatives (e.g. member types of a union), which makes failure an expected outcome. Unlike
+        `parse`, this function may return `FAILURE` if the JSON value cannot be parsed into the type. However, it may
+        still raise `JsonKeyError` or `JsonTypeError` (e.g. for nested values).
+
+        :param data: The JSON value to de-serialize.
+        :returns: The Python object that the JSON value de-serializes to, or `FAILURE`.
+        """
+
+        return self.parse(data)
+
+    def get_json_types(self) -> Optional[frozenset[type]]:
+        """
+        Returns the Python types (as produced by `json.loads`) of JSON values that this parser may accept.
+
+        Values of any other type are rejected with `JsonKeyError` or `JsonTypeError`, which lets a union skip members
+        that are not compatible with the input.
 
-@dataclass
+        :returns: A set of types such as `dict`, `list`, `str`, `int`, `float`, `bool` or `NoneType`, or `None` if the
+            parser may accept any value.
+        """
+
+        return None
+
+
+@dataclass(frozen=True)
 class DeserializerOptions:
     """
     Configures how the de-serializer processes input and generates output.
 
+    Options are immutable and hashable such that de-serializer engines built with different options are cached
+    separately.
+
     :param skip_unassigned: Whether to ignore extra members in the source JSON that don't have a matching Python class
         member variable.
+    :param adaptive_union: Whether to try member types of a union in the order of how frequently they have matched
+        past input rather than in the order of declaration. See `AdaptiveUnionDeserializer` for caveats.
+    :param trusted: Whether the input is known to be well-formed (e.g. produced by the serializer in this package), in
+        which case values of fundamental types are assigned without type checks and unrecognized properties are not
+        looked for. Malformed input may produce objects with invalid member values, or raise exceptions such as
+        `KeyError` instead of `JsonKeyError`.
+    :param lazy: Whether to create data class instances whose fields of a class or container type are de-serialized
+        only when first accessed. See `LazyDataclassDeserializer` for details.
+    :param intern_keys: Whether to intern the keys of a `dict` with `str` keys, such that keys recurring across
+        dictionaries share a single Python object.
+    :param value_cache_size: Maximum number of objects of an immutable type (e.g. `datetime`, `UUID`, `IPv4Address` or
+        an enumeration) to re-use when the same JSON value recurs, or zero to create a new object for each value. See
+        `CachingDeserializer` for details.
+    :param frozen_cache_size: Maximum number of frozen data class instances to share when their field values compare
+        equal, or zero to create a new instance for each JSON object. See `FrozenDataclassDeserializer` for details.
     """
 
     skip_unassigned: bool = False
+    adaptive_union: bool = False
+    trusted: bool = False
+    lazy: bool = False
+    intern_keys: bool = False
+    value_cache_size: int = 0
+    frozen_cache_size: int = 0
 
 
 class RecursiveDeserializer(Deserializer[T]):
     options: DeserializerOptions
+    projection: Projection = ()
+    "Properties to include in nested objects, or an empty tuple to include all properties."
 
     def __init__(self, options: DeserializerOptions):
         super().__init__()
         self.options = options
 
     def get_deserializer(self, typ: TypeLike, context: Optional[ModuleType]) -> Deserializer:
+        if self.projection:
+            # containers (e.g. `list` or `dict`) and unions pass on the projection to their items or members
+            return _get_projected_deserializer(typ, self.projection, context, self.options)
         return _get_deserializer(typ, context, self.options)
 
 
 class NoneDeserializer(Deserializer[None]):
     "Parses JSON `null` values into Python `None`."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _NULL_TYPES
+
+    def try_parse(self, data: JsonType) -> Any:
+        return None if data is None else FAILURE
+
     def parse(self, data: JsonType) -> None:
         if data is not None:
-            raise JsonTypeError(f"`None` type expects JSON `null` but instead received: {data}")
+            raise JsonTypeError("`None` type expects JSON `null` but instead received: {}", data)
         return None
 
 
 class BoolDeserializer(Deserializer[bool]):
     "Parses JSON `boolean` values into Python `bool` type."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _BOOLEAN_TYPES
+
+    def try_parse(self, data: JsonType) -> Any:
+        return data if isinstance(data, bool) else FAILURE
+
     def parse(self, data: JsonType) -> bool:
         if not isinstance(data, bool):
-            raise JsonTypeError(f"`bool` type expects JSON `boolean` data but instead received: {data}")
+            raise JsonTypeError("`bool` type expects JSON `boolean` data but instead received: {}", data)
         return bool(data)
 
 
 class IntDeserializer(Deserializer[int]):
     "Parses JSON `number` values into Python `int` type."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _INTEGER_TYPES
+
+    def try_parse(self, data: JsonType) -> Any:
+        return int(data) if isinstance(data, int) else FAILURE
+
     def parse(self, data: JsonType) -> int:
         if not isinstance(data, int):
-            raise JsonTypeError(f"`int` type expects integer data as JSON `number` but instead received: {data}")
+            raise JsonTypeError("`int` type expects integer data as JSON `number` but instead received: {}", data)
         return int(data)
 
 
 class FloatDeserializer(Deserializer[float]):
     "Parses JSON `number` values into Python `float` type."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _NUMBER_TYPES
+
+    def try_parse(self, data: JsonType) -> Any:
+        return float(data) if isinstance(data, (float, int)) else FAILURE
+
     def parse(self, data: JsonType) -> float:
         if not isinstance(data, float) and not isinstance(data, int):
-            raise JsonTypeError(f"`int` type expects data as JSON `number` but instead received: {data}")
+            raise JsonTypeError("`int` type expects data as JSON `number` but instead received: {}", data)
         return float(data)
 
 
 class StringDeserializer(Deserializer[str]):
     "Parses JSON `string` values into Python `str` type."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _STRING_TYPES
+
+    def try_parse(self, data: JsonType) -> Any:
+        return str(data) if isinstance(data, str) else FAILURE
+
     def parse(self, data: JsonType) -> str:
         if not isinstance(data, str):
-            raise JsonTypeError(f"`str` type expects JSON `string` data but instead received: {data}")
+            raise JsonTypeError("`str` type expects JSON `string` data but instead received: {}", data)
         return str(data)
 
 
+class InternedStringDeserializer(StringDeserializer):
+    "Parses JSON `string` values into interned Python `str` values."
+
+    def try_parse(self, data: JsonType) -> Any:
+        return sys.intern(data) if isinstance(data, str) else FAILURE
+
+    def parse(self, data: JsonType) -> str:
+        if not isinstance(data, str):
+            raise JsonTypeError("`str` type expects JSON `string` data but instead received: {}", data)
+        return sys.intern(str(data))
+
+
+class TrustedBoolDeserializer(BoolDeserializer):
+    "Passes through JSON `boolean` values as Python `bool` without a type check."
+
+    def parse(self, data: JsonType) -> bool:
+        return data  # type: ignore[return-value]
+
+
+class TrustedIntDeserializer(IntDeserializer):
+    "Passes through JSON `number` values as Python `int` without a type check."
+
+    def parse(self, data: JsonType) -> int:
+        return data  # type: ignore[return-value]
+
+
+class TrustedFloatDeserializer(FloatDeserializer):
+    "Converts JSON `number` values into Python `float` without a type check."
+
+    def parse(self, data: JsonType) -> float:
+        return float(data)  # type: ignore[arg-type]
+
+
+class TrustedStringDeserializer(StringDeserializer):
+    "Passes through JSON `string` values as Python `str` without a type check."
+
+    def parse(self, data: JsonType) -> str:
+        return data  # type: ignore[return-value]
+
+
 class BytesDeserializer(Deserializer[bytes]):
     "Parses JSON `string` values of Base64-encoded strings into Python `bytes` type."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _STRING_TYPES
+
     def parse(self, data: JsonType) -> bytes:
         if not isinstance(data, str):
-            raise JsonTypeError(f"`bytes` type expects JSON `string` data but instead received: {data}")
+            raise JsonTypeError("`bytes` type expects JSON `string` data but instead received: {}", data)
         return base64.b64decode(data, validate=True)
 
 
 class DateTimeDeserializer(Deserializer[datetime.datetime]):
     "Parses JSON `string` values representing timestamps in ISO 8601 format to Python `datetime` with time zone."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _STRING_TYPES
+
     def parse(self, data: JsonType) -> datetime.datetime:
         if not isinstance(data, str):
-            raise JsonTypeError(f"`datetime` type expects JSON `string` data but instead received: {data}")
+            raise JsonTypeError("`datetime` type expects JSON `string` data but instead received: {}", data)
 
-        if data.endswith("Z"):
-            data = f"{data[:-1]}+00:00"  # Python's isoformat() does not support military time zones like "Zulu" for UTC
-        timestamp = datetime.datetime.fromisoformat(data)
+        timestamp = datetime_from_str(data)
         if timestamp.tzinfo is None:
-            raise JsonValueError(f"timestamp lacks explicit time zone designator: {data}")
+            raise JsonValueError("timestamp lacks explicit time zone designator: {}", data)
         return timestamp
 
 
 class DateDeserializer(Deserializer[datetime.date]):
     "Parses JSON `string` values representing dates in ISO 8601 format to Python `date` type."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _STRING_TYPES
+
     def parse(self, data: JsonType) -> datetime.date:
         if not isinstance(data, str):
-            raise JsonTypeError(f"`date` type expects JSON `string` data but instead received: {data}")
+            raise JsonTypeError("`date` type expects JSON `string` data but instead received: {}", data)
 
         return datetime.date.fromisoformat(data)
 
@@ -177,9 +329,12 @@ class DateDeserializer(Deserializer[datetime.date]):
 class TimeDeserializer(Deserializer[datetime.time]):
     "Parses JSON `string` values representing time instances in ISO 8601 format to Python `time` type with time zone."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _STRING_TYPES
+
     def parse(self, data: JsonType) -> datetime.time:
         if not isinstance(data, str):
-            raise JsonTypeError(f"`time` type expects JSON `string` data but instead received: {data}")
+            raise JsonTypeError("`time` type expects JSON `string` data but instead received: {}", data)
 
         return datetime.time.fromisoformat(data)
 
@@ -193,75 +348,49 @@ class TimeDeltaDeserializer(Deserializer[datetime.timedelta]):
     in Gregorian months or leap years) and is limited to microsecond precision.
     """
 
+    def get_json_types(self) -> frozenset[type]:
+        return _STRING_TYPES
+
     def parse(self, data: JsonType) -> datetime.timedelta:
         if not isinstance(data, str):
-            raise JsonTypeError(f"`timedelta` type expects JSON `string` data but instead received: {data}")
-
-        pattern = re.compile(
-            r"^P"  # starts with 'P'
-            r"(?:(?P<weeks>\d+)W)?"  # optional weeks
-            r"(?:(?P<days>\d+)D)?"  # optional days
-            r"(?:T"  # start of time part
-            r"(?:(?P<hours>\d+)H)?"  # optional hours
-            r"(?:(?P<minutes>\d+)M)?"  # optional minutes
-            r"(?:(?P<seconds>\d+)(?:\.(?P<fractional>\d{1,9}))?S)?"  # optional seconds (integer and fractional part)
-            r")?$",  # end of time part
-            flags=re.ASCII,
-        )
-
-        match = pattern.match(data)
-        if not match:
-            raise JsonValueError(
-                f"`timedelta` type expects ISO 8601 duration format string (with limitations) but received: {data}"
-            )
-
-        parts = match.groupdict()
+            raise JsonTypeError("`timedelta` type expects JSON `string` data but instead received: {}", data)
 
-        # day component
-        weeks = int(parts["weeks"]) if parts["weeks"] else 0
-        days = int(parts["days"]) if parts["days"] else 0
-
-        # time component
-        hours = int(parts["hours"]) if parts["hours"] else 0
-        minutes = int(parts["minutes"]) if parts["minutes"] else 0
-        seconds = int(parts["seconds"]) if parts["seconds"] else 0
-
-        # sub-second component
-        nanoseconds = int(parts["fractional"].ljust(9, "0")) if parts["fractional"] else 0
-        if nanoseconds % 1000 != 0:  # timedelta type supports microsecond precision only
-            raise JsonValueError(f"`timedelta` type supports microsecond precision only but received: {data}")
-
-        return datetime.timedelta(
-            days=7 * weeks + days,
-            seconds=3600 * hours + 60 * minutes + seconds,
-            microseconds=nanoseconds // 1000,
-        )
+        return timedelta_from_str(data)
 
 
 class UUIDDeserializer(Deserializer[uuid.UUID]):
     "Parses JSON `string` values of UUID strings into Python `uuid.UUID` type."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _STRING_TYPES
+
     def parse(self, data: JsonType) -> uuid.UUID:
         if not isinstance(data, str):
-            raise JsonTypeError(f"`UUID` type expects JSON `string` data but instead received: {data}")
-        return uuid.UUID(data)
+            raise JsonTypeError("`UUID` type expects JSON `string` data but instead received: {}", data)
+        return uuid_from_str(data)
 
 
 class IPv4Deserializer(Deserializer[ipaddress.IPv4Address]):
     "Parses JSON `string` values of IPv4 address strings into Python `ipaddress.IPv4Address` type."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _STRING_TYPES
+
     def parse(self, data: JsonType) -> ipaddress.IPv4Address:
         if not isinstance(data, str):
-            raise JsonTypeError(f"`IPv4Address` type expects JSON `string` data but instead received: {data}")
+            raise JsonTypeError("`IPv4Address` type expects JSON `string` data but instead received: {}", data)
         return ipaddress.IPv4Address(data)
 
 
 class IPv6Deserializer(Deserializer[ipaddress.IPv6Address]):
     "Parses JSON `string` values of IPv6 address strings into Python `ipaddress.IPv6Address` type."
 
+    def get_json_types(self) -> frozenset[type]:
+        return _STRING_TYPES
+
     def parse(self, data: JsonType) -> ipaddress.IPv6Address:
         if not isinstance(data, str):
-            raise JsonTypeError(f"`IPv6Address` type expects JSON `string` data but instead received: {data}")
+            raise JsonTypeError("`IPv6Address` type expects JSON `string` data but instead received: {}", data)
         return ipaddress.IPv6Address(data)
 
 
@@ -278,20 +407,48 @@ class ListDeserializer(RecursiveDeserializer[list[T]]):
     def build(self, context: Optional[ModuleType]) -> None:
         self.item_parser = self.get_deserializer(self.item_type, context)
 
+    def get_json_types(self) -> frozenset[type]:
+        return _ARRAY_TYPES
+
+    @functools.cached_property
+    def container_type(self) -> str:
+        return f"list[{python_type_to_str(self.item_type)}]"
+
     def parse(self, data: JsonType) -> list[T]:
         if not isinstance(data, list):
-            type_name = python_type_to_str(self.item_type)
-            raise JsonTypeError(f"type `list[{type_name}]` expects JSON `array` data but instead received: {data}")
+            raise JsonTypeError(
+                "type `{}` expects JSON `array` data but instead received: {}", self.container_type, data
+            )
 
         return [self.item_parser.parse(item) for item in data]
 
 
+class TrustedListDeserializer(ListDeserializer[T]):
+    "De-serializes a JSON array into a Python `list` without a type check, copying items that need no conversion."
+
+    def parse(self, data: JsonType) -> list[T]:
+        item_parser = self.item_parser
+        if type(item_parser) in _IDENTITY_DESERIALIZERS:
+            return list(data)  # type: ignore[arg-type]
+        else:
+            return [item_parser.parse(item) for item in data]  # type: ignore[union-attr]
+
+    def try_parse(self, data: JsonType) -> Any:
+        if not isinstance(data, list):
+            return FAILURE
+
+        item_parser = self.item_parser
+        items = [item_parser.try_parse(item) for item in data]
+        return FAILURE if any(item is FAILURE for item in items) else items
+
+
 class DictDeserializer(RecursiveDeserializer[dict[K, V]]):
     "Recursively de-serializes a JSON object into a Python `dict`."
 
     key_type: type[K]
     value_type: type[V]
     value_parser: Deserializer[V]
+    key_parser: Callable[[str], K]
 
     def __init__(self, key_type: type[K], value_type: type[V], options: DeserializerOptions) -> None:
         super().__init__(options)
@@ -299,6 +456,11 @@ class DictDeserializer(RecursiveDeserializer[dict[K, V]]):
         self.value_type = value_type
         self._check_key_type()
 
+        if key_type is str and options.intern_keys:
+            self.key_parser = typing.cast(Callable[[str], K], sys.intern)
+        else:
+            self.key_parser = typing.cast(Callable[[str], K], self.key_type)
+
     def build(self, context: Optional[ModuleType]) -> None:
         self.value_parser = self.get_deserializer(self.value_type, context)
 
@@ -325,22 +487,46 @@ class DictDeserializer(RecursiveDeserializer[dict[K, V]]):
             f"`type `{self.container_type}` has invalid key type, expected `str` or `enum.Enum` with string values"
         )
 
-    @property
+    @functools.cached_property
     def container_type(self) -> str:
         key_type_name = python_type_to_str(self.key_type)
         value_type_name = python_type_to_str(self.value_type)
         return f"dict[{key_type_name}, {value_type_name}]"
 
+    def get_json_types(self) -> frozenset[type]:
+        return _OBJECT_TYPES
+
     def parse(self, data: JsonType) -> dict[K, V]:
         if not isinstance(data, dict):
             raise JsonTypeError(
-                f"`type `{self.container_type}` expects JSON `object` data but instead received: {data}"
+                "`type `{}` expects JSON `object` data but instead received: {}", self.container_type, data
             )
 
-        return dict(
-            (self.key_type(key), self.value_parser.parse(value))  # type: ignore[call-arg]
-            for key, value in data.items()
-        )
+        key_parser = self.key_parser
+        return dict((key_parser(key), self.value_parser.parse(value)) for key, value in data.items())
+
+
+class TrustedDictDeserializer(DictDeserializer[K, V]):
+    "De-serializes a JSON object into a Python `dict` without a type check, copying values that need no conversion."
+
+    def parse(self, data: JsonType) -> dict[K, V]:
+        value_parser = self.value_parser
+        if self.key_parser is not str:
+            key_parser = self.key_parser
+            return {key_parser(key): value_parser.parse(value) for key, value in data.items()}  # type: ignore[union-attr]
+        elif type(value_parser) in _IDENTITY_DESERIALIZERS:
+            return dict(data)  # type: ignore[arg-type]
+        else:
+            return {key: value_parser.parse(value) for key, value in data.items()}  # type: ignore[union-attr, misc]
+
+    def try_parse(self, data: JsonType) -> Any:
+        if not isinstance(data, dict):
+            return FAILURE
+
+        key_parser = self.key_parser
+        value_parser = self.value_parser
+        values = {key_parser(key): value_parser.try_parse(value) for key, value in data.items()}
+        return FAILURE if any(value is FAILURE for value in values.values()) else values
 
 
 class SetDeserializer(RecursiveDeserializer[set[T]]):
@@ -356,14 +542,41 @@ class SetDeserializer(RecursiveDeserializer[set[T]]):
     def build(self, context: Optional[ModuleType]) -> None:
         self.member_parser = self.get_deserializer(self.member_type, context)
 
+    def get_json_types(self) -> frozenset[type]:
+        return _ARRAY_TYPES
+
+    @functools.cached_property
+    def container_type(self) -> str:
+        return f"set[{python_type_to_str(self.member_type)}]"
+
     def parse(self, data: JsonType) -> set[T]:
         if not isinstance(data, list):
-            type_name = python_type_to_str(self.member_type)
-            raise JsonTypeError(f"type `set[{type_name}]` expects JSON `array` data but instead received: {data}")
+            raise JsonTypeError(
+                "type `{}` expects JSON `array` data but instead received: {}", self.container_type, data
+            )
 
         return set(self.member_parser.parse(item) for item in data)
 
 
+class TrustedSetDeserializer(SetDeserializer[T]):
+    "De-serializes a JSON array into a Python `set` without a type check, copying members that need no conversion."
+
+    def parse(self, data: JsonType) -> set[T]:
+        member_parser = self.member_parser
+        if type(member_parser) in _IDENTITY_DESERIALIZERS:
+            return set(data)  # type: ignore[arg-type]
+        else:
+            return set(member_parser.parse(item) for item in data)  # type: ignore[union-attr]
+
+    def try_parse(self, data: JsonType) -> Any:
+        if not isinstance(data, list):
+            return FAILURE
+
+        member_parser = self.member_parser
+        members = set(member_parser.try_parse(item) for item in data)
+        return FAILURE if FAILURE in members else members
+
+
 class TupleDeserializer(RecursiveDeserializer[tuple[Any, ...]]):
     "Recursively de-serializes a JSON list into a Python `tuple`."
 
@@ -377,53 +590,175 @@ class TupleDeserializer(RecursiveDeserializer[tuple[Any, ...]]):
     def build(self, context: Optional[ModuleType]) -> None:
         self.item_parsers = tuple(self.get_deserializer(item_type, context) for item_type in self.item_types)
 
-    @property
+    @functools.cached_property
     def container_type(self) -> str:
         type_names = ", ".join(python_type_to_str(item_type) for item_type in self.item_types)
         return f"tuple[{type_names}]"
 
+    def get_json_types(self) -> frozenset[type]:
+        return _ARRAY_TYPES
+
     def parse(self, data: JsonType) -> tuple[Any, ...]:
         if not isinstance(data, list) or len(data) != len(self.item_parsers):
             if not isinstance(data, list):
                 raise JsonTypeError(
-                    f"type `{self.container_type}` expects JSON `array` data but instead received: {data}"
+                    "type `{}` expects JSON `array` data but instead received: {}", self.container_type, data
                 )
             else:
-                count = len(self.item_parsers)
                 raise JsonValueError(
-                    f"type `{self.container_type}` expects a JSON `array` of length {count} "
-                    f"but received length {len(data)}"
+                    "type `{}` expects a JSON `array` of length {} but received length {}",
+                    self.container_type,
+                    len(self.item_parsers),
+                    len(data),
                 )
 
         return tuple(item_parser.parse(item) for item_parser, item in zip(self.item_parsers, data))
 
 
 class UnionDeserializer(RecursiveDeserializer):
-    "De-serializes a JSON value (of any type) into a Python union type."
+    """
+    De-serializes a JSON value (of any type) into a Python union type.
+
+    Member types are tried in the order of declaration. Only members whose parser is compatible with the type of the
+    JSON value (e.g. JSON `string` or JSON `object`) are tried, which avoids raising and discarding exceptions for
+    members that cannot possibly match.
+    """
 
     member_types: tuple[type, ...]
     member_parsers: tuple[Deserializer, ...]
+    dispatch_table: dict[type, tuple[Deserializer, ...]]
 
     def __init__(self, member_types: tuple[type, ...], options: DeserializerOptions) -> None:
         super().__init__(options)
         self.member_types = member_types
 
     def build(self, context: Optional[ModuleType]) -> None:
-        self.member_parsers = tuple(self.get_deserializer(member_type, context) for member_type in self.member_types)
+        self.member_parsers = _get_member_deserializers(self.member_types, self.projection, context, self.options)
+
+        member_json_types = [member_parser.get_json_types() for member_parser in self.member_parsers]
+        self.dispatch_table = {
+            json_type: tuple(
+                member_parser
+                for member_parser, json_types in zip(self.member_parsers, member_json_types)
+                if json_types is None or json_type in json_types
+            )
+            for json_type in _JSON_TYPES
+        }
 
-    def parse(self, data: JsonType) -> Any:
-        for member_parser in self.member_parsers:
+    def get_json_types(self) -> Optional[frozenset[type]]:
+        # member parsers are not yet available when a recursive type refers to the union being built
+        member_parsers: Optional[tuple[Deserializer, ...]] = getattr(self, "member_parsers", None)
+        if member_parsers is None:
+            return None
+
+        json_types: set[type] = set()
+        for member_parser in member_parsers:
+            member_json_types = member_parser.get_json_types()
+            if member_json_types is None:
+                return None
+            json_types.update(member_json_types)
+        return frozenset(json_types)
+
+    def try_parse(self, data: JsonType) -> Any:
+        # values of an unexpected type (not produced by `json.loads`) are passed to all members
+        member_parsers = self.dispatch_table.get(type(data), self.member_parsers)
+        for member_parser in member_parsers:
             # iterate over potential types of discriminated union
             try:
-                return member_parser.parse(data)
+                value = member_parser.try_parse(data)
             except (JsonKeyError, JsonTypeError):
                 # indicates a required field is missing from JSON dict
                 # -OR-
                 # the data cannot be cast to the expected type, i.e. we don't have the type that we are looking for
                 continue
 
+            if value is not FAILURE:
+                return value
+
+        return FAILURE
+
+    def parse(self, data: JsonType) -> Any:
+        value = self.try_parse(data)
+        if value is FAILURE:
+            raise self.no_match_error(data)
+        return value
+
+    @functools.cached_property
+    def union_type(self) -> str:
         type_names = ", ".join(python_type_to_str(member_type) for member_type in self.member_types)
-        raise JsonKeyError(f"type `Union[{type_names}]` could not be instantiated from: {data}")
+        return f"Union[{type_names}]"
+
+    def no_match_error(self, data: JsonType) -> JsonKeyError:
+        return JsonKeyError("type `{}` could not be instantiated from: {}", self.union_type, data)
+
+
+class AdaptiveUnionDeserializer(UnionDeserializer):
+    """
+    De-serializes a JSON value into a Python union type, trying the member type that matches most frequently first.
+
+    The de-serializer counts how many times each member type has matched, and periodically re-orders the members
+    that are compatible with the same type of JSON value (e.g. several data classes parsed from a JSON `object`).
+
+    The result is independent of member order only if no JSON value can be parsed into more than one member type
+    (e.g. data classes with disjoint required fields, without `skip_unassigned`). Otherwise, the member type that a
+    JSON value is parsed into depends on past input. De-serializers are cached, so statistics are shared by all
+    parsers of the same union type with the same options.
+
+    :param hit_counts: Number of successful matches for each member type, in the order of declaration.
+    """
+
+    reorder_interval: int = 1000
+    "Number of values to parse before member types are re-ordered."
+
+    hit_counts: list[int]
+    parse_count: int
+    member_table: dict[type, tuple[tuple[int, Deserializer], ...]]
+
+    def build(self, context: Optional[ModuleType]) -> None:
+        super().build(context)
+        self.hit_counts = [0] * len(self.member_parsers)
+        self.parse_count = 0
+
+        indices = {member_parser: index for index, member_parser in enumerate(self.member_parsers)}
+        self.member_table = {
+            json_type: tuple((indices[member_parser], member_parser) for member_parser in member_parsers)
+            for json_type, member_parsers in self.dispatch_table.items()
+        }
+
+    def reorder(self) -> None:
+        """
+        Sorts the member types compatible with each type of JSON value by descending number of matches.
+
+        Member types with the same number of matches are tried in the order of declaration.
+        """
+
+        hit_counts = self.hit_counts
+        self.member_table = {
+            json_type: tuple(sorted(members, key=lambda member: (-hit_counts[member[0]], member[0])))
+            for json_type, members in self.member_table.items()
+        }
+
+    def try_parse(self, data: JsonType) -> Any:
+        self.parse_count += 1
+        if self.parse_count >= self.reorder_interval:
+            self.parse_count = 0
+            self.reorder()
+
+        members = self.member_table.get(type(data))
+        if members is None:
+            return super().try_parse(data)
+
+        for index, member_parser in members:
+            try:
+                value = member_parser.try_parse(data)
+            except (JsonKeyError, JsonTypeError):
+                continue
+
+            if value is not FAILURE:
+                self.hit_counts[index] += 1
+                return value
+
+        return FAILURE
 
 
 def get_literal_properties(typ: type) -> set[str]:
@@ -447,63 +782,236 @@ def get_discriminating_properties(types: tuple[type, ...]) -> set[str]:
     return props
 
 
+class TaggedMemberDeserializer(Deserializer):
+    "De-serializes a member of a tagged union whose type does not declare the discriminator property."
+
+    parser: Deserializer
+    property_name: str
+
+    def __init__(self, parser: Deserializer, property_name: str) -> None:
+        self.parser = parser
+        self.property_name = property_name
+
+    def get_json_types(self) -> Optional[frozenset[type]]:
+        return self.parser.get_json_types()
+
+    def parse(self, data: JsonType) -> Any:
+        property_name = self.property_name
+        return self.parser.parse({key: value for key, value in data.items() if key != property_name})  # type: ignore[union-attr]
+
+
 class TaggedUnionDeserializer(RecursiveDeserializer):
-    "De-serializes a JSON value with one or more disambiguating properties into a Python union type."
+    """
+    De-serializes a JSON value with one or more disambiguating properties into a Python union type.
 
-    member_types: tuple[type, ...]
-    disambiguating_properties: set[str]
-    member_parsers: dict[tuple[str, Any], Deserializer]
+    The disambiguating property with the most distinct values is chosen as the primary discriminator, and is looked up
+    first. The remaining disambiguating properties are checked in alphabetical order if the primary discriminator is
+    missing from the JSON object.
+    """
+
+    member_types: tuple[TypeLike, ...]
+    discriminator: Optional[str]
+    disambiguating_properties: tuple[str, ...]
+    primary_property: str
+    primary_parsers: dict[Any, Deserializer]
+    fallback_parsers: tuple[tuple[str, dict[Any, Deserializer]], ...]
+
+    def __init__(
+        self, member_types: tuple[TypeLike, ...], options: DeserializerOptions, discriminator: Optional[str] = None
+    ) -> None:
+        """
+        Creates a de-serializer for a tagged union type.
+
+        :param member_types: Member types of the union.
+        :param options: Options that control de-serialization.
+        :param discriminator: JSON property name declared explicitly with the annotation `Discriminator`.
+        """
 
-    def __init__(self, member_types: tuple[type, ...], options: DeserializerOptions) -> None:
         super().__init__(options)
         self.member_types = member_types
-        self.disambiguating_properties = get_discriminating_properties(member_types)
+        self.discriminator = discriminator
 
     def build(self, context: Optional[ModuleType]) -> None:
-        self.member_parsers = {}
-        for member_type in self.member_types:
-            for property_name in self.disambiguating_properties:
-                literal_type = get_class_property(member_type, property_name)
-                if not literal_type:
-                    continue
+        parsers = _get_member_deserializers(self.member_types, self.projection, context, self.options)
+        tables: dict[str, dict[Any, Deserializer]] = {}
+        if self.discriminator is not None:
+            tables[self.discriminator] = self._build_declared(self.discriminator, parsers)
+        else:
+            # literal properties common across all members imply that all members are class types
+            member_types = typing.cast(tuple[type, ...], self.member_types)
+            for property_name in get_discriminating_properties(member_types):
+                for member_type, parser in zip(member_types, parsers):
+                    literal_type = get_class_property(member_type, property_name)
+                    if not literal_type:
+                        continue
+
+                    json_name = python_field_to_json_property(property_name, literal_type)
+                    member_parsers = tables.setdefault(json_name, {})
+                    for literal_value in unwrap_literal_values(literal_type):
+                        self._add_member(member_parsers, json_name, literal_value, parser)
+
+        # prefer the property that tells apart the most member types, break ties by name for a deterministic order
+        self.disambiguating_properties = tuple(sorted(tables, key=lambda name: (-len(tables[name]), name)))
+        self.primary_property, *fallback_properties = self.disambiguating_properties
+        self.primary_parsers = tables[self.primary_property]
+        self.fallback_parsers = tuple((name, tables[name]) for name in fallback_properties)
+
+    def _build_declared(self, property_name: str, parsers: tuple[Deserializer, ...]) -> dict[Any, Deserializer]:
+        "Creates a lookup table for a discriminator property declared with the annotation `Discriminator`."
+
+        member_parsers: dict[Any, Deserializer] = {}
+        for member_type, parser in zip(self.member_types, parsers):
+            property_type = get_json_property_type(unwrap_annotated_type(member_type), property_name)
+            tag = get_annotation(member_type, Tag)
+            if tag is not None:
+                values: tuple[Any, ...] = (tag.value,)
+            elif property_type is not None and is_type_literal(property_type):
+                values = unwrap_literal_values(property_type)
+            else:
+                raise TypeError(
+                    f"member type `{python_type_to_str(member_type)}` in tagged union type `{self.union_type}` "
+                    f"has neither a `Tag` annotation nor a literal type for discriminator property `{property_name}`"
+                )
 
-                for literal_value in unwrap_literal_values(literal_type):
-                    tpl = (property_name, literal_value)
-                    if tpl in self.member_parsers:
-                        raise JsonTypeError(
-                            f"disambiguating property `{property_name}` in type `{self.union_type}` "
-                            f"has a duplicate value: {literal_value}"
-                        )
+            if property_type is None:
+                # discriminator property is not part of the member type, remove it before parsing
+                parser = TaggedMemberDeserializer(parser, property_name)
+            for value in values:
+                self._add_member(member_parsers, property_name, value, parser)
 
-                    self.member_parsers[tpl] = self.get_deserializer(member_type, context)
+        return member_parsers
 
-    @property
+    def _add_member(
+        self, member_parsers: dict[Any, Deserializer], property_name: str, value: Any, parser: Deserializer
+    ) -> None:
+        if value in member_parsers:
+            raise JsonTypeError(
+                f"disambiguating property `{property_name}` in type `{self.union_type}` has a duplicate value: {value}"
+            )
+        member_parsers[value] = parser
+
+    @functools.cached_property
     def union_type(self) -> str:
         type_names = ", ".join(python_type_to_str(member_type) for member_type in self.member_types)
         return f"Union[{type_names}]"
 
+    def get_json_types(self) -> frozenset[type]:
+        return _OBJECT_TYPES
+
     def parse(self, data: JsonType) -> Any:
         if not isinstance(data, dict):
             raise JsonTypeError(
-                f"tagged union type `{self.union_type}` expects JSON `object` data but instead received: {data}"
+                "tagged union type `{}` expects JSON `object` data but instead received: {}", self.union_type, data
             )
 
-        for property_name in self.disambiguating_properties:
-            disambiguating_value = data.get(property_name)
-            if disambiguating_value is None:
-                continue
-
-            member_parser = self.member_parsers.get((property_name, disambiguating_value))
-            if member_parser is None:
+        member_parsers = self.primary_parsers
+        value = data.get(self.primary_property)
+        if value is None:
+            for property_name, fallback_parsers in self.fallback_parsers:
+                value = data.get(property_name)
+                if value is not None:
+                    member_parsers = fallback_parsers
+                    break
+            else:
                 raise JsonTypeError(
-                    f"disambiguating property value is invalid for tagged union type `{self.union_type}`: {data}"
+                    "disambiguating property value is missing for tagged union type `{}`: {}", self.union_type, data
                 )
 
-            return member_parser.parse(data)
+        try:
+            member_parser = member_parsers[value]
+        except (KeyError, TypeError):  # a `TypeError` is raised for unhashable values such as `list` or `dict`
+            raise JsonTypeError(
+                "disambiguating property value is invalid for tagged union type `{}`: {}", self.union_type, data
+            ) from None
 
-        raise JsonTypeError(
-            f"disambiguating property value is missing for tagged union type `{self.union_type}`: {data}"
-        )
+        return member_parser.parse(data)
+
+
+class MessageRegistry(Deserializer[Any]):
+    """
+    De-serializes a JSON object into one of many registered message types, e.g. requests received over a websocket.
+
+    Message types are identified by a common discriminator property with a literal type, e.g. `type: Literal["ping"]`.
+    Types may be registered at any time, typically with the class decorator `register`. Unlike a union type with
+    hundreds of member types, registering a type only updates the lookup table, and de-serializer engines are created
+    when a message of the type is first parsed.
+    """
+
+    property_name: str
+    options: DeserializerOptions
+    message_types: dict[Any, type]
+    member_parsers: dict[Any, Deserializer]
+
+    def __init__(self, property_name: str = "type", *, options: Optional[DeserializerOptions] = None) -> None:
+        """
+        Creates an empty message registry.
+
+        :param property_name: The JSON property that identifies the message type.
+        :param options: Options that control de-serialization of message types.
+        """
+
+        self.property_name = property_name
+        self.options = options if options is not None else _DEFAULT_OPTIONS
+        self.message_types = {}
+        self.member_parsers = {}
+
+    def register(self, cls: type[T]) -> type[T]:
+        """
+        Adds a message type to the registry. Can be used as a class decorator.
+
+        :param cls: A class type with a discriminator property of a literal type.
+        :returns: The class type passed in.
+        :raises TypeError: The class type has no discriminator property of a literal type, or a discriminator value is
+            already registered for another message type.
+        """
+
+        property_type = get_json_property_type(cls, self.property_name)
+        if property_type is None or not is_type_literal(property_type):
+            raise TypeError(
+                f"message type `{python_type_to_str(cls)}` expects property `{self.property_name}` with a literal type"
+            )
+
+        values = unwrap_literal_values(property_type)
+        for value in values:
+            registered_type = self.message_types.get(value)
+            if registered_type is not None and registered_type is not cls:
+                raise TypeError(
+                    f"message types `{python_type_to_str(registered_type)}` and `{python_type_to_str(cls)}` "
+                    f"share the same value for property `{self.property_name}`: {value!r}"
+                )
+
+        for value in values:
+            self.message_types[value] = cls
+        return cls
+
+    def get_json_types(self) -> frozenset[type]:
+        return _OBJECT_TYPES
+
+    def parse(self, data: JsonType) -> Any:
+        if not isinstance(data, dict):
+            raise JsonTypeError("message registry expects JSON `object` data but instead received: {}", data)
+
+        value = data.get(self.property_name)
+        try:
+            member_parser = self.member_parsers[value]
+        except (KeyError, TypeError):  # a `TypeError` is raised for unhashable values such as `list` or `dict`
+            member_parser = self._get_member_parser(value, data)
+
+        return member_parser.parse(data)
+
+    def _get_member_parser(self, value: Any, data: JsonType) -> Deserializer:
+        "Creates the de-serializer engine for a registered message type when a message of the type is first parsed."
+
+        try:
+            message_type = self.message_types[value]
+        except (KeyError, TypeError):
+            raise JsonTypeError(
+                "no message type is registered for value of property `{}`: {}", self.property_name, data
+            ) from None
+
+        member_parser = create_deserializer(message_type, options=self.options)
+        self.member_parsers[value] = member_parser
+        return member_parser
 
 
 class LiteralDeserializer(RecursiveDeserializer):
@@ -528,11 +1036,27 @@ class LiteralDeserializer(RecursiveDeserializer):
         literal_type = literal_type_set.pop()
         self.parser = self.get_deserializer(literal_type, context)
 
+    def get_json_types(self) -> Optional[frozenset[type]]:
+        literal_types = set(type(value) for value in self.values)
+        if len(literal_types) != 1:
+            return None
+        return _PRIMITIVE_JSON_TYPES.get(literal_types.pop())
+
+    @functools.cached_property
+    def literal_type(self) -> str:
+        value_names = ", ".join(repr(value) for value in self.values)
+        return f"Literal[{value_names}]"
+
+    def try_parse(self, data: JsonType) -> Any:
+        value = self.parser.try_parse(data)
+        if value is FAILURE or value not in self.values:
+            return FAILURE
+        return value
+
     def parse(self, data: JsonType) -> Any:
         value = self.parser.parse(data)
         if value not in self.values:
-            value_names = ", ".join(repr(value) for value in self.values)
-            raise JsonTypeError(f"type `Literal[{value_names}]` could not be instantiated from: {data}")
+            raise JsonTypeError("type `{}` could not be instantiated from: {}", self.literal_type, data)
         return value
 
 
@@ -544,10 +1068,56 @@ class EnumDeserializer(Deserializer[E]):
     def __init__(self, enum_type: type[E]) -> None:
         self.enum_type = enum_type
 
+    def get_json_types(self) -> Optional[frozenset[type]]:
+        value_types = enum_value_types(self.enum_type)
+        if len(value_types) != 1:
+            return None
+        return _PRIMITIVE_JSON_TYPES.get(value_types.pop())
+
     def parse(self, data: JsonType) -> E:
         return self.enum_type(data)
 
 
+class CachingDeserializer(Deserializer[T]):
+    """
+    Re-uses the objects of an immutable type that a de-serializer has created from the same JSON value.
+
+    Objects are kept in a bounded least-recently-used cache keyed by the JSON `string` or integer `number` value they
+    are parsed from, such that identical input values share a single Python object. This saves both the time to parse
+    the value and the memory of duplicate objects. Other JSON values are passed to the wrapped de-serializer as-is, and
+    values that fail to parse are not cached.
+
+    The de-serializer engine for a type is shared, e.g. call `create_deserializer(uuid.UUID, options=options)` with
+    the same options to inspect the cache statistics for UUIDs.
+    """
+
+    deserializer: Deserializer[T]
+    parse_cached: "functools._lru_cache_wrapper[T]"
+
+    def __init__(self, deserializer: Deserializer[T], maxsize: int) -> None:
+        self.deserializer = deserializer
+
+        # keep `1` and `True` apart, which compare equal
+        self.parse_cached = functools.lru_cache(maxsize=maxsize, typed=True)(deserializer.parse)
+
+    def build(self, context: Optional[ModuleType]) -> None:
+        self.deserializer.build(context)
+
+    def get_json_types(self) -> Optional[frozenset[type]]:
+        return self.deserializer.get_json_types()
+
+    def parse(self, data: JsonType) -> T:
+        if type(data) is str or type(data) is int:
+            return self.parse_cached(data)
+        else:
+            return self.deserializer.parse(data)
+
+    def cache_info(self) -> "functools._CacheInfo":
+        "Returns the number of cache hits and misses, and the maximum and current size of the cache."
+
+        return self.parse_cached.cache_info()
+
+
 class CustomDeserializer(Deserializer[T]):
     "Uses the `from_json` class method in class to de-serialize the object from JSON."
 
@@ -587,7 +1157,7 @@ class RequiredFieldDeserializer(FieldDeserializer[T, T]):
 
     def parse_field(self, data: dict[str, JsonType]) -> T:
         if self.property_name not in data:
-            raise JsonKeyError(f"missing required property `{self.property_name}` from JSON object: {data}")
+            raise JsonKeyError("missing required property `{}` from JSON object: {}", self.property_name, data)
 
         value = data[self.property_name]
         if value is None:
@@ -653,6 +1223,30 @@ class DefaultFactoryFieldDeserializer(FieldDeserializer[T, T]):
             return self.default_factory()
 
 
+class ExcludedFieldDeserializer(FieldDeserializer[T, Optional[T]]):
+    "Assigns the default value (or `None`) to a field excluded by a projection without reading the JSON property."
+
+    default_value: Optional[T]
+    default_factory: Optional[Callable[[], T]]
+
+    def __init__(
+        self,
+        property_name: str,
+        field_name: str,
+        default_value: Optional[T] = None,
+        default_factory: Optional[Callable[[], T]] = None,
+    ) -> None:
+        super().__init__(property_name, field_name, NoneDeserializer())  # type: ignore[arg-type]  # never invoked
+        self.default_value = default_value
+        self.default_factory = default_factory
+
+    def parse_field(self, data: dict[str, JsonType]) -> Optional[T]:
+        if self.default_factory is not None:
+            return self.default_factory()
+        else:
+            return self.default_value
+
+
 class ClassDeserializer(RecursiveDeserializer[T]):
     "Base class for de-serializing class-like types such as data classes, named tuples and regular classes."
 
@@ -664,22 +1258,28 @@ class ClassDeserializer(RecursiveDeserializer[T]):
         super().__init__(options)
         self.class_type = class_type
 
+    def get_json_types(self) -> frozenset[type]:
+        return _OBJECT_TYPES
+
     def assign(self, property_parsers: list[FieldDeserializer]) -> None:
         self.property_parsers = property_parsers
         self.property_fields = set(property_parser.property_name for property_parser in property_parsers)
 
+    @functools.cached_property
+    def class_name(self) -> str:
+        return python_type_to_str(self.class_type)
+
     def parse(self, data: JsonType) -> T:
         if not isinstance(data, dict):
-            type_name = python_type_to_str(self.class_type)
-            raise JsonTypeError(f"`type `{type_name}` expects JSON `object` data but instead received: {data}")
+            raise JsonTypeError("`type `{}` expects JSON `object` data but instead received: {}", self.class_name, data)
 
         field_values = {}
         for property_parser in self.property_parsers:
             field_values[property_parser.field_name] = property_parser.parse_field(data)
 
-        if not (self.options.skip_unassigned or self.property_fields.issuperset(data)):
+        if not (self.options.skip_unassigned or self.options.trusted or self.property_fields.issuperset(data)):
             unassigned_names = [name for name in data if name not in self.property_fields]
-            raise JsonKeyError(f"unrecognized fields in JSON object: {unassigned_names}")
+            raise JsonKeyError("unrecognized fields in JSON object: {}", unassigned_names)
 
         return self.create(**field_values)
 
@@ -715,6 +1315,9 @@ class NamedTupleDeserializer(ClassDeserializer[NamedTuple]):
 class DataclassDeserializer(ClassDeserializer[T]):
     "De-serializes a data class from a JSON `object`."
 
+    function: Callable[[JsonType], T]
+    probe_function: Callable[[JsonType], Any]
+
     def __init__(self, class_type: type[T], options: DeserializerOptions) -> None:
         if not dataclasses.is_dataclass(class_type):
             raise TypeError("expected: data-class type")
@@ -723,6 +1326,7 @@ class DataclassDeserializer(ClassDeserializer[T]):
     def build(self, context: Optional[ModuleType]) -> None:
         property_parsers: list[FieldDeserializer] = []
         resolved_hints = get_resolved_hints(self.class_type)
+        projection = dict(self.projection)
         for field in dataclasses.fields(self.class_type):
             field_type = resolved_hints[field.name]
             property_name = python_field_to_json_property(field.name, field_type)
@@ -736,7 +1340,27 @@ class DataclassDeserializer(ClassDeserializer[T]):
             else:
                 required_type = field_type
 
-            parser = self.get_deserializer(required_type, context)
+            if self.projection:
+                # skip creating de-serializers for the subtree of properties not included in the projection
+                if property_name not in projection:
+                    if has_default_factory:
+                        excluded_parser: FieldDeserializer = ExcludedFieldDeserializer(
+                            property_name,
+                            field.name,
+                            default_factory=typing.cast(Callable[[], Any], field.default_factory),
+                        )
+                    else:
+                        excluded_parser = ExcludedFieldDeserializer(
+                            property_name, field.name, field.default if has_default else None
+                        )
+                    property_parsers.append(excluded_parser)
+                    continue
+
+                parser = _get_projected_deserializer(
+                    required_type, projection.pop(property_name), context, self.options
+                )
+            else:
+                parser = self.get_deserializer(required_type, context)
 
             if has_default:
                 field_parser: FieldDeserializer = DefaultFieldDeserializer(
@@ -752,11 +1376,239 @@ class DataclassDeserializer(ClassDeserializer[T]):
 
             property_parsers.append(field_parser)
 
+        if projection:
+            paths = ", ".join(format_projection(tuple(projection.items())))
+            raise ValueError(f"type `{self.class_name}` has no properties that match the projection: {paths}")
+
         super().assign(property_parsers)
+        self.function = self._compile()
+        self.probe_function = self._compile(probe=True)
+
+    def try_parse(self, data: JsonType) -> Any:
+        return self.probe_function(data)
+
+    def parse(self, data: JsonType) -> T:
+        return self.function(data)
+
+    def _compile(self, probe: bool = False) -> Callable[[JsonType], T]:
+        """
+        Emits and compiles the source code of a function that de-serializes instances of the data class.
+
+        The generated function reads JSON properties with a single dictionary lookup, accepts values of a fundamental
+        type (e.g. `bool`, `int` or `str`) with an inline type check, and calls field de-serializers only for other
+        types. Unusual input (e.g. a missing required property) is delegated to the field de-serializer, which raises
+        the appropriate exception. For trusted input, the function reads required properties by direct indexing,
+        assigns values of fundamental types as-is, and skips the type check and the check for unrecognized properties.
+
+        :param probe: Whether to generate a function for `try_parse`, which returns `FAILURE` instead of raising an
+            exception when the JSON value is not an object, a required property is missing or there are unrecognized
+            properties.
+        """
+
+        # skip checks for well-formed input but keep them in probe functions, which tell apart member types of unions
+        trusted = self.options.trusted and not probe
+
+        namespace: dict[str, Any] = {
+            "fallback": super().parse,
+            "class_type": self.class_type,
+            "new_object": self.class_type.__new__ if issubclass(self.class_type, Exception) else object.__new__,
+            "property_fields": frozenset(self.property_fields),
+            "JsonKeyError": JsonKeyError,
+            "FAILURE": FAILURE,
+        }
+        lines = ["def parse(data):"]
+        if not trusted:
+            lines.extend(
+                [
+                    "    if not isinstance(data, dict):",
+                    "        return FAILURE" if probe else "        return fallback(data)",
+                ]
+            )
+
+        field_values: list[tuple[str, str]] = []
+        for index, property_parser in enumerate(self.property_parsers):
+            variable = f"value_{index}"
+            field_values.append((property_parser.field_name, variable))
+            namespace[f"field_{index}"] = property_parser
+
+            parser = property_parser.parser
+            namespace[f"parse_{index}"] = parser.parse
+            primitive_type = _PRIMITIVE_DESERIALIZERS.get(type(parser))
+            check: list[str] = []
+            if trusted and type(parser) in _IDENTITY_DESERIALIZERS:
+                # input is known to have the expected type
+                convert = "value"
+            elif probe and self.options.trusted:
+                # de-serializers for trusted input (including those of nested values) skip the type check in `parse`
+                # but not in `try_parse`
+                namespace[f"try_parse_{index}"] = parser.try_parse
+                convert = f"try_parse_{index}(value)"
+                check = [f"    if {variable} is FAILURE:", "        return FAILURE"]
+            elif primitive_type is not None:
+                # skip call to a de-serializer that would return its input unchanged
+                convert = f"value if type(value) is {primitive_type.__name__} else parse_{index}(value)"
+            else:
+                convert = f"parse_{index}(value)"
+
+            field_parser_type = type(property_parser)
+            if field_parser_type is ExcludedFieldDeserializer:
+                # field is not included in a projection, the JSON property is not read
+                excluded_parser = typing.cast(ExcludedFieldDeserializer, property_parser)
+                if excluded_parser.default_factory is not None:
+                    namespace[f"default_factory_{index}"] = excluded_parser.default_factory
+                    lines.append(f"    {variable} = default_factory_{index}()")
+                else:
+                    namespace[f"default_{index}"] = excluded_parser.default_value
+                    lines.append(f"    {variable} = default_{index}")
+                continue
+            elif field_parser_type is RequiredFieldDeserializer and trusted:
+                lines.extend(
+                    [
+                        f"    value = data[{property_parser.property_name!r}]",
+                        f"    {variable} = {convert}",
+                    ]
+                )
+                continue
+            elif field_parser_type is RequiredFieldDeserializer and probe:
+                lines.extend(
+                    [
+                        f"    value = data.get({property_parser.property_name!r})",
+                        "    if value is None:",
+                        f"        if {property_parser.property_name!r} not in data:",
+                        "            return FAILURE",
+                        f"        {variable} = field_{index}.parse_field(data)",
+                        "    else:",
+                        f"        {variable} = {convert}",
+                        *check,
+                    ]
+                )
+                continue
+            elif field_parser_type is RequiredFieldDeserializer:
+                missing = f"field_{index}.parse_field(data)"
+            elif field_parser_type is OptionalFieldDeserializer:
+                missing = "None"
+            elif field_parser_type is DefaultFieldDeserializer:
+                namespace[f"default_{index}"] = typing.cast(DefaultFieldDeserializer, property_parser).default_value
+                missing = f"default_{index}"
+            elif field_parser_type is DefaultFactoryFieldDeserializer:
+                factory_parser = typing.cast(DefaultFactoryFieldDeserializer, property_parser)
+                namespace[f"default_factory_{index}"] = factory_parser.default_factory
+                missing = f"default_factory_{index}()"
+            else:
+                lines.append(f"    {variable} = field_{index}.parse_field(data)")
+                continue
+
+            lines.extend(
+                [
+                    f"    value = data.get({property_parser.property_name!r})",
+                    "    if value is None:",
+                    f"        {variable} = {missing}",
+                    "    else:",
+                    f"        {variable} = {convert}",
+                    *check,
+                ]
+            )
+
+        if not (self.options.skip_unassigned or trusted):
+            lines.append("    if not property_fields.issuperset(data):")
+            if probe:
+                lines.append("        return FAILURE")
+            else:
+                lines.extend(
+                    [
+                        "        unassigned_names = [name for name in data if name not in property_fields]",
+                        '        raise JsonKeyError("unrecognized fields in JSON object: {}", unassigned_names)',
+                    ]
+                )
+
+        lines.append("    obj = new_object(class_type)")
+        lines.extend(self._compile_create("obj", field_values, namespace))
+        lines.append("    return obj")
+
+        source = "\n".join(lines)
+        kind = "probe" if probe else "deserializer"
+        exec(compile(source, f"<{kind} for {self.class_type.__qualname__}>", "exec"), namespace)
+        return typing.cast(Callable[[JsonType], T], namespace["parse"])
+
+    def _compile_create(self, obj: str, field_values: list[tuple[str, str]], namespace: dict[str, Any]) -> list[str]:
+        """
+        Emits statements that populate a newly created object, mirroring what `create` does.
+
+        :param obj: Name of the variable that holds the object instance.
+        :param field_values: Pairs of Python class field name and name of the variable that holds the field value.
+        :param namespace: Global variables of the generated function, to which the statements may add.
+        :returns: Lines of source code.
+        """
+
+        lines: list[str] = []
+        for field_name, variable in field_values:
+            if field_name.isidentifier() and not keyword.iskeyword(field_name):
+                lines.append(f"    {obj}.{field_name} = {variable}")
+            else:
+                lines.append(f"    setattr({obj}, {field_name!r}, {variable})")
+        return lines
+
+
+# types whose instances compare equal only if they hold the same data
+_EQUAL_VALUE_TYPES: frozenset[type] = frozenset(
+    [
+        type(None),
+        bool,
+        int,
+        str,
+        bytes,
+        datetime.date,
+        datetime.timedelta,
+        uuid.UUID,
+        ipaddress.IPv4Address,
+        ipaddress.IPv6Address,
+    ]
+)
+
+
+def _sharing_key(value: Any) -> Any:
+    """
+    Returns a hashable key for a field value such that only values holding the same data have the same key.
+
+    Values that compare equal may still hold different data, e.g. `1` and `1.0`, `0.0` and `-0.0`, or timestamps that
+    represent the same instant in different time zones. Values of an unknown type (e.g. a nested data class instance)
+    are compared by identity.
+    """
+
+    typ = type(value)
+    if typ in _EQUAL_VALUE_TYPES:
+        return typ, value
+    elif typ is float:
+        return typ, value, math.copysign(1.0, value)
+    elif typ is datetime.datetime or typ is datetime.time:
+        return typ, value, value.tzinfo, value.fold
+    elif typ is tuple:
+        return typ, tuple(_sharing_key(item) for item in value)
+    else:
+        # the key holds a reference to the value, thus the identity of the value is not re-used while the key exists
+        return id(value), value
 
 
 class FrozenDataclassDeserializer(DataclassDeserializer[T]):
-    "De-serializes a frozen data class from a JSON `object`."
+    """
+    De-serializes a frozen data class from a JSON `object`.
+
+    With the option `frozen_cache_size`, instances whose field values hold the same data share a single canonical
+    instance, e.g. a value object such as a currency or a location that recurs in a document. Field values that compare
+    equal but hold different data (e.g. `0.0` and `-0.0`, or timestamps in different time zones) are told apart, and
+    nested objects are compared by identity, which is why nested frozen data classes are shared first. Shared
+    instances are kept in a table of weak references, such that the table does not keep instances alive, and the table
+    is emptied when it reaches its maximum size. Instances are shared only if the data class generates `__eq__` and
+    supports weak references, and if all field values are hashable.
+    """
+
+    shared_instances: Optional["weakref.WeakValueDictionary[tuple, T]"] = None
+
+    def build(self, context: Optional[ModuleType]) -> None:
+        dataclass_params = self.class_type.__dataclass_params__  # type: ignore[attr-defined]
+        if self.options.frozen_cache_size > 0 and dataclass_params.eq and hasattr(self.class_type, "__weakref__"):
+            self.shared_instances = weakref.WeakValueDictionary()
+        super().build(context)
 
     def create(self, **field_values: Any) -> T:
         "Instantiates an object with a collection of property values."
@@ -768,6 +1620,233 @@ class FrozenDataclassDeserializer(DataclassDeserializer[T]):
         obj.__init__(**field_values)  # type: ignore
         return obj
 
+    def _compile_create(self, obj: str, field_values: list[tuple[str, str]], namespace: dict[str, Any]) -> list[str]:
+        arguments = ", ".join(f"{field_name}={variable}" for field_name, variable in field_values)
+        init = f"    {obj}.__init__({arguments})"
+
+        # field values of a container type are never hashable
+        if self.shared_instances is None or any(
+            isinstance(property_parser.parser, _UNHASHABLE_DESERIALIZERS) for property_parser in self.property_parsers
+        ):
+            return [init]
+
+        namespace["shared_instances"] = self.shared_instances
+        namespace["max_shared_instances"] = self.options.frozen_cache_size
+        namespace["sharing_key"] = _sharing_key
+
+        key_items: list[str] = []
+        for property_parser, (_, variable) in zip(self.property_parsers, field_values):
+            parser_type = type(property_parser.parser)
+            if (
+                type(property_parser) in (RequiredFieldDeserializer, OptionalFieldDeserializer)
+                and (parser_type in _PRIMITIVE_DESERIALIZERS or parser_type in _TRUSTED_DESERIALIZERS.values())
+                and not issubclass(parser_type, FloatDeserializer)
+            ):
+                # value is either `None` or a `bool`, `int` or `str` of the exact type the de-serializer produces
+                key_items.append(variable)
+            else:
+                key_items.append(f"sharing_key({variable})")
+
+        return [
+            f"    key = ({', '.join(key_items)},)",
+            "    try:",
+            "        shared = shared_instances.get(key)",
+            "    except TypeError:",  # a field value is not hashable
+            "        key = shared = None",
+            "    if shared is not None:",
+            "        return shared",
+            init,
+            "    if key is not None:",
+            "        if len(shared_instances) >= max_shared_instances:",
+            "            shared_instances.clear()",
+            f"        shared_instances[key] = {obj}",
+        ]
+
+
+class LazyField:
+    "A non-data descriptor that de-serializes a field of a lazy data class instance when first accessed."
+
+    field_parser: FieldDeserializer
+
+    def __init__(self, field_parser: FieldDeserializer) -> None:
+        self.field_parser = field_parser
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+
+        # store value in instance dictionary, which takes precedence over a non-data descriptor in later look-ups
+        instance_dict = obj.__dict__
+        value = self.field_parser.parse_field(instance_dict[_LAZY_SOURCE])
+        instance_dict[self.field_parser.field_name] = value
+        return value
+
+
+# key in the instance dictionary of a lazy data class instance that holds the source JSON object
+_LAZY_SOURCE = "__lazy_source__"
+
+
+def _create_instance(class_type: type[T], field_values: dict[str, Any]) -> T:
+    "Re-creates a data class instance from field values, e.g. when a lazy data class instance is un-pickled."
+
+    obj: T = create_object(class_type)
+    obj.__dict__.update(field_values)
+    return obj
+
+
+def _create_lazy_comparison(
+    class_type: type, compare_names: tuple[str, ...], op: Callable[[Any, Any], Any]
+) -> Callable[[Any, Any], Any]:
+    "Creates a comparison method for a lazy data class that compares the fields of a data class instance as a tuple."
+
+    def compare(self: Any, other: Any) -> Any:
+        # `self` is an instance of the lazy subclass
+        if other.__class__ is not class_type and other.__class__ is not self.__class__:
+            return NotImplemented
+        return op(
+            tuple(getattr(self, name) for name in compare_names),
+            tuple(getattr(other, name) for name in compare_names),
+        )
+
+    return compare
+
+
+class LazyDataclassDeserializer(DataclassDeserializer[T]):
+    """
+    De-serializes a data class from a JSON `object` into an instance that parses nested values on first access.
+
+    Instances are of a dynamically created subclass of the data class. Fields of a class or container type (e.g. a data
+    class, `list` or `dict`) are de-serialized from the source JSON object when first accessed, and stored in the
+    instance, whereas other fields are de-serialized immediately. Instances compare equal to instances of the data
+    class with the same field values.
+
+    The source JSON object must not be modified while the instance holds a reference to it. Invalid nested values raise
+    an exception only when the field is accessed. Member types of a union are de-serialized eagerly, and so are frozen
+    data classes and data classes with `__post_init__`, which need all field values when the instance is created.
+    """
+
+    proxy_type: type
+    eager_parsers: list[FieldDeserializer]
+    required_lazy_parsers: list[FieldDeserializer]
+
+    def build(self, context: Optional[ModuleType]) -> None:
+        super().build(context)
+
+        self.eager_parsers = []
+        self.required_lazy_parsers = []
+        lazy_fields: dict[str, LazyField] = {}
+        for property_parser in self.property_parsers:
+            if isinstance(property_parser.parser, _LAZY_DESERIALIZERS):
+                lazy_fields[property_parser.field_name] = LazyField(property_parser)
+                if isinstance(property_parser, RequiredFieldDeserializer):
+                    self.required_lazy_parsers.append(property_parser)
+            else:
+                self.eager_parsers.append(property_parser)
+
+        class_type = self.class_type
+        field_names = tuple(property_parser.field_name for property_parser in self.property_parsers)
+
+        def __reduce__(self: Any) -> tuple[Any, ...]:
+            return _create_instance, (class_type, {name: getattr(self, name) for name in field_names})
+
+        namespace: dict[str, Any] = {
+            **lazy_fields,
+            "__module__": class_type.__module__,
+            "__qualname__": class_type.__qualname__,
+            "__hash__": class_type.__hash__,
+            "__reduce__": __reduce__,
+        }
+
+        # comparison methods generated by `dataclass` require both operands to be of the same class, accept instances
+        # of the data class too
+        dataclass_params = class_type.__dataclass_params__  # type: ignore[attr-defined]
+        compare_names = tuple(field.name for field in dataclasses.fields(class_type) if field.compare)
+        if dataclass_params.eq:
+            namespace["__eq__"] = _create_lazy_comparison(class_type, compare_names, operator.eq)
+        if dataclass_params.order:
+            for name, op in [
+                ("__lt__", operator.lt),
+                ("__le__", operator.le),
+                ("__gt__", operator.gt),
+                ("__ge__", operator.ge),
+            ]:
+                namespace[name] = _create_lazy_comparison(class_type, compare_names, op)
+
+        self.proxy_type = type(class_type.__name__, (class_type,), namespace)
+
+    def parse(self, data: JsonType) -> T:
+        if not isinstance(data, dict):
+            raise JsonTypeError("`type `{}` expects JSON `object` data but instead received: {}", self.class_name, data)
+
+        if not (self.options.skip_unassigned or self.options.trusted or self.property_fields.issuperset(data)):
+            unassigned_names = [name for name in data if name not in self.property_fields]
+            raise JsonKeyError("unrecognized fields in JSON object: {}", unassigned_names)
+
+        for property_parser in self.required_lazy_parsers:
+            if property_parser.property_name not in data:
+                raise JsonKeyError(
+                    "missing required property `{}` from JSON object: {}", property_parser.property_name, data
+                )
+
+        obj: T = create_object(self.proxy_type)
+        instance_dict = obj.__dict__
+        for property_parser in self.eager_parsers:
+            instance_dict[property_parser.field_name] = property_parser.parse_field(data)
+        instance_dict[_LAZY_SOURCE] = data
+        return obj
+
+
+# Python types of values produced by `json.loads`, which a de-serializer may accept
+_NULL_TYPES: frozenset[type] = frozenset([type(None)])
+_BOOLEAN_TYPES: frozenset[type] = frozenset([bool])
+_INTEGER_TYPES: frozenset[type] = frozenset([int, bool])  # `bool` is a subclass of `int`
+_NUMBER_TYPES: frozenset[type] = frozenset([float, int, bool])
+_STRING_TYPES: frozenset[type] = frozenset([str])
+_ARRAY_TYPES: frozenset[type] = frozenset([list])
+_OBJECT_TYPES: frozenset[type] = frozenset([dict])
+_JSON_TYPES: frozenset[type] = frozenset([type(None), bool, int, float, str, list, dict])
+
+# JSON value types accepted when parsing a literal or enumeration value of a Python type
+_PRIMITIVE_JSON_TYPES: dict[type, frozenset[type]] = {
+    bool: _BOOLEAN_TYPES,
+    int: _INTEGER_TYPES,
+    float: _NUMBER_TYPES,
+    str: _STRING_TYPES,
+}
+
+# de-serializers that return their input unchanged (without a type check)
+_IDENTITY_DESERIALIZERS: frozenset[type[Deserializer]] = frozenset(
+    [TrustedBoolDeserializer, TrustedIntDeserializer, TrustedStringDeserializer]
+)
+
+# de-serializers of fields that a lazy data class instance parses when first accessed
+_LAZY_DESERIALIZERS: tuple[type[Deserializer], ...] = (
+    ClassDeserializer,
+    ListDeserializer,
+    DictDeserializer,
+    SetDeserializer,
+    TupleDeserializer,
+)
+
+# de-serializers whose output is a mutable container, which cannot be part of a key that identifies a shared instance
+_UNHASHABLE_DESERIALIZERS: tuple[type[Deserializer], ...] = (ListDeserializer, DictDeserializer, SetDeserializer)
+
+# de-serializers that skip type checks for input known to be well-formed
+_TRUSTED_DESERIALIZERS: dict[type, type[Deserializer]] = {
+    bool: TrustedBoolDeserializer,
+    int: TrustedIntDeserializer,
+    float: TrustedFloatDeserializer,
+    str: TrustedStringDeserializer,
+}
+
+# de-serializers that return their input unchanged if it has the exact Python type
+_PRIMITIVE_DESERIALIZERS: dict[type[Deserializer], type] = {
+    BoolDeserializer: bool,
+    IntDeserializer: int,
+    FloatDeserializer: float,
+    StringDeserializer: str,
+}
+
 
 class TypedClassDeserializer(ClassDeserializer[T]):
     "De-serializes a class with type annotations from a JSON `object` by iterating over class properties."
@@ -800,6 +1879,7 @@ def create_deserializer(
     typ: TypeLike,
     context: Optional[ModuleType] = None,
     options: Optional[DeserializerOptions] = None,
+    include: Optional[Iterable[str]] = None,
 ) -> Deserializer:
     """
     Creates a de-serializer engine to produce a Python object from an object obtained from a JSON string.
@@ -816,7 +1896,16 @@ def create_deserializer(
     * Complex objects with properties (including data class types) are populated from dictionaries of key-value pairs
       using reflection (enumerating type annotations).
 
+    If a projection is given with `include`, only the listed properties are de-serialized (e.g. `{"header", "items.id"}`
+    for the property `id` of objects in `items`). Data class fields not included get their default value or `None`,
+    and the corresponding JSON properties (including nested values) are not visited.
+
+    :param typ: The type to produce objects of.
+    :param context: A module context for evaluating types specified as a string.
+    :param options: Options that control de-serialization.
+    :param include: Dot-separated paths of JSON properties to de-serialize, or `None` to de-serialize all properties.
     :raises TypeError: A de-serializer engine cannot be constructed for the input type.
+    :raises ValueError: The projection refers to properties that do not exist.
     """
 
     if context is None:
@@ -824,18 +1913,50 @@ def create_deserializer(
             context = sys.modules[typ.__module__]
 
     if options is None:
-        options = DeserializerOptions()
+        options = _DEFAULT_OPTIONS
+
+    if include is not None:
+        return _get_projected_deserializer(typ, parse_projection(include), context, options)
 
     return _get_deserializer(typ, context, options)
 
 
-_CACHE: dict[tuple[str, str], Deserializer] = {}
+_DEFAULT_OPTIONS = DeserializerOptions()
+
+# de-serializer engines keyed by options and type (or special form) in the context of a module
+_CACHE: dict[tuple[DeserializerOptions, tuple[Optional[str], Any]], Deserializer] = {}
+
+
+def _get_type_key(typ: object) -> object:
+    """
+    Returns a hashable key that identifies a type or a special form (e.g. `list[T]`, `Optional[T]` or `Literal[...]`).
+
+    Unlike equality of special forms (e.g. `Union[int, str] == Union[str, int]`), the key preserves the order of type
+    arguments, which is significant for de-serialization (e.g. member types of a union are tried in order).
+
+    :raises TypeError: The type has an unhashable component (e.g. metadata of an annotated type).
+    """
+
+    origin_type = typing.get_origin(typ)
+    if origin_type is None:
+        key = typ
+    elif origin_type is Literal:
+        # distinguish values that compare equal but have a different type (e.g. `1` and `True`)
+        key = (origin_type, tuple((type(arg), arg) for arg in typing.get_args(typ)))
+    elif is_type_annotated(typ):
+        inner_type, *metadata = typing.get_args(typ)
+        key = (origin_type, _get_type_key(inner_type), tuple(metadata))
+    else:
+        key = (origin_type, tuple(_get_type_key(arg) for arg in typing.get_args(typ)))
+
+    hash(key)
+    return key
 
 
 def _get_deserializer(typ: TypeLike, context: Optional[ModuleType], options: DeserializerOptions) -> Deserializer:
     "Creates or re-uses a de-serializer engine to parse an object obtained from a JSON string."
 
-    cache_key = None
+    cache_key: Optional[tuple[Optional[str], Any]] = None
 
     if isinstance(typ, (str, typing.ForwardRef)):
         if context is None:
@@ -850,37 +1971,187 @@ def _get_deserializer(typ: TypeLike, context: Optional[ModuleType], options: Des
 
         typ = evaluate_type(typ, context)
 
-    typ = unwrap_annotated_type(typ) if is_type_annotated(typ) else typ
+    if is_type_annotated(typ) and get_annotation(typ, Discriminator) is None and get_annotation(typ, Interned) is None:
+        typ = unwrap_annotated_type(typ)
 
     if isinstance(typ, type) and typing.get_origin(typ) is None:
         cache_key = (typ.__module__, typ.__name__)
+    elif cache_key is None:
+        # special forms may contain forward references, which are evaluated in the context module
+        try:
+            cache_key = (context.__name__ if context is not None else None, _get_type_key(typ))
+        except TypeError:
+            # special forms are not always hashable
+            pass
 
     if cache_key is not None:
-        deserializer = _CACHE.get(cache_key)
+        options_key = (options, cache_key)
+        deserializer = _CACHE.get(options_key)
         if deserializer is None:
             deserializer = _create_deserializer(typ, options)
 
             # store de-serializer immediately in cache to avoid stack overflow for recursive types
-            _CACHE[cache_key] = deserializer
+            _CACHE[options_key] = deserializer
 
             if isinstance(typ, type):
                 # use type's own module as context for evaluating member types
                 context = sys.modules[typ.__module__]
 
             # create any de-serializers this de-serializer is depending on
-            deserializer.build(context)
+            try:
+                deserializer.build(context)
+            except BaseException:
+                # avoid re-using a de-serializer that is only partially initialized
+                del _CACHE[options_key]
+                raise
     else:
-        # special forms are not always hashable, create a new de-serializer every time
+        # create a new de-serializer every time for special forms that are not hashable
         deserializer = _create_deserializer(typ, options)
         deserializer.build(context)
 
     return deserializer
 
 
+def _get_member_deserializers(
+    member_types: tuple[TypeLike, ...],
+    projection: Projection,
+    context: Optional[ModuleType],
+    options: DeserializerOptions,
+) -> tuple[Deserializer, ...]:
+    """
+    Creates or re-uses de-serializer engines for the member types of a union.
+
+    The projection is passed on to member types that can apply it. Other member types (e.g. `None`, a primitive type, or
+    a class that lacks some of the properties) are de-serialized in full.
+
+    :raises ValueError: None of the member types can apply the projection.
+    """
+
+    if not projection:
+        return tuple(_get_deserializer(member_type, context, options) for member_type in member_types)
+
+    parsers: list[Deserializer] = []
+    projected = False
+    for member_type in member_types:
+        try:
+            parser = _get_projected_deserializer(member_type, projection, context, options)
+            projected = True
+        except ValueError:
+            parser = _get_deserializer(member_type, context, options)
+        parsers.append(parser)
+
+    if not projected:
+        type_names = ", ".join(python_type_to_str(member_type) for member_type in member_types)
+        paths = ", ".join(format_projection(projection))
+        raise ValueError(f"projection cannot be applied to any member type of `Union[{type_names}]`: {paths}")
+
+    return tuple(parsers)
+
+
+# de-serializers that apply a projection to their fields, or pass it on to their items or member types
+_PROJECTED_DESERIALIZERS: tuple[type[RecursiveDeserializer], ...] = (
+    DataclassDeserializer,
+    ListDeserializer,
+    DictDeserializer,
+    SetDeserializer,
+    UnionDeserializer,
+    TaggedUnionDeserializer,
+)
+
+# de-serializer engines keyed by options, type (or special form) in the context of a module, and projection
+_PROJECTED_CACHE: dict[tuple[DeserializerOptions, Optional[str], object, Projection], Deserializer] = {}
+
+
+def _get_projected_deserializer(
+    typ: TypeLike, projection: Projection, context: Optional[ModuleType], options: DeserializerOptions
+) -> Deserializer:
+    "Creates or re-uses a de-serializer engine that parses only the properties included in a projection."
+
+    if not projection:
+        return _get_deserializer(typ, context, options)
+
+    if isinstance(typ, (str, typing.ForwardRef)):
+        if context is None:
+            raise TypeError(f"missing context for evaluating type: {typ}")
+        typ = evaluate_type(typ, context)
+
+    if is_type_annotated(typ) and get_annotation(typ, Discriminator) is None:
+        typ = unwrap_annotated_type(typ)
+
+    cache_key: Optional[tuple[DeserializerOptions, Optional[str], object, Projection]]
+    try:
+        cache_key = (options, context.__name__ if context is not None else None, _get_type_key(typ), projection)
+    except TypeError:
+        # special forms are not always hashable, create a new de-serializer every time
+        cache_key = None
+
+    if cache_key is not None:
+        deserializer = _PROJECTED_CACHE.get(cache_key)
+        if deserializer is not None:
+            return deserializer
+
+    deserializer = _create_deserializer(typ, options)
+    if not isinstance(deserializer, _PROJECTED_DESERIALIZERS):
+        paths = ", ".join(format_projection(projection))
+        raise ValueError(f"projection cannot be applied to type `{python_type_to_str(typ)}`: {paths}")
+
+    deserializer.projection = projection
+
+    if isinstance(typ, type):
+        context = sys.modules[typ.__module__]
+
+    if cache_key is None:
+        deserializer.build(context)
+        return deserializer
+
+    # store de-serializer immediately in cache to avoid stack overflow for recursive types
+    _PROJECTED_CACHE[cache_key] = deserializer
+
+    try:
+        deserializer.build(context)
+    except BaseException:
+        del _PROJECTED_CACHE[cache_key]
+        raise
+
+    return deserializer
+
+
+# immutable types whose instances are typically parsed from a JSON `string`, and recur in input data
+_CACHED_VALUE_TYPES: frozenset[type] = frozenset(
+    [
+        datetime.datetime,
+        datetime.date,
+        datetime.time,
+        datetime.timedelta,
+        uuid.UUID,
+        ipaddress.IPv4Address,
+        ipaddress.IPv6Address,
+    ]
+)
+
+
+def _is_cached_value_type(typ: TypeLike) -> bool:
+    "True if the type has immutable instances that `CachingDeserializer` may share."
+
+    if not isinstance(typ, type):
+        return False
+    return typ in _CACHED_VALUE_TYPES or issubclass(typ, enum.Enum)
+
+
 def _create_deserializer(typ: TypeLike, options: DeserializerOptions) -> Deserializer:
     "Creates a de-serializer engine to parse an object obtained from a JSON string."
 
+    if options.value_cache_size > 0 and _is_cached_value_type(typ):
+        return CachingDeserializer(
+            _create_deserializer(typ, dataclasses.replace(options, value_cache_size=0)), options.value_cache_size
+        )
+
     # check for well-known types
+    if options.trusted and isinstance(typ, type):
+        trusted_type = _TRUSTED_DESERIALIZERS.get(typ)
+        if trusted_type is not None:
+            return trusted_type()
+
     if typ is type(None):
         return NoneDeserializer()
     elif typ is bool:
@@ -918,10 +2189,30 @@ def _create_deserializer(typ: TypeLike, options: DeserializerOptions) -> Deseria
     if typ is tuple:
         raise TypeError("explicit item type list required: use `tuple[T, ...]` instead of `tuple`")
 
+    # strings that are interned
+    if is_type_annotated(typ) and get_annotation(typ, Interned) is not None:
+        string_type = unwrap_annotated_type(typ)
+        if string_type is not str:
+            raise TypeError(f"annotation `Interned` expects type `str` but got: {python_type_to_str(string_type)}")
+        return InternedStringDeserializer()
+
+    # union types with an explicitly declared discriminator property
+    if is_type_annotated(typ):
+        discriminator = get_annotation(typ, Discriminator)
+        if discriminator is not None:
+            union_type = unwrap_annotated_type(typ)
+            if not is_type_union(union_type):
+                raise TypeError(
+                    f"annotation `Discriminator` expects a union type but got: {python_type_to_str(union_type)}"
+                )
+            return TaggedUnionDeserializer(typing.get_args(union_type), options, discriminator.property_name)
+
     if sys.version_info >= (3, 10) and isinstance(typ, types.UnionType):
         union_args = typing.get_args(typ)
         if get_discriminating_properties(union_args):
             return TaggedUnionDeserializer(union_args, options)
+        elif options.adaptive_union:
+            return AdaptiveUnionDeserializer(union_args, options)
         else:
             return UnionDeserializer(union_args, options)
 
@@ -929,12 +2220,18 @@ def _create_deserializer(typ: TypeLike, options: DeserializerOptions) -> Deseria
     origin_type = typing.get_origin(typ)
     if origin_type is list:
         (list_item_type,) = typing.get_args(typ)  # unpack single tuple element
+        if options.trusted:
+            return TrustedListDeserializer(list_item_type, options)
         return ListDeserializer(list_item_type, options)
     elif origin_type is dict:
         key_type, value_type = typing.get_args(typ)
+        if options.trusted:
+            return TrustedDictDeserializer(key_type, value_type, options)
         return DictDeserializer(key_type, value_type, options)
     elif origin_type is set:
         (set_member_type,) = typing.get_args(typ)  # unpack single tuple element
+        if options.trusted:
+            return TrustedSetDeserializer(set_member_type, options)
         return SetDeserializer(set_member_type, options)
     elif origin_type is tuple:
         return TupleDeserializer(typing.get_args(typ), options)
@@ -942,6 +2239,8 @@ def _create_deserializer(typ: TypeLike, options: DeserializerOptions) -> Deseria
         union_args = typing.get_args(typ)
         if get_discriminating_properties(union_args):
             return TaggedUnionDeserializer(union_args, options)
+        elif options.adaptive_union:
+            return AdaptiveUnionDeserializer(union_args, options)
         else:
             return UnionDeserializer(union_args, options)
     elif origin_type is Literal:
@@ -966,7 +2265,11 @@ def _create_deserializer(typ: TypeLike, options: DeserializerOptions) -> Deseria
 
     if is_dataclass_type(typ):
         dataclass_params = getattr(typ, "__dataclass_params__", None)
-        if dataclass_params is not None and dataclass_params.frozen:
+        is_frozen = dataclass_params is not None and dataclass_params.frozen
+        if options.lazy and not is_frozen and not hasattr(typ, "__post_init__") and "__slots__" not in typ.__dict__:
+            # frozen data classes (instantiated with `__init__`) and `__post_init__` need all field values up front
+            return LazyDataclassDeserializer(typ, options)
+        elif is_frozen:
             return FrozenDataclassDeserializer(typ, options)
         else:
             return DataclassDeserializer(typ, options)
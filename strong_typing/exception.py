@@ -4,14 +4,37 @@ Type-safe data interchange for Python data classes.
 :see: https://github.com/hunyadi/strong_typing
 """
 
+from typing import Any
 
-class JsonKeyError(Exception):
+
+class JsonError(Exception):
+    """
+    Base class for errors raised during (de)serialization.
+
+    An exception may be raised with a message template and arguments, e.g.
+    `JsonTypeError("type `{}` expects JSON `object` data but instead received: {}", type_name, data)`. The message is
+    formatted only when the exception is converted to a string, which avoids formatting (potentially large) input data
+    when the exception is caught and discarded, e.g. when trying member types of a union.
+    """
+
+    def __init__(self, message: str, *params: Any) -> None:
+        super().__init__(message, *params)
+
+    def __str__(self) -> str:
+        message, *params = self.args
+        if params:
+            return str(message).format(*params)
+        else:
+            return str(message)
+
+
+class JsonKeyError(JsonError):
     "Raised when deserialization for a class or union type has failed because a matching member was not found."
 
 
-class JsonValueError(Exception):
+class JsonValueError(JsonError):
     "Raised when (de)serialization of data has failed due to invalid value."
 
 
-class JsonTypeError(Exception):
+class JsonTypeError(JsonError):
     "Raised when deserialization of data has failed due to a type mismatch."
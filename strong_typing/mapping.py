@@ -8,7 +8,7 @@ import keyword
 from typing import Optional
 
 from .auxiliary import Alias
-from .inspection import get_annotation
+from .inspection import TypeLike, get_annotation, get_class_properties
 
 
 def python_field_to_json_property(python_id: str, python_type: Optional[object] = None) -> str:
@@ -32,3 +32,15 @@ def python_field_to_json_property(python_id: str, python_type: Optional[object]
             return id
 
     return python_id
+
+
+def get_json_property_type(typ: TypeLike, property_name: str) -> Optional[TypeLike]:
+    "Looks up the annotated type of a property in a class by its JSON property name."
+
+    if not isinstance(typ, type):
+        return None
+
+    for python_id, python_type in get_class_properties(typ):
+        if python_field_to_json_property(python_id, python_type) == property_name:
+            return python_type
+    return None
@@ -0,0 +1,70 @@
+"""
+Type-safe data interchange for Python data classes.
+
+:see: https://github.com/hunyadi/strong_typing
+"""
+
+from typing import Iterable, Optional
+
+Projection = tuple[tuple[str, "Projection"], ...]
+"""
+A tree of JSON property names to select when serializing or de-serializing an object.
+
+Each node is a sorted tuple of pairs of property name and nested projection. An empty nested projection includes the
+property with all of its nested properties. The projection is hashable such that it can be part of a cache key.
+"""
+
+# property names mapped to nested nodes, or `None` for a property included with all of its nested properties
+_Node = dict[str, Optional["_Node"]]
+
+
+def parse_projection(paths: Iterable[str]) -> Projection:
+    """
+    Builds a projection tree from a collection of dot-separated property paths.
+
+    A path such as `items.id` includes the property `id` of objects nested in the property `items` (including objects
+    in a list or dictionary). A path such as `items` includes the property `items` with all of its nested properties,
+    and takes precedence over longer paths with the same prefix.
+
+    :param paths: Dot-separated paths of JSON property names, e.g. `{"header", "items.id"}`.
+    :returns: A projection tree.
+    :raises ValueError: A path is empty or has an empty component.
+    """
+
+    root: _Node = {}
+    for path in paths:
+        names = path.split(".")
+        if not all(names):
+            raise ValueError(f"invalid property path in projection: {path!r}")
+
+        node: Optional[_Node] = root
+        for name in names[:-1]:
+            if node is None:
+                break
+            if name not in node:
+                node[name] = {}
+            node = node[name]
+        else:
+            if node is not None:
+                node[names[-1]] = None
+
+    if not root:
+        raise ValueError("projection must include at least one property")
+
+    return _freeze(root)
+
+
+def _freeze(node: _Node) -> Projection:
+    return tuple((name, _freeze(child) if child is not None else ()) for name, child in sorted(node.items()))
+
+
+def format_projection(projection: Projection, prefix: str = "") -> list[str]:
+    "Returns the dot-separated property paths that make up a projection tree."
+
+    paths: list[str] = []
+    for name, child in projection:
+        if child:
+            paths.extend(format_projection(child, f"{prefix}{name}."))
+        else:
+            paths.append(f"{prefix}{name}")
+    return paths
@@ -19,7 +19,16 @@ from typing import Any, Callable, ClassVar, Literal, Optional, TypeVar, Union, o
 import jsonschema
 
 from . import docstring
-from .auxiliary import Alias, IntegerRange, MaxLength, MinLength, Precision, get_auxiliary_format
+from .auxiliary import (
+    Alias,
+    Discriminator,
+    IntegerRange,
+    MaxLength,
+    MinLength,
+    Precision,
+    Tag,
+    get_auxiliary_format,
+)
 from .core import JsonArray, JsonObject, JsonType, Schema, StrictJsonType
 from .inspection import (
     TypeLike,
@@ -218,6 +227,18 @@ class JsonSchemaGenerator:
     def _(self, arg: MaxLength) -> Schema:
         return {"maxLength": arg.value}
 
+    def _tagged_member_to_schema(self, member_type: TypeLike, property_name: str) -> Schema:
+        "Returns the schema of a tagged union member, adding the discriminator property if the member lacks it."
+
+        schema = self.type_to_schema(member_type)
+        tag = get_annotation(member_type, Tag)
+        properties = schema.get("properties")
+        if tag is not None and isinstance(properties, dict) and property_name not in properties:
+            required = schema.get("required")
+            schema["properties"] = {property_name: {"const": tag.value}, **properties}
+            schema["required"] = [property_name, *(required if isinstance(required, list) else [])]
+        return schema
+
     def _with_metadata(self, type_schema: Schema, metadata: Optional[tuple[Any, ...]]) -> Schema:
         if metadata:
             for m in metadata:
@@ -369,6 +390,14 @@ class JsonSchemaGenerator:
                 return enum_schema
 
         if is_type_union(typ):
+            discriminator = get_annotation(data_type, Discriminator)
+            if discriminator is not None:
+                return {
+                    "oneOf": [
+                        self._tagged_member_to_schema(union_type, discriminator.property_name)
+                        for union_type in unwrap_union_types(typ)
+                    ]
+                }
             return {"oneOf": [self.type_to_schema(union_type) for union_type in unwrap_union_types(typ)]}
 
         origin_type = typing.get_origin(typ)
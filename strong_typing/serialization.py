@@ -4,23 +4,40 @@ Type-safe data interchange for Python data classes.
 :see: https://github.com/hunyadi/strong_typing
 """
 
+import codecs
+import concurrent.futures
+import dataclasses
+import functools
+import importlib
 import inspect
+import io
+import itertools
 import json
+import mmap
+import re
 import sys
 import typing
 from types import ModuleType
-from typing import Any, Optional, TextIO, TypeVar
+from typing import IO, Any, Callable, Generic, Iterable, Iterator, Optional, TextIO, TypeVar, Union
 
 from .core import JsonType
+from .deserializer import Deserializer, create_deserializer
 from .deserializer import DeserializerOptions as DeserializerOptions
-from .deserializer import create_deserializer
 from .inspection import TypeLike
-from .serializer import create_serializer
+from .projection import parse_projection
+from .serializer import Serializer, create_serializer, object_to_default
+from .serializer import SerializerOptions as SerializerOptions
 
 T = TypeVar("T")
 
 
-def object_to_json(obj: Any) -> JsonType:
+def object_to_json(
+    obj: Any,
+    *,
+    options: Optional[SerializerOptions] = None,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> JsonType:
     """
     Converts a Python object to a representation that can be exported to JSON.
 
@@ -31,19 +48,91 @@ def object_to_json(obj: Any) -> JsonType:
     * Enumerations are written as their value.
     * Containers (e.g. `list`, `dict`, `set`, `tuple`) are exported recursively.
     * Objects with properties (including data class types) are converted to a dictionaries of key-value pairs.
+
+    :param obj: The object to serialize.
+    :param options: Configures how the serializer generates output.
+    :param include: Dot-separated paths of JSON properties to write, e.g. `{"id", "items.name"}`; all by default.
+    :param exclude: Dot-separated paths of JSON properties not to write.
+    :raises ValueError: A property path in the projection does not match a property of the object type.
     """
 
     typ: type = type(obj)
-    generator = create_serializer(typ)
+    generator = create_serializer(typ, options=_get_projected_options(options, include, exclude))
     return generator.generate(obj)
 
 
+def object_to_json_string(
+    obj: Any,
+    *,
+    options: Optional[SerializerOptions] = None,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> str:
+    """
+    Converts a Python object to a JSON string with a compact representation.
+
+    Produces the same output as `json_dump_string(object_to_json(obj))` but writes JSON text directly, without
+    building an intermediate representation of `dict`, `list` and primitive values. Parameters `include` and
+    `exclude` have the same meaning as for `object_to_json`.
+    """
+
+    typ: type = type(obj)
+    generator = create_serializer(typ, options=_get_projected_options(options, include, exclude))
+    fragments: list[str] = []
+    generator.encode(obj, fragments)
+    return "".join(fragments)
+
+
+def _get_projected_options(
+    options: Optional[SerializerOptions], include: Optional[Iterable[str]], exclude: Optional[Iterable[str]]
+) -> Optional[SerializerOptions]:
+    "Adds the projection trees parsed from property paths to the serializer options."
+
+    if include is None and exclude is None:
+        return options
+
+    return _create_projected_options(
+        options,
+        tuple(include) if include is not None else None,
+        tuple(exclude) if exclude is not None else None,
+    )
+
+
+# the same selection is typically requested over and over, skip parsing paths and look up the cached serializer
+@functools.lru_cache(maxsize=256)
+def _create_projected_options(
+    options: Optional[SerializerOptions], include: Optional[tuple[str, ...]], exclude: Optional[tuple[str, ...]]
+) -> SerializerOptions:
+    return dataclasses.replace(
+        options if options is not None else SerializerOptions(),
+        include=parse_projection(include) if include is not None else (),
+        exclude=parse_projection(exclude) if exclude is not None else (),
+    )
+
+
+def object_to_json_bytes(
+    obj: Any,
+    *,
+    options: Optional[SerializerOptions] = None,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> bytes:
+    """
+    Converts a Python object to a compact JSON string encoded in UTF-8.
+
+    Parameters `include` and `exclude` have the same meaning as for `object_to_json`.
+    """
+
+    return object_to_json_string(obj, options=options, include=include, exclude=exclude).encode("utf-8")
+
+
 def json_to_object(
     typ: type[T],
     data: JsonType,
     *,
     context: Optional[ModuleType] = None,
     options: Optional[DeserializerOptions] = None,
+    include: Optional[Iterable[str]] = None,
 ) -> T:
     """
     Creates an object from a representation that has been de-serialized from JSON.
@@ -60,12 +149,17 @@ def json_to_object(
     * Complex objects with properties (including data class types) are populated from dictionaries of key-value pairs
       using reflection (enumerating type annotations).
 
+    If `include` is given, only the listed JSON properties are de-serialized, e.g. `{"header", "items.id"}` reads the
+    property `header`, and the property `id` of objects in `items`. Data class fields not included get their default
+    value or `None`.
+
     :raises TypeError: A de-serializing engine cannot be constructed for the input type.
+    :raises ValueError: The projection refers to properties that do not exist.
     :raises JsonKeyError: Deserialization for a class or union type has failed because a matching member was not found.
     :raises JsonTypeError: Deserialization for data has failed due to a type mismatch.
     """
 
-    return typing.cast(T, json_to_generic(typ, data, context=context, options=options))
+    return typing.cast(T, json_to_generic(typ, data, context=context, options=options, include=include))
 
 
 def json_to_generic(
@@ -74,6 +168,7 @@ def json_to_generic(
     *,
     context: Optional[ModuleType] = None,
     options: Optional[DeserializerOptions] = None,
+    include: Optional[Iterable[str]] = None,
 ) -> Any:
     """
     Creates an object from a representation that has been de-serialized from JSON.
@@ -84,21 +179,151 @@ def json_to_generic(
 
     # use caller context for evaluating types if no context is supplied
     if context is None:
-        this_frame = inspect.currentframe()
-        if this_frame is not None:
-            caller_frame = this_frame.f_back
-            del this_frame
-
-            if caller_frame is not None:
-                try:
-                    context = sys.modules[caller_frame.f_globals["__name__"]]
-                finally:
-                    del caller_frame
+        context = _get_caller_context()
 
-    parser = create_deserializer(typ, context, options=options)
+    parser = create_deserializer(typ, context, options=options, include=include)
     return parser.parse(data)
 
 
+def json_to_lazy(
+    typ: type[T],
+    data: JsonType,
+    *,
+    context: Optional[ModuleType] = None,
+    options: Optional[DeserializerOptions] = None,
+) -> T:
+    """
+    Creates an object from a representation that has been de-serialized from JSON, parsing nested values on demand.
+
+    Data class instances returned (including nested ones) parse fields of a class or container type (e.g. a data class,
+    `list` or `dict`) when the field is first accessed. Work done is proportional to the part of the JSON object that
+    is actually read. The JSON object must not be modified while the returned object is in use. Frozen data classes and
+    data classes with `__post_init__` are de-serialized eagerly.
+
+    :raises TypeError: A de-serializing engine cannot be constructed for the input type.
+    :raises JsonKeyError: Deserialization for a class or union type has failed because a matching member was not found.
+    :raises JsonTypeError: Deserialization for data has failed due to a type mismatch.
+    """
+
+    if context is None:
+        context = _get_caller_context()
+
+    lazy_options = dataclasses.replace(options if options is not None else DeserializerOptions(), lazy=True)
+    parser = create_deserializer(typ, context, options=lazy_options)
+    return typing.cast(T, parser.parse(data))
+
+
+def _get_caller_context() -> Optional[ModuleType]:
+    """
+    Returns the module in which the caller of the function that invokes this function is defined.
+
+    Frames of the module `typing` are skipped, e.g. when a generic class is instantiated in the subscripted form
+    `TypedParser[T](...)`, which calls `__init__` from `typing`.
+    """
+
+    this_frame = inspect.currentframe()
+    if this_frame is None:
+        return None
+
+    try:
+        function_frame = this_frame.f_back
+        caller_frame = function_frame.f_back if function_frame is not None else None
+        while caller_frame is not None and caller_frame.f_globals.get("__name__") == "typing":
+            caller_frame = caller_frame.f_back
+        if caller_frame is None:
+            return None
+
+        return sys.modules[caller_frame.f_globals["__name__"]]
+    finally:
+        del this_frame
+
+
+class TypedParser(Generic[T]):
+    """
+    Creates objects of a fixed type from representations that have been de-serialized from JSON.
+
+    The de-serializer engine (including the module context for evaluating types) is resolved once when the parser is
+    instantiated, which makes a parser suitable for processing a large number of small messages of the same type.
+    """
+
+    deserializer: Deserializer[T]
+
+    def __init__(
+        self,
+        typ: type[T],
+        *,
+        context: Optional[ModuleType] = None,
+        options: Optional[DeserializerOptions] = None,
+    ) -> None:
+        """
+        Creates a parser for a type.
+
+        :param typ: The type of objects to create.
+        :param context: A module context for evaluating types specified as a string. Defaults to the caller's module.
+        :param options: Configures how the de-serializer processes input.
+        :raises TypeError: A de-serializing engine cannot be constructed for the input type.
+        """
+
+        if context is None:
+            context = _get_caller_context()
+
+        self.deserializer = create_deserializer(typ, context, options=options)
+
+    def parse(self, data: JsonType) -> T:
+        "Creates an object from a representation that has been de-serialized from JSON."
+
+        return self.deserializer.parse(data)
+
+    def parse_many(self, items: Iterable[JsonType]) -> list[T]:
+        "Creates a list of objects from representations that have been de-serialized from JSON."
+
+        parse = self.deserializer.parse
+        return [parse(item) for item in items]
+
+
+class TypedWriter(Generic[T]):
+    """
+    Converts objects of a fixed type to a representation that can be exported to JSON.
+
+    The serializer engine is resolved once when the writer is instantiated. Unlike `object_to_json`, which looks up
+    the serializer engine based on the run-time type of each object, a writer always uses the type it is created with.
+    """
+
+    serializer: Serializer[T]
+
+    def __init__(
+        self,
+        typ: type[T],
+        *,
+        context: Optional[ModuleType] = None,
+        options: Optional[SerializerOptions] = None,
+    ) -> None:
+        """
+        Creates a writer for a type.
+
+        :param typ: The type of objects to convert.
+        :param context: A module context for evaluating types specified as a string. Defaults to the caller's module.
+        :param options: Configures how the serializer generates output.
+        :raises TypeError: A serializer engine cannot be constructed for the input type.
+        """
+
+        if context is None:
+            context = _get_caller_context()
+
+        self.serializer = create_serializer(typ, context, options=options)
+
+    def write(self, obj: T) -> JsonType:
+        "Converts an object to a representation that can be exported to JSON."
+
+        return self.serializer.generate(obj)
+
+    def write_many(self, objs: Iterable[T]) -> list[JsonType]:
+        "Converts a collection of objects to a list of representations that can be exported to JSON."
+
+        generate = self.serializer.generate
+        return [generate(obj) for obj in objs]
+
+
 def json_dump_string(json_object: JsonType) -> str:
     "Dump an object as a JSON string with a compact representation."
 
@@ -114,3 +339,409 @@ def json_dump(json_object: JsonType, file: TextIO) -> None:
         separators=(",", ":"),
     )
     file.write("\n")
+
+
+def object_dump_string(obj: Any) -> str:
+    """
+    Converts a Python object to a JSON string with a compact representation.
+
+    Produces the same output as `json_dump_string(object_to_json(obj))` but lets the JSON encoder in the standard
+    library traverse lists, dictionaries and values of fundamental types, which is efficient when most of the data
+    is made up of such values. Other objects (e.g. data classes, date and time types, UUIDs or enumerations) are
+    converted on demand by a serializer looked up with the object's type.
+    """
+
+    return json.dumps(
+        object_to_default(obj),
+        default=object_to_default,
+        ensure_ascii=False,
+        check_circular=False,
+        separators=(",", ":"),
+    )
+
+
+def object_dump(obj: Any, file: TextIO) -> None:
+    "Writes a Python object to a file as a JSON string with a compact representation, followed by a new line."
+
+    json.dump(
+        object_to_default(obj),
+        file,
+        default=object_to_default,
+        ensure_ascii=False,
+        check_circular=False,
+        separators=(",", ":"),
+    )
+    file.write("\n")
+
+
+_LINE_ENCODER = json.JSONEncoder(
+    default=object_to_default,
+    ensure_ascii=False,
+    check_circular=False,
+    separators=(",", ":"),
+)
+
+
+def dump_lines(objs: Iterable[Any], file: TextIO, *, chunk_size: int = 1000) -> None:
+    """
+    Writes Python objects to a file in the JSON Lines format, one compact JSON string per line.
+
+    Objects are consumed from the iterable one at a time, and output is written in chunks, so memory use does not
+    depend on the number of objects. A serializer is looked up only when the type of the object changes.
+
+    :param objs: Objects to write, typically produced by a generator.
+    :param file: A text file to write to.
+    :param chunk_size: Number of lines to collect before writing to the file.
+    """
+
+    encode = _LINE_ENCODER.encode
+    last_type: Optional[type] = None
+    serializer: Optional[Serializer[Any]] = None
+    lines: list[str] = []
+    for obj in objs:
+        typ: type = type(obj)
+        if typ is not last_type or serializer is None:
+            last_type = typ
+            serializer = create_serializer(typ)
+
+        lines.append(encode(serializer.default(obj)))
+        lines.append("\n")
+        if len(lines) >= 2 * chunk_size:
+            file.write("".join(lines))
+            lines.clear()
+
+    if lines:
+        file.write("".join(lines))
+
+
+def load_lines(
+    typ: type[T],
+    file: Iterable[str],
+    *,
+    context: Optional[ModuleType] = None,
+    options: Optional[DeserializerOptions] = None,
+) -> Iterator[T]:
+    """
+    Reads Python objects from a file in the JSON Lines format, one JSON string per line.
+
+    Objects are created lazily as the returned iterator is advanced, so memory use does not depend on the number of
+    lines. Empty lines are skipped.
+
+    :param typ: The type of objects to create.
+    :param file: A text file (or any iterable of lines) to read from.
+    :param context: A module context for evaluating types specified as a string. Defaults to the caller's module.
+    :param options: Configures how the de-serializer processes input.
+    :raises TypeError: A de-serializing engine cannot be constructed for the input type.
+    """
+
+    # resolve context and engine when called rather than when the iterator is first advanced
+    if context is None:
+        context = _get_caller_context()
+
+    parser = create_deserializer(typ, context, options=options)
+    return _load_lines(parser, file)
+
+
+def _load_lines(parser: Deserializer[T], file: Iterable[str]) -> Iterator[T]:
+    parse = parser.parse
+    loads = json.loads
+    for line in file:
+        if line and not line.isspace():
+            yield parse(loads(line))
+
+
+def load_array(
+    item_type: type[T],
+    source: Union[IO[str], IO[bytes], mmap.mmap, bytes, bytearray, memoryview],
+    *,
+    context: Optional[ModuleType] = None,
+    options: Optional[DeserializerOptions] = None,
+    chunk_size: int = 65536,
+) -> Iterator[T]:
+    """
+    Reads Python objects from a JSON document whose top-level value is a JSON array.
+
+    The document is read in chunks, and an object is created as soon as the corresponding array element is complete.
+    Memory use is proportional to the size of the largest array element rather than the size of the document.
+
+    :param item_type: The type of objects to create from array elements.
+    :param source: A text or binary file, a memory-mapped file, or a buffer of bytes. Binary input must be UTF-8.
+    :param context: A module context for evaluating types specified as a string. Defaults to the caller's module.
+    :param options: Configures how the de-serializer processes input.
+    :param chunk_size: Number of characters (or bytes) to read from the source at once.
+    :raises TypeError: A de-serializing engine cannot be constructed for the input type.
+    """
+
+    # resolve context and engine when called rather than when the iterator is first advanced
+    if context is None:
+        context = _get_caller_context()
+
+    parser = create_deserializer(item_type, context, options=options)
+    reader = _JsonArrayReader(_get_text_reader(source), chunk_size)
+    return _load_array(parser, reader)
+
+
+def _load_array(parser: Deserializer[T], reader: "_JsonArrayReader") -> Iterator[T]:
+    parse = parser.parse
+    for item in reader.items():
+        yield parse(item)
+
+
+def _get_text_reader(
+    source: Union[IO[str], IO[bytes], mmap.mmap, bytes, bytearray, memoryview],
+) -> Callable[[int], str]:
+    "Returns a function that reads a chunk of text from a source, or an empty string at the end of input."
+
+    stream: Union[IO[str], IO[bytes], mmap.mmap]
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        stream = io.BytesIO(source)
+    else:
+        stream = source
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def read(size: int) -> str:
+        while True:
+            chunk = stream.read(size)
+            if isinstance(chunk, str):
+                return chunk
+            if not chunk:
+                return decoder.decode(b"", final=True)
+
+            # a chunk may end in the middle of a multi-byte character
+            text = decoder.decode(chunk)
+            if text:
+                return text
+
+    return read
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+_NUMBER_DELIMITERS = frozenset(" \t\n\r,]")
+_STRUCTURAL_DELIMITERS = re.compile(r"[ \t\n\r,:\]}]")
+
+# the longest token that the decoder reports as invalid while it is incomplete, e.g. `-Infinity` or `\ud83d\ude00`
+_MAX_PARTIAL_TOKEN = 16
+
+
+class _JsonArrayReader:
+    "Yields the elements of a top-level JSON array, holding only the element being parsed in memory."
+
+    read: Callable[[int], str]
+    chunk_size: int
+    buffer: str
+    pos: int
+    eof: bool
+
+    def __init__(self, read: Callable[[int], str], chunk_size: int) -> None:
+        self.read = read
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def items(self) -> Iterator[JsonType]:
+        if self._peek() != "[":
+            raise json.JSONDecodeError("Expecting '['", self.buffer, self.pos)
+        self.pos += 1
+
+        if self._peek() == "]":
+            self.pos += 1
+        else:
+            while True:
+                yield self._decode()
+
+                char = self._peek()
+                self.pos += 1
+                if char == "]":
+                    break
+                elif char != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", self.buffer, self.pos - 1)
+
+        if self._peek():
+            raise json.JSONDecodeError("Extra data", self.buffer, self.pos)
+
+    def _fill(self, size: int) -> None:
+        "Discards consumed input, and appends the next chunk to the buffer."
+
+        chunk = self.read(size)
+        if chunk:
+            self.buffer = self.buffer[self.pos :] + chunk
+            self.pos = 0
+        else:
+            self.eof = True
+
+    def _peek(self) -> str:
+        "Skips whitespace, and returns the next character, or an empty string at the end of input."
+
+        while True:
+            match = _WHITESPACE.match(self.buffer, self.pos)
+            if match is not None:
+                self.pos = match.end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.eof:
+                return ""
+            self._fill(self.chunk_size)
+
+    def _decode(self) -> JsonType:
+        "Parses the next JSON value, reading more input until the value is complete."
+
+        self._peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof or not self._is_truncated(e):
+                    raise
+            else:
+                # a number is only complete if followed by a delimiter: a chunk might end right after `1.` or `3e`,
+                # in which case the decoder returns the valid prefix `1` or `3`
+                if self.eof or (
+                    end < len(self.buffer)
+                    and (
+                        type(value) not in (int, float)
+                        or self.buffer[end] in _NUMBER_DELIMITERS
+                        or not self._is_partial_token(end)
+                    )
+                ):
+                    self.pos = end
+                    return typing.cast(JsonType, value)
+
+            # grow the chunk size to avoid parsing a large element too many times
+            self._fill(size)
+            size *= 2
+
+    def _is_truncated(self, error: json.JSONDecodeError) -> bool:
+        """
+        Checks whether a decoding error might be due to a value that continues in the next chunk.
+
+        Errors for malformed input followed by more data are raised immediately, without reading the rest of the input.
+        """
+
+        if error.msg.startswith("Unterminated string"):
+            return True  # reported at the opening quotation mark
+
+        return self._is_partial_token(error.pos)
+
+    def _is_partial_token(self, pos: int) -> bool:
+        "Checks whether the buffer ends in a possibly incomplete token (e.g. `tru` or `2.5e-`) starting at a position."
+
+        tail = self.buffer[pos:]
+        return len(tail) <= _MAX_PARTIAL_TOKEN and _STRUCTURAL_DELIMITERS.search(tail) is None
+
+
+def object_to_json_many(
+    objs: Iterable[Any],
+    *,
+    executor: Optional[concurrent.futures.Executor] = None,
+    chunk_size: int = 1000,
+) -> list[bytes]:
+    """
+    Converts a large number of Python objects to compact JSON strings encoded in UTF-8, using multiple processes.
+
+    Objects are split into chunks, and each chunk is sent to a worker process, which returns a single block of JSON
+    strings. Objects must support `pickle`. The output is the same as `object_dump_string` for each object.
+
+    :param objs: Objects to convert.
+    :param executor: An executor to submit chunks to. Defaults to a process pool with one worker per CPU.
+    :param chunk_size: Number of objects in a chunk.
+    :returns: A list of JSON strings, in the same order as input objects.
+    """
+
+    chunks = _split_chunks(objs, chunk_size)
+    if executor is None:
+        with concurrent.futures.ProcessPoolExecutor() as pool:
+            blocks = list(pool.map(_serialize_chunk, chunks))
+    else:
+        blocks = list(executor.map(_serialize_chunk, chunks))
+
+    # compact JSON strings never contain a new line character, which thus separates items
+    return [item for block in blocks if block for item in block.split(b"\n")]
+
+
+def json_to_object_many(
+    typ: type[T],
+    items: Iterable[Union[str, bytes]],
+    *,
+    context: Optional[ModuleType] = None,
+    options: Optional[DeserializerOptions] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+    chunk_size: int = 1000,
+) -> list[T]:
+    """
+    Creates a large number of objects from JSON strings, using multiple processes.
+
+    JSON strings are split into chunks, and each chunk is sent to a worker process, which parses JSON and
+    de-serializes objects. Objects of the target type must support `pickle`.
+
+    :param typ: The type of objects to create.
+    :param items: JSON strings to parse.
+    :param context: A module context for evaluating types specified as a string. Defaults to the caller's module.
+    :param options: Configures how the de-serializer processes input.
+    :param executor: An executor to submit chunks to. Defaults to a process pool with one worker per CPU.
+    :param chunk_size: Number of JSON strings in a chunk.
+    :returns: A list of objects, in the same order as input strings.
+    :raises TypeError: A de-serializing engine cannot be constructed for the input type.
+    """
+
+    if context is None:
+        context = _get_caller_context()
+
+    # fail early (in the calling process) if the type is not supported
+    create_deserializer(typ, context, options=options)
+
+    # modules are passed by name as module objects cannot be pickled
+    context_name = context.__name__ if context is not None else None
+    chunks = _split_chunks(items, chunk_size)
+    parse_chunk = functools.partial(_deserialize_chunk, typ, context_name, options)
+    if executor is None:
+        with concurrent.futures.ProcessPoolExecutor(
+            initializer=_initialize_deserializer,
+            initargs=(typ, context_name, options),
+        ) as pool:
+            blocks = list(pool.map(parse_chunk, chunks))
+    else:
+        blocks = list(executor.map(parse_chunk, chunks))
+
+    return [item for block in blocks for item in block]
+
+
+def _split_chunks(items: Iterable[T], chunk_size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _serialize_chunk(objs: list[Any]) -> bytes:
+    "Converts a chunk of objects to JSON strings, separated by new line characters. Runs in a worker process."
+
+    encode = _LINE_ENCODER.encode
+    return "\n".join(encode(object_to_default(obj)) for obj in objs).encode("utf-8")
+
+
+def _get_context(context_name: Optional[str]) -> Optional[ModuleType]:
+    return importlib.import_module(context_name) if context_name is not None else None
+
+
+def _initialize_deserializer(
+    typ: TypeLike, context_name: Optional[str], options: Optional[DeserializerOptions]
+) -> None:
+    "Populates the de-serializer cache when a worker process starts."
+
+    create_deserializer(typ, _get_context(context_name), options=options)
+
+
+def _deserialize_chunk(
+    typ: TypeLike,
+    context_name: Optional[str],
+    options: Optional[DeserializerOptions],
+    items: list[Union[str, bytes]],
+) -> list[Any]:
+    "Creates objects from a chunk of JSON strings. Runs in a worker process."
+
+    parse = create_deserializer(typ, _get_context(context_name), options=options).parse
+    loads = json.loads
+    return [parse(loads(item)) for item in items]
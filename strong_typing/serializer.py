@@ -8,24 +8,33 @@ Type-safe data interchange for Python data classes.
 
 import abc
 import base64
+import dataclasses
 import datetime
 import enum
 import functools
 import inspect
 import ipaddress
+import json
+import keyword
+import math
 import sys
 import types
 import typing
 import uuid
+from dataclasses import dataclass
+from json.encoder import encode_basestring
 from types import FunctionType, MethodType, ModuleType
-from typing import Any, Callable, Generic, Literal, NamedTuple, Optional, TypeVar, Union
+from typing import Any, Callable, Generic, Iterable, Literal, NamedTuple, Optional, TypeVar, Union
 
+from .auxiliary import Discriminator, Tag
+from .codec import datetime_to_str
 from .core import JsonType
 from .exception import JsonTypeError, JsonValueError
 from .inspection import (
     TypeLike,
     enum_value_types,
     evaluate_type,
+    get_annotation,
     get_class_properties,
     get_resolved_hints,
     is_dataclass_type,
@@ -33,74 +42,167 @@ from .inspection import (
     is_reserved_property,
     is_type_annotated,
     is_type_enum,
+    is_type_optional,
+    is_type_union,
     unwrap_annotated_type,
+    unwrap_union_types,
 )
-from .mapping import python_field_to_json_property
+from .mapping import get_json_property_type, python_field_to_json_property
+from .name import python_type_to_str
+from .projection import Projection, format_projection
 
 T = TypeVar("T")
 
 
 class Serializer(abc.ABC, Generic[T]):
+    passthrough: bool = False
+    "True if values of the serialized type can be handed as-is to the JSON encoder in the standard library."
+
     @abc.abstractmethod
     def generate(self, data: T) -> JsonType: ...
 
+    def default(self, data: T) -> Any:
+        """
+        Converts an object to a representation that the JSON encoder in the standard library can consume.
+
+        Unlike `generate`, the representation may contain objects that are not JSON types, which the encoder passes to
+        `object_to_default` in turn.
+        """
+
+        return self.generate(data)
+
+    def encode(self, data: T, fragments: list[str]) -> None:
+        """
+        Writes the JSON text representation of an object without building an intermediate JSON object.
+
+        :param data: The object to write.
+        :param fragments: A list of strings to append JSON text to. Joining the strings yields a JSON document.
+        """
+
+        fragments.append(_encode_json(self.generate(data)))
+
+
+@dataclass(frozen=True)
+class SerializerOptions:
+    """
+    Configures how the serializer processes input and generates output.
+
+    :param compiled: Whether to generate a specialized Python function for each data class, which reads fields
+        directly rather than iterating over a list of field serializers.
+    :param include: Properties to write (see `projection.parse_projection`), or an empty tuple to write all properties.
+    :param exclude: Properties not to write (see `projection.parse_projection`), or an empty tuple to write all.
+    """
+
+    compiled: bool = False
+    include: Projection = ()
+    exclude: Projection = ()
+
 
 class NoneSerializer(Serializer[None]):
+    passthrough = True
+
     def generate(self, data: None) -> None:
         # can be directly represented in JSON
         return None
 
+    def encode(self, data: None, fragments: list[str]) -> None:
+        fragments.append("null")
+
 
 class BoolSerializer(Serializer[bool]):
+    passthrough = True
+
     def generate(self, data: bool) -> bool:
         # can be directly represented in JSON
         return data
 
+    def encode(self, data: bool, fragments: list[str]) -> None:
+        if data is True:
+            fragments.append("true")
+        elif data is False:
+            fragments.append("false")
+        else:
+            super().encode(data, fragments)  # type: ignore[unreachable]
+
 
 class IntSerializer(Serializer[int]):
+    passthrough = True
+
     def generate(self, data: int) -> int:
         # can be directly represented in JSON
         return data
 
+    def encode(self, data: int, fragments: list[str]) -> None:
+        if type(data) is int:
+            fragments.append(int.__repr__(data))
+        else:
+            super().encode(data, fragments)
+
 
 class FloatSerializer(Serializer[float]):
+    passthrough = True
+
     def generate(self, data: float) -> float:
         # can be directly represented in JSON
         return data
 
+    def encode(self, data: float, fragments: list[str]) -> None:
+        # special values such as NaN and infinity take the generic path
+        if type(data) is float and -math.inf < data < math.inf:
+            fragments.append(float.__repr__(data))
+        else:
+            super().encode(data, fragments)
+
 
 class StringSerializer(Serializer[str]):
+    passthrough = True
+
     def generate(self, data: str) -> str:
         # can be directly represented in JSON
         return data
 
+    def encode(self, data: str, fragments: list[str]) -> None:
+        if type(data) is str:
+            fragments.append(encode_basestring(data))
+        else:
+            super().encode(data, fragments)
+
+
+class AsciiStringSerializer(Serializer[T]):
+    "Serializes objects whose string representation consists of printable ASCII characters that need no escaping."
+
+    passthrough = True
 
-class BytesSerializer(Serializer[bytes]):
+    @abc.abstractmethod
+    def generate(self, data: T) -> str: ...
+
+    def encode(self, data: T, fragments: list[str]) -> None:
+        fragments.append(f'"{self.generate(data)}"')
+
+
+class BytesSerializer(AsciiStringSerializer[bytes]):
     def generate(self, data: bytes) -> str:
         return base64.b64encode(data).decode("ascii")
 
 
-class DateTimeSerializer(Serializer[datetime.datetime]):
+class DateTimeSerializer(AsciiStringSerializer[datetime.datetime]):
     def generate(self, obj: datetime.datetime) -> str:
         if obj.tzinfo is None:
-            raise JsonValueError(f"timestamp lacks explicit time zone designator: {obj}")
-        fmt = obj.isoformat()
-        if fmt.endswith("+00:00"):
-            fmt = f"{fmt[:-6]}Z"  # Python's isoformat() does not support military time zones like "Zulu" for UTC
-        return fmt
+            raise JsonValueError("timestamp lacks explicit time zone designator: {}", obj)
+        return datetime_to_str(obj)
 
 
-class DateSerializer(Serializer[datetime.date]):
+class DateSerializer(AsciiStringSerializer[datetime.date]):
     def generate(self, obj: datetime.date) -> str:
         return obj.isoformat()
 
 
-class TimeSerializer(Serializer[datetime.time]):
+class TimeSerializer(AsciiStringSerializer[datetime.time]):
     def generate(self, obj: datetime.time) -> str:
         return obj.isoformat()
 
 
-class TimeDeltaSerializer(Serializer[datetime.timedelta]):
+class TimeDeltaSerializer(AsciiStringSerializer[datetime.timedelta]):
     def generate(self, obj: datetime.timedelta) -> str:
         if obj.days != 0:
             day_component = f"{obj.days}D"
@@ -149,69 +251,144 @@ class TimeDeltaSerializer(Serializer[datetime.timedelta]):
             return f"T{seconds}{fractional}S"
 
 
-class UUIDSerializer(Serializer[uuid.UUID]):
+class UUIDSerializer(AsciiStringSerializer[uuid.UUID]):
     def generate(self, obj: uuid.UUID) -> str:
         return str(obj)
 
 
-class IPv4Serializer(Serializer[ipaddress.IPv4Address]):
+class IPv4Serializer(AsciiStringSerializer[ipaddress.IPv4Address]):
     def generate(self, obj: ipaddress.IPv4Address) -> str:
         return str(obj)
 
 
 class IPv6Serializer(Serializer[ipaddress.IPv6Address]):
+    passthrough = True
+
     def generate(self, obj: ipaddress.IPv6Address) -> str:
         return str(obj)
 
 
 class EnumSerializer(Serializer[enum.Enum]):
+    passthrough = True
+
     def generate(self, obj: enum.Enum) -> Union[int, str]:
         return typing.cast(Union[int, str], obj.value)
 
+    def encode(self, obj: enum.Enum, fragments: list[str]) -> None:
+        value = obj.value
+        if type(value) is int:
+            fragments.append(int.__repr__(value))
+        elif type(value) is str:
+            fragments.append(encode_basestring(value))
+        else:
+            super().encode(obj, fragments)
+
+
+class UntypedCollectionSerializer(Serializer):
+    "Serializes the items of a collection whose item type is only known at run time."
+
+    generator: "DynamicSerializer"
+
+    def __init__(self, options: SerializerOptions) -> None:
+        # items are written with the same options (e.g. a projection) as the collection
+        self.generator = DynamicSerializer(options)
 
-class UntypedListSerializer(Serializer[list]):
+
+class UntypedListSerializer(UntypedCollectionSerializer):
     def generate(self, obj: list) -> list[JsonType]:
-        return [object_to_json(item) for item in obj]
+        generate = self.generator.generate
+        return [item if type(item) in _NATIVE_TYPES else generate(item) for item in obj]
+
+    def default(self, obj: list) -> list:
+        return [self.generator.default(item) for item in obj]
 
 
-class UntypedDictSerializer(Serializer[dict]):
+class UntypedDictSerializer(UntypedCollectionSerializer):
     def generate(self, obj: dict) -> dict[str, JsonType]:
+        generate = self.generator.generate
+        if obj and isinstance(next(iter(obj.keys())), enum.Enum):
+            return {key.value: value if type(value) in _NATIVE_TYPES else generate(value) for key, value in obj.items()}
+        else:
+            return {
+                key if type(key) is str else str(key): value if type(value) in _NATIVE_TYPES else generate(value)
+                for key, value in obj.items()
+            }
+
+    def default(self, obj: dict) -> dict:
+        default = self.generator.default
         if obj and isinstance(next(iter(obj.keys())), enum.Enum):
-            iterator = ((key.value, object_to_json(value)) for key, value in obj.items())
+            return {key.value: default(value) for key, value in obj.items()}
         else:
-            iterator = ((str(key), object_to_json(value)) for key, value in obj.items())
-        return dict(iterator)
+            return {str(key): default(value) for key, value in obj.items()}
 
 
-class UntypedSetSerializer(Serializer[set]):
+class UntypedSetSerializer(UntypedCollectionSerializer):
     def generate(self, obj: set) -> list[JsonType]:
-        return [object_to_json(item) for item in obj]
+        generate = self.generator.generate
+        return [item if type(item) in _NATIVE_TYPES else generate(item) for item in obj]
+
+    def default(self, obj: set) -> list:
+        return [self.generator.default(item) for item in obj]
 
 
-class UntypedTupleSerializer(Serializer[tuple]):
+class UntypedTupleSerializer(UntypedCollectionSerializer):
     def generate(self, obj: tuple) -> list[JsonType]:
-        return [object_to_json(item) for item in obj]
+        generate = self.generator.generate
+        return [item if type(item) in _NATIVE_TYPES else generate(item) for item in obj]
+
+    def default(self, obj: tuple) -> list:
+        return [self.generator.default(item) for item in obj]
 
 
 class TypedCollectionSerializer(Serializer, Generic[T]):
     generator: Serializer[T]
 
-    def __init__(self, item_type: type[T], context: Optional[ModuleType]) -> None:
-        self.generator = _get_serializer(item_type, context)
+    def __init__(self, item_type: type[T], context: Optional[ModuleType], options: SerializerOptions) -> None:
+        self.generator = _get_serializer(item_type, context, options)
 
 
 class TypedListSerializer(TypedCollectionSerializer[T]):
+    def __init__(self, item_type: type[T], context: Optional[ModuleType], options: SerializerOptions) -> None:
+        super().__init__(item_type, context, options)
+        self.passthrough = self.generator.passthrough
+
     def generate(self, obj: list[T]) -> list[JsonType]:
         return [self.generator.generate(item) for item in obj]
 
+    def default(self, obj: list[T]) -> list:
+        return [self.generator.default(item) for item in obj]
+
+    def encode(self, obj: list[T], fragments: list[str]) -> None:
+        _encode_array(self.generator.encode, obj, fragments)
+
 
 class TypedStringDictSerializer(TypedCollectionSerializer[T]):
-    def __init__(self, value_type: type[T], context: Optional[ModuleType]) -> None:
-        super().__init__(value_type, context)
+    def __init__(self, value_type: type[T], context: Optional[ModuleType], options: SerializerOptions) -> None:
+        super().__init__(value_type, context, options)
+        self.passthrough = self.generator.passthrough
 
     def generate(self, obj: dict[str, T]) -> dict[str, JsonType]:
         return {key: self.generator.generate(value) for key, value in obj.items()}
 
+    def default(self, obj: dict[str, T]) -> dict:
+        return {key: self.generator.default(value) for key, value in obj.items()}
+
+    def encode(self, obj: dict[str, T], fragments: list[str]) -> None:
+        if not obj:
+            fragments.append("{}")
+            return
+
+        # emit a separator before each member, and replace the very first separator with the opening brace
+        start = len(fragments)
+        encode = self.generator.encode
+        for key, value in obj.items():
+            fragments.append(",")
+            fragments.append(encode_basestring(key))
+            fragments.append(":")
+            encode(value, fragments)
+        fragments[start] = "{"
+        fragments.append("}")
+
 
 class TypedEnumDictSerializer(TypedCollectionSerializer[T]):
     def __init__(
@@ -219,8 +396,9 @@ class TypedEnumDictSerializer(TypedCollectionSerializer[T]):
         key_type: type[enum.Enum],
         value_type: type[T],
         context: Optional[ModuleType],
+        options: SerializerOptions,
     ) -> None:
-        super().__init__(value_type, context)
+        super().__init__(value_type, context, options)
 
         value_types = enum_value_types(key_type)
         if len(value_types) != 1:
@@ -236,21 +414,61 @@ class TypedEnumDictSerializer(TypedCollectionSerializer[T]):
     def generate(self, obj: dict[enum.Enum, T]) -> dict[str, JsonType]:
         return {key.value: self.generator.generate(value) for key, value in obj.items()}
 
+    def default(self, obj: dict[enum.Enum, T]) -> dict:
+        return {key.value: self.generator.default(value) for key, value in obj.items()}
+
+    def encode(self, obj: dict[enum.Enum, T], fragments: list[str]) -> None:
+        if not obj:
+            fragments.append("{}")
+            return
+
+        start = len(fragments)
+        encode = self.generator.encode
+        for key, value in obj.items():
+            fragments.append(",")
+            fragments.append(encode_basestring(key.value))
+            fragments.append(":")
+            encode(value, fragments)
+        fragments[start] = "{"
+        fragments.append("}")
+
 
 class TypedSetSerializer(TypedCollectionSerializer[T]):
     def generate(self, obj: set[T]) -> JsonType:
         return [self.generator.generate(item) for item in obj]
 
+    def default(self, obj: set[T]) -> list:
+        return [self.generator.default(item) for item in obj]
+
+    def encode(self, obj: set[T], fragments: list[str]) -> None:
+        _encode_array(self.generator.encode, obj, fragments)
+
 
 class TypedTupleSerializer(Serializer[tuple]):
     item_generators: tuple[Serializer, ...]
 
-    def __init__(self, item_types: tuple[type, ...], context: Optional[ModuleType]) -> None:
-        self.item_generators = tuple(_get_serializer(item_type, context) for item_type in item_types)
+    def __init__(self, item_types: tuple[type, ...], context: Optional[ModuleType], options: SerializerOptions) -> None:
+        self.item_generators = tuple(_get_serializer(item_type, context, options) for item_type in item_types)
+        self.passthrough = all(item_generator.passthrough for item_generator in self.item_generators)
 
     def generate(self, obj: tuple) -> list[JsonType]:
         return [item_generator.generate(item) for item_generator, item in zip(self.item_generators, obj)]
 
+    def default(self, obj: tuple) -> list:
+        return [item_generator.default(item) for item_generator, item in zip(self.item_generators, obj)]
+
+    def encode(self, obj: tuple, fragments: list[str]) -> None:
+        if not obj or not self.item_generators:
+            fragments.append("[]")
+            return
+
+        start = len(fragments)
+        for item_generator, item in zip(self.item_generators, obj):
+            fragments.append(",")
+            item_generator.encode(item, fragments)
+        fragments[start] = "["
+        fragments.append("]")
+
 
 class CustomSerializer(Serializer):
     converter: Callable[[object], JsonType]
@@ -274,30 +492,91 @@ class FieldSerializer(Generic[T]):
     field_name: str
     property_name: str
     generator: Serializer
+    encoded_name: str
 
     def __init__(self, field_name: str, property_name: str, generator: Serializer[T]) -> None:
         self.field_name = field_name
         self.property_name = property_name
         self.generator = generator
 
+        # property name escaped once, preceded by a member separator and followed by a name separator
+        self.encoded_name = f",{encode_basestring(property_name)}:"
+
     def generate_field(self, obj: object, object_dict: dict[str, JsonType]) -> None:
         value = getattr(obj, self.field_name)
         if value is not None:
             object_dict[self.property_name] = self.generator.generate(value)
 
+    def default_field(self, obj: object, object_dict: dict[str, Any]) -> None:
+        value = getattr(obj, self.field_name)
+        if value is not None:
+            if self.generator.passthrough:
+                object_dict[self.property_name] = value
+            else:
+                object_dict[self.property_name] = self.generator.default(value)
+
+    def encode_field(self, obj: object, fragments: list[str]) -> None:
+        value = getattr(obj, self.field_name)
+        if value is not None:
+            fragments.append(self.encoded_name)
+            self.generator.encode(value, fragments)
+
 
 class TypedClassSerializer(Serializer[T]):
+    # the JSON encoder would write a nested object with the serializer of its run-time type (e.g. a derived class),
+    # which may produce properties that the declared type does not have
+    passthrough = False
+
     property_generators: list[FieldSerializer]
 
-    def __init__(self, class_type: type[T], context: Optional[ModuleType]) -> None:
-        self.property_generators = [
-            FieldSerializer(
-                field_name,
-                python_field_to_json_property(field_name, field_type),
-                _get_serializer(field_type, context),
+    def __init__(self, class_type: type[T], context: Optional[ModuleType], options: SerializerOptions) -> None:
+        if not (options.include or options.exclude):
+            self.property_generators = [
+                FieldSerializer(
+                    field_name,
+                    python_field_to_json_property(field_name, field_type),
+                    _get_serializer(field_type, context, options),
+                )
+                for field_name, field_type in get_class_properties(class_type)
+            ]
+            return
+
+        include = dict(options.include)
+        exclude = dict(options.exclude)
+        self.property_generators = []
+        for field_name, field_type in get_class_properties(class_type):
+            property_name = python_field_to_json_property(field_name, field_type)
+            if property_name in exclude:
+                nested_exclude = exclude.pop(property_name)
+                if not nested_exclude:
+                    continue  # property is excluded with all of its nested properties
+            else:
+                nested_exclude = ()
+            if options.include:
+                if property_name not in include:
+                    continue
+                nested_include = include.pop(property_name)
+            else:
+                nested_include = ()
+
+            if (nested_include or nested_exclude) and not _accepts_projection(field_type, context):
+                paths = format_projection(nested_include) + format_projection(nested_exclude)
+                raise ValueError(
+                    f"projection cannot be applied to type `{python_type_to_str(field_type)}` of property "
+                    f"`{property_name}`: {', '.join(paths)}"
+                )
+
+            field_options = dataclasses.replace(options, include=nested_include, exclude=nested_exclude)
+            self.property_generators.append(
+                FieldSerializer(field_name, property_name, _get_serializer(field_type, context, field_options))
+            )
+
+        unmatched = format_projection(tuple(include.items())) + format_projection(tuple(exclude.items()))
+        if unmatched:
+            raise ValueError(
+                f"type `{python_type_to_str(class_type)}` has no properties that match the projection: "
+                f"{', '.join(unmatched)}"
             )
-            for field_name, field_type in get_class_properties(class_type)
-        ]
 
     def generate(self, obj: T) -> dict[str, JsonType]:
         object_dict: dict[str, JsonType] = {}
@@ -306,26 +585,213 @@ class TypedClassSerializer(Serializer[T]):
 
         return object_dict
 
+    def default(self, obj: T) -> dict[str, Any]:
+        object_dict: dict[str, Any] = {}
+        for property_generator in self.property_generators:
+            property_generator.default_field(obj, object_dict)
+
+        return object_dict
+
+    def encode(self, obj: T, fragments: list[str]) -> None:
+        fragments.append("{")
+        start = len(fragments)
+        for property_generator in self.property_generators:
+            property_generator.encode_field(obj, fragments)
+
+        if len(fragments) > start:
+            # drop the member separator that precedes the first property name
+            fragments[start] = fragments[start][1:]
+        fragments.append("}")
+
 
 class TypedNamedTupleSerializer(TypedClassSerializer[NamedTuple]):
-    def __init__(self, class_type: type[NamedTuple], context: Optional[ModuleType]) -> None:
-        super().__init__(class_type, context)
+    def __init__(self, class_type: type[NamedTuple], context: Optional[ModuleType], options: SerializerOptions) -> None:
+        super().__init__(class_type, context, options)
 
 
 class DataclassSerializer(TypedClassSerializer[T]):
-    def __init__(self, class_type: type[T], context: Optional[ModuleType]) -> None:
-        super().__init__(class_type, context)
+    def __init__(self, class_type: type[T], context: Optional[ModuleType], options: SerializerOptions) -> None:
+        super().__init__(class_type, context, options)
+
+
+class CompiledDataclassSerializer(DataclassSerializer[T]):
+    """
+    Serializes a data class with a Python function generated specifically for the data class.
+
+    Fields of a fundamental type (e.g. `bool`, `int` or `str`) are copied as-is with a direct attribute read, other
+    fields are passed to the serializer that handles the field's type.
+    """
+
+    function: Callable[[T], dict[str, JsonType]]
+    encode_function: Callable[[T, list[str]], None]
+
+    def __init__(self, class_type: type[T], context: Optional[ModuleType], options: SerializerOptions) -> None:
+        super().__init__(class_type, context, options)
+        self.function = self._compile(class_type)
+        self.encode_function = self._compile_encode(class_type)
+
+    def _compile(self, class_type: type[T]) -> Callable[[T], dict[str, JsonType]]:
+        "Emits and compiles the source code of a function that serializes instances of the data class."
+
+        namespace: dict[str, Any] = {}
+        lines = ["def generate(obj):", "    object_dict = {}"]
+        for index, property_generator in enumerate(self.property_generators):
+            field_name = property_generator.field_name
+            if field_name.isidentifier() and not keyword.iskeyword(field_name):
+                lines.append(f"    value = obj.{field_name}")
+            else:
+                lines.append(f"    value = getattr(obj, {field_name!r})")
+            lines.append("    if value is not None:")
+
+            generator = property_generator.generator
+            if type(generator) in _IDENTITY_SERIALIZERS:
+                # skip call to a serializer that would return its input unchanged
+                expression = "value"
+            else:
+                if isinstance(generator, CompiledDataclassSerializer):
+                    namespace[f"generate_{index}"] = generator.function
+                else:
+                    namespace[f"generate_{index}"] = generator.generate
+                expression = f"generate_{index}(value)"
+            lines.append(f"        object_dict[{property_generator.property_name!r}] = {expression}")
+        lines.append("    return object_dict")
+
+        source = "\n".join(lines)
+        exec(compile(source, f"<serializer for {class_type.__qualname__}>", "exec"), namespace)
+        return typing.cast(Callable[[T], dict[str, JsonType]], namespace["generate"])
+
+    def _compile_encode(self, class_type: type[T]) -> Callable[[T, list[str]], None]:
+        "Emits and compiles the source code of a function that writes instances of the data class as JSON text."
+
+        namespace: dict[str, Any] = {"encode_basestring": encode_basestring, "int_repr": int.__repr__}
+        lines = [
+            "def encode(obj, fragments):",
+            "    append = fragments.append",
+            "    append('{')",
+            "    start = len(fragments)",
+        ]
+        for index, property_generator in enumerate(self.property_generators):
+            field_name = property_generator.field_name
+            if field_name.isidentifier() and not keyword.iskeyword(field_name):
+                lines.append(f"    value = obj.{field_name}")
+            else:
+                lines.append(f"    value = getattr(obj, {field_name!r})")
+            lines.append("    if value is not None:")
+            lines.append(f"        append({property_generator.encoded_name!r})")
+
+            generator = property_generator.generator
+            if isinstance(generator, CompiledDataclassSerializer):
+                namespace[f"encode_{index}"] = generator.encode_function
+            else:
+                namespace[f"encode_{index}"] = generator.encode
+
+            # write common primitive values in-line, fall back to the serializer for anything else
+            if type(generator) is IntSerializer:
+                lines.append("        if type(value) is int:")
+                lines.append("            append(int_repr(value))")
+                lines.append("        else:")
+                lines.append(f"            encode_{index}(value, fragments)")
+            elif type(generator) is StringSerializer:
+                lines.append("        if type(value) is str:")
+                lines.append("            append(encode_basestring(value))")
+                lines.append("        else:")
+                lines.append(f"            encode_{index}(value, fragments)")
+            else:
+                lines.append(f"        encode_{index}(value, fragments)")
+        lines.append("    if len(fragments) > start:")
+        lines.append("        fragments[start] = fragments[start][1:]")
+        lines.append("    append('}')")
+
+        source = "\n".join(lines)
+        exec(compile(source, f"<encoder for {class_type.__qualname__}>", "exec"), namespace)
+        return typing.cast(Callable[[T, list[str]], None], namespace["encode"])
+
+    def generate(self, obj: T) -> dict[str, JsonType]:
+        return self.function(obj)
+
+    def encode(self, obj: T, fragments: list[str]) -> None:
+        self.encode_function(obj, fragments)
+
+
+_IDENTITY_SERIALIZERS: tuple[type[Serializer], ...] = (BoolSerializer, IntSerializer, FloatSerializer, StringSerializer)
+
+
+class DynamicSerializer(Serializer):
+    """
+    Serializes objects whose type is only known at run time, e.g. values of type `Any` or members of a union.
+
+    Serializers are looked up by the exact type of the object in a dictionary populated on demand. Values of a
+    fundamental type (`None`, `bool`, `int`, `float` or `str`) are returned without a lookup.
+    """
+
+    options: SerializerOptions
+    generators: dict[type, Serializer]
+
+    def __init__(self, options: SerializerOptions) -> None:
+        self.options = options
+        self.generators = {}
+
+    def get_generator(self, typ: type) -> Serializer:
+        generator = self.generators.get(typ)
+        if generator is None:
+            generator = create_serializer(typ, options=self.options)
+            self.generators[typ] = generator
+        return generator
+
+    def generate(self, obj: Any) -> JsonType:
+        typ = type(obj)
+        if typ in _NATIVE_TYPES:
+            return obj  # type: ignore[no-any-return]
+        return self.get_generator(typ).generate(obj)
+
+    def default(self, obj: Any) -> Any:
+        typ = type(obj)
+        if typ in _NATIVE_TYPES:
+            return obj
+        return self.get_generator(typ).default(obj)
+
+    def encode(self, obj: Any, fragments: list[str]) -> None:
+        self.get_generator(type(obj)).encode(obj, fragments)
+
+
+class UnionSerializer(DynamicSerializer):
+    "Serializes a value of a union type with the serializer that matches the type of the value."
 
 
-class UnionSerializer(Serializer):
+class TaggedUnionSerializer(Serializer):
+    "Serializes a union type with a discriminator property declared with the annotation `Discriminator`."
+
+    property_name: str
+    tags: dict[type, Any]
+    generator: DynamicSerializer
+
+    def __init__(self, member_types: tuple[TypeLike, ...], property_name: str, options: SerializerOptions) -> None:
+        self.property_name = property_name
+        self.generator = DynamicSerializer(options)
+
+        # add the discriminator property only for member types that do not declare it themselves
+        self.tags = {}
+        for member_type in member_types:
+            tag = get_annotation(member_type, Tag)
+            class_type = unwrap_annotated_type(member_type)
+            if tag is None or not isinstance(class_type, type):
+                continue
+            if get_json_property_type(class_type, property_name) is None:
+                self.tags[class_type] = tag.value
+
     def generate(self, obj: Any) -> JsonType:
-        return object_to_json(obj)
+        json_obj = self.generator.generate(obj)
+        tag = self.tags.get(type(obj))
+        if tag is not None and isinstance(json_obj, dict):
+            return {self.property_name: tag, **json_obj}
+        else:
+            return json_obj
 
 
 class LiteralSerializer(Serializer):
     generator: Serializer
 
-    def __init__(self, values: tuple[Any, ...], context: Optional[ModuleType]) -> None:
+    def __init__(self, values: tuple[Any, ...], context: Optional[ModuleType], options: SerializerOptions) -> None:
         literal_type_tuple = tuple(type(value) for value in values)
         literal_type_set = set(literal_type_tuple)
         if len(literal_type_set) != 1:
@@ -335,11 +801,15 @@ class LiteralSerializer(Serializer):
             )
 
         literal_type = literal_type_set.pop()
-        self.generator = _get_serializer(literal_type, context)
+        self.generator = _get_serializer(literal_type, context, options)
+        self.passthrough = self.generator.passthrough
 
     def generate(self, obj: Any) -> JsonType:
         return self.generator.generate(obj)
 
+    def encode(self, obj: Any, fragments: list[str]) -> None:
+        self.generator.encode(obj, fragments)
+
 
 class UntypedNamedTupleSerializer(Serializer):
     fields: dict[str, str]
@@ -355,33 +825,165 @@ class UntypedNamedTupleSerializer(Serializer):
         object_dict = {}
         for field_name, property_name in self.fields.items():
             value = getattr(obj, field_name)
-            object_dict[property_name] = object_to_json(value)
+            object_dict[property_name] = value if type(value) in _NATIVE_TYPES else object_to_json(value)
 
         return object_dict
 
 
 class UntypedClassSerializer(Serializer):
+    """
+    Serializes an object of a class without type annotations by iterating over the attributes of the object.
+
+    The attributes to read are determined once for each class and set of instance attribute names, and include class
+    attributes and properties but exclude methods.
+    """
+
+    plans: dict[tuple[type, tuple[str, ...]], list[tuple[str, str]]]
+    "Pairs of attribute name and JSON property name, keyed by class and instance attribute names."
+
+    def __init__(self) -> None:
+        self.plans = {}
+
     def generate(self, obj: object) -> JsonType:
-        # iterate over object attributes to get a standard representation
         object_dict = {}
-        for name in dir(obj):
-            if is_reserved_property(name):
-                continue
-
+        for name, property_name in self._get_plan(obj):
             value = getattr(obj, name)
             if value is None:
                 continue
 
-            # filter instance methods
-            if inspect.ismethod(value):
+            # filter bound methods assigned to an instance attribute or returned by a property
+            if type(value) is MethodType:
                 continue
 
-            object_dict[python_field_to_json_property(name)] = object_to_json(value)
+            object_dict[property_name] = value if type(value) in _NATIVE_TYPES else object_to_json(value)
 
         return object_dict
 
+    def _get_plan(self, obj: object) -> list[tuple[str, str]]:
+        class_type = type(obj)
+        if class_type.__dir__ is not object.__dir__:
+            # attribute names are computed by the class, and may change from call to call
+            return self._create_plan(obj)
+
+        instance_dict = getattr(obj, "__dict__", None)
+        key = (class_type, tuple(instance_dict) if instance_dict is not None else ())
+        plan = self.plans.get(key)
+        if plan is None:
+            if len(self.plans) >= 64:
+                # objects have attributes added dynamically, discard stale plans
+                self.plans.clear()
+            plan = self._create_plan(obj)
+            self.plans[key] = plan
+        return plan
+
+    def _create_plan(self, obj: object) -> list[tuple[str, str]]:
+        class_type = type(obj)
+        instance_dict = getattr(obj, "__dict__", {})
+
+        plan: list[tuple[str, str]] = []
+        for name in dir(obj):
+            if is_reserved_property(name):
+                continue
 
-def create_serializer(typ: TypeLike, context: Optional[ModuleType] = None) -> Serializer:
+            # filter instance and class methods, unless shadowed by an instance attribute
+            if name not in instance_dict:
+                attr = inspect.getattr_static(class_type, name, None)
+                if isinstance(attr, (FunctionType, classmethod)):
+                    continue
+
+            plan.append((name, python_field_to_json_property(name)))
+        return plan
+
+
+# types written as a JSON value other than an object
+_SCALAR_TYPES: frozenset[type] = frozenset(
+    [
+        type(None),
+        bool,
+        int,
+        float,
+        str,
+        bytes,
+        datetime.datetime,
+        datetime.date,
+        datetime.time,
+        datetime.timedelta,
+        uuid.UUID,
+        ipaddress.IPv4Address,
+        ipaddress.IPv6Address,
+    ]
+)
+
+
+def _accepts_projection(typ: TypeLike, context: Optional[ModuleType]) -> bool:
+    """
+    Checks whether a projection can select properties of a type, mirroring how `_create_serializer` picks a serializer.
+
+    Objects of a class with type annotations accept a projection, and so do containers and unions with such items or
+    members. Values whose type is only known at run time (e.g. `Any` or an untyped `list`) are given the benefit of
+    the doubt.
+    """
+
+    if isinstance(typ, (str, typing.ForwardRef)):
+        if context is None:
+            return True
+        typ = evaluate_type(typ, context)
+
+    if typ is Any or typ is list or typ is dict or typ is set or typ is tuple:
+        return True
+    if is_type_annotated(typ):
+        return _accepts_projection(unwrap_annotated_type(typ), context)
+    if is_type_union(typ) or is_type_optional(typ):
+        return any(_accepts_projection(member_type, context) for member_type in unwrap_union_types(typ))
+
+    origin_type = typing.get_origin(typ)
+    if origin_type is list or origin_type is set:
+        return _accepts_projection(typing.get_args(typ)[0], context)
+    elif origin_type is dict:
+        return _accepts_projection(typing.get_args(typ)[1], context)
+    elif origin_type is tuple:
+        return any(
+            _accepts_projection(item_type, context) for item_type in typing.get_args(typ) if item_type is not ...
+        )
+
+    if (
+        not isinstance(typ, type)
+        or typ in _SCALAR_TYPES
+        or is_type_enum(typ)
+        or callable(getattr(typ, "to_json", None))
+    ):
+        return False
+    if is_dataclass_type(typ):
+        return True
+    if is_named_tuple_type(typ):
+        return bool(getattr(typ, "__annotations__", None))
+    return bool(get_resolved_hints(typ))
+
+
+def _encode_array(encode: Callable[[Any, list[str]], None], items: Iterable, fragments: list[str]) -> None:
+    "Writes the JSON text representation of a collection as a JSON array."
+
+    start = len(fragments)
+    for item in items:
+        fragments.append(",")
+        encode(item, fragments)
+
+    if len(fragments) > start:
+        # replace the member separator that precedes the first item with the opening bracket
+        fragments[start] = "["
+        fragments.append("]")
+    else:
+        fragments.append("[]")
+
+
+_encode_json = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(",", ":")).encode
+
+
+def create_serializer(
+    typ: TypeLike,
+    context: Optional[ModuleType] = None,
+    options: Optional[SerializerOptions] = None,
+) -> Serializer:
     """
     Creates a serializer engine to produce an object that can be directly converted into a JSON string.
 
@@ -403,10 +1005,17 @@ def create_serializer(typ: TypeLike, context: Optional[ModuleType] = None) -> Se
         if isinstance(typ, type):
             context = sys.modules[typ.__module__]
 
-    return _get_serializer(typ, context)
+    if options is None:
+        options = _DEFAULT_OPTIONS
+
+    return _get_serializer(typ, context, options)
+
 
+_DEFAULT_OPTIONS = SerializerOptions()
+_DYNAMIC_SERIALIZER = DynamicSerializer(_DEFAULT_OPTIONS)
 
-def _get_serializer(typ: TypeLike, context: Optional[ModuleType]) -> Serializer:
+
+def _get_serializer(typ: TypeLike, context: Optional[ModuleType], options: SerializerOptions) -> Serializer:
     if isinstance(typ, (str, typing.ForwardRef)):
         if context is None:
             raise TypeError(f"missing context for evaluating type: {typ}")
@@ -414,22 +1023,34 @@ def _get_serializer(typ: TypeLike, context: Optional[ModuleType]) -> Serializer:
         typ = evaluate_type(typ, context)
 
     if isinstance(typ, type):
-        return _fetch_serializer(typ)
+        if options.include or options.exclude:
+            return _fetch_projected_serializer(typ, options)
+        else:
+            return _fetch_serializer(typ, options)
     else:
         # special forms are not always hashable
-        return _create_serializer(typ, context)
+        return _create_serializer(typ, context, options)
 
 
 @functools.lru_cache(maxsize=None)
-def _fetch_serializer(typ: type) -> Serializer:
+def _fetch_serializer(typ: type, options: SerializerOptions) -> Serializer:
+    context = sys.modules[typ.__module__]
+    return _create_serializer(typ, context, options)
+
+
+# projections typically come from client requests (e.g. sparse fieldsets in a REST API), keep only the most recent
+@functools.lru_cache(maxsize=256)
+def _fetch_projected_serializer(typ: type, options: SerializerOptions) -> Serializer:
     context = sys.modules[typ.__module__]
-    return _create_serializer(typ, context)
+    return _create_serializer(typ, context, options)
 
 
-def _create_serializer(typ: TypeLike, context: Optional[ModuleType]) -> Serializer:
+def _create_serializer(typ: TypeLike, context: Optional[ModuleType], options: SerializerOptions) -> Serializer:
     # check for well-known types
     if typ is type(None):
         return NoneSerializer()
+    elif typ is Any:
+        return DynamicSerializer(options)
     elif typ is bool:
         return BoolSerializer()
     elif typ is int:
@@ -457,40 +1078,45 @@ def _create_serializer(typ: TypeLike, context: Optional[ModuleType]) -> Serializ
 
     # dynamically-typed collection types
     if typ is list:
-        return UntypedListSerializer()
+        return UntypedListSerializer(options)
     elif typ is dict:
-        return UntypedDictSerializer()
+        return UntypedDictSerializer(options)
     elif typ is set:
-        return UntypedSetSerializer()
+        return UntypedSetSerializer(options)
     elif typ is tuple:
-        return UntypedTupleSerializer()
+        return UntypedTupleSerializer(options)
 
     if sys.version_info >= (3, 10) and isinstance(typ, types.UnionType):
-        return UnionSerializer()
+        return UnionSerializer(options)
 
     # generic types (e.g. list, dict, set, etc.)
     origin_type = typing.get_origin(typ)
     if origin_type is list:
         (list_item_type,) = typing.get_args(typ)  # unpack single tuple element
-        return TypedListSerializer(list_item_type, context)
+        return TypedListSerializer(list_item_type, context, options)
     elif origin_type is dict:
         key_type, value_type = typing.get_args(typ)
         if key_type is str:
-            return TypedStringDictSerializer(value_type, context)
+            return TypedStringDictSerializer(value_type, context, options)
         elif issubclass(key_type, enum.Enum):
-            return TypedEnumDictSerializer(key_type, value_type, context)
+            return TypedEnumDictSerializer(key_type, value_type, context, options)
     elif origin_type is set:
         (set_member_type,) = typing.get_args(typ)  # unpack single tuple element
-        return TypedSetSerializer(set_member_type, context)
+        return TypedSetSerializer(set_member_type, context, options)
     elif origin_type is tuple:
-        return TypedTupleSerializer(typing.get_args(typ), context)
+        return TypedTupleSerializer(typing.get_args(typ), context, options)
     elif origin_type is Union:
-        return UnionSerializer()
+        return UnionSerializer(options)
     elif origin_type is Literal:
-        return LiteralSerializer(typing.get_args(typ), context)
+        return LiteralSerializer(typing.get_args(typ), context, options)
 
     if is_type_annotated(typ):
-        return create_serializer(unwrap_annotated_type(typ))
+        discriminator = get_annotation(typ, Discriminator)
+        if discriminator is not None:
+            return TaggedUnionSerializer(
+                typing.get_args(unwrap_annotated_type(typ)), discriminator.property_name, options
+            )
+        return create_serializer(unwrap_annotated_type(typ), options=options)
 
     # check if object has custom serialization method
     convert_func = getattr(typ, "to_json", None)
@@ -500,10 +1126,13 @@ def _create_serializer(typ: TypeLike, context: Optional[ModuleType]) -> Serializ
     if is_type_enum(typ):
         return EnumSerializer()
     if is_dataclass_type(typ):
-        return DataclassSerializer(typ, context)
+        if options.compiled:
+            return CompiledDataclassSerializer(typ, context, options)
+        else:
+            return DataclassSerializer(typ, context, options)
     if is_named_tuple_type(typ):
         if getattr(typ, "__annotations__", None):
-            return TypedNamedTupleSerializer(typ, context)
+            return TypedNamedTupleSerializer(typ, context, options)
         else:
             return UntypedNamedTupleSerializer(typ)
 
@@ -512,7 +1141,7 @@ def _create_serializer(typ: TypeLike, context: Optional[ModuleType]) -> Serializ
         raise TypeError(f"object of type {typ} cannot be represented in JSON")
 
     if get_resolved_hints(typ):
-        return TypedClassSerializer(typ, context)
+        return TypedClassSerializer(typ, context, options)
     else:
         return UntypedClassSerializer()
 
@@ -530,6 +1159,19 @@ def object_to_json(obj: Any) -> JsonType:
     * Objects with properties (including data class types) are converted to a dictionaries of key-value pairs.
     """
 
-    typ: type = type(obj)
-    generator = create_serializer(typ)
-    return generator.generate(obj)
+    return _DYNAMIC_SERIALIZER.generate(obj)
+
+
+def object_to_default(obj: Any) -> Any:
+    """
+    Converts a Python object to a representation that the JSON encoder in the standard library can consume.
+
+    Meant to be used as the `default` hook of `json.dumps`, which invokes the function for objects it cannot
+    serialize natively. Data classes are converted to a shallow dictionary whose values of type `list`, `dict`,
+    `str`, `int` or `float` are passed to the encoder as-is, such that they are written without Python-level calls.
+    """
+
+    return _DYNAMIC_SERIALIZER.default(obj)
+
+
+_NATIVE_TYPES: frozenset[type] = frozenset([type(None), bool, int, float, str])
@@ -3,9 +3,9 @@ import enum
 import uuid
 from collections import namedtuple
 from dataclasses import dataclass, field
-from typing import Annotated, Literal, NamedTuple, Optional
+from typing import Annotated, Literal, NamedTuple, Optional, Union
 
-from strong_typing.auxiliary import IntegerRange, MaxLength, Precision
+from strong_typing.auxiliary import Discriminator, IntegerRange, Interned, MaxLength, Precision, Tag
 from strong_typing.core import JsonType
 from strong_typing.schema import json_schema_type
 
@@ -144,6 +144,15 @@ class SimpleDerivedClass(SimpleDataclass):
     extra_optional_value: Optional[str] = "value"
 
 
+@dataclass
+class BaseClassWrapper:
+    "A data class with fields of a base class type that may hold instances of a derived class."
+
+    value: SimpleDataclass
+    values: list[SimpleDataclass]
+    mapping: dict[str, SimpleDataclass]
+
+
 @dataclass
 class MultipleInheritanceDerivedClass(SimpleDataclass, CompositeDataclass):
     extra_int_value: int = 0
@@ -206,6 +215,71 @@ class ClassC:
     type: Literal["C"]
 
 
+@dataclass
+class Circle:
+    radius: float
+
+
+@dataclass
+class Square:
+    side: float
+
+
+@dataclass
+class Polygon:
+    shape: Literal["polygon", "triangle"]
+    vertices: list[tuple[float, float]]
+
+
+Shape = Annotated[
+    Union[Annotated[Circle, Tag("circle")], Annotated[Square, Tag("square")], Polygon],
+    Discriminator("shape"),
+]
+
+
+@dataclass
+class Drawing:
+    shapes: list[Shape]
+
+
+@dataclass(frozen=True)
+class Currency:
+    "An immutable value object that recurs in documents."
+
+    code: str
+    decimals: Union[int, float] = 2
+
+
+@dataclass(frozen=True)
+class Stamp:
+    "An immutable value object with fields whose values may compare equal but hold different data."
+
+    at: datetime.datetime
+    weight: float = 1.0
+
+
+@dataclass(frozen=True)
+class FrozenListWrapper:
+    "A frozen data class with a mutable member."
+
+    values: list[int]
+
+
+@dataclass
+class Price:
+    amount: float
+    currency: Currency
+
+
+@dataclass
+class Address:
+    "A record with low-cardinality string fields."
+
+    country: Annotated[str, Interned()]
+    status: Optional[Annotated[str, Interned()]]
+    labels: dict[str, str]
+
+
 @json_schema_type
 @dataclass
 class BinaryTree:
@@ -1,30 +1,68 @@
+import concurrent.futures
+import dataclasses
 import datetime
+import io
 import ipaddress
+import json
+import pickle
 import sys
+import typing
 import unittest
 import uuid
-from typing import Literal, Optional, Union
+from dataclasses import dataclass
+from typing import Annotated, Literal, Optional, Union
 
+from strong_typing.auxiliary import Interned
 from strong_typing.core import JsonType
+from strong_typing.deserializer import (
+    FAILURE,
+    AdaptiveUnionDeserializer,
+    CachingDeserializer,
+    FrozenDataclassDeserializer,
+    MessageRegistry,
+    TaggedUnionDeserializer,
+    create_deserializer,
+)
 from strong_typing.exception import JsonKeyError, JsonTypeError, JsonValueError
-from strong_typing.serialization import json_to_generic, json_to_object, object_to_json
+from strong_typing.serialization import (
+    DeserializerOptions,
+    TypedParser,
+    json_to_generic,
+    json_to_lazy,
+    json_to_object,
+    json_to_object_many,
+    load_array,
+    load_lines,
+    object_to_json,
+)
 
 from .sample_types import (
     UID,
+    Address,
     BinaryValueWrapper,
+    Circle,
     ClassA,
     ClassB,
     ClassC,
+    CompositeDataclass,
+    Currency,
+    Drawing,
+    FrozenListWrapper,
     FrozenValueWrapper,
     LiteralWrapper,
     NestedDataclass,
     NestedGenericType,
     NestedJson,
     OptionalValueWrapper,
+    Polygon,
+    Price,
+    Shape,
     Side,
     SimpleDataclass,
     SimpleDerivedClass,
     SimpleValueWrapper,
+    Square,
+    Stamp,
     Suit,
 )
 
@@ -115,12 +153,47 @@ class TestDeserialization(unittest.TestCase):
         with self.assertRaises(JsonValueError):
             json_to_object(datetime.timedelta, "P1M")
 
+    def test_deserialization_uuid(self) -> None:
+        expected = uuid.UUID("f81d4fae-7dec-11d0-a765-00a0c91e6bf6")
+        for value in [
+            "f81d4fae-7dec-11d0-a765-00a0c91e6bf6",
+            "F81D4FAE-7DEC-11D0-A765-00A0C91E6BF6",
+            "{f81d4fae-7dec-11d0-a765-00a0c91e6bf6}",
+            "urn:uuid:f81d4fae-7dec-11d0-a765-00a0c91e6bf6",
+            "f81d4fae7dec11d0a76500a0c91e6bf6",
+        ]:
+            with self.subTest(value=value):
+                obj = json_to_object(uuid.UUID, value)
+                self.assertEqual(obj, expected)
+                self.assertEqual(hash(obj), hash(expected))
+                self.assertEqual(str(obj), str(expected))
+
+        for value in [
+            "f81d4fae-7dec-11d0-a765-00a0c91e6bfg",
+            "f81d4fae-7dec-11d0-a765+00a0c91e6bf6",
+        ]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    json_to_object(uuid.UUID, value)
+
     def test_deserialization_class(self) -> None:
         self.assertEqual(json_to_object(SimpleValueWrapper, {"value": 42}), SimpleValueWrapper(42))
         self.assertEqual(
             json_to_object(FrozenValueWrapper, {"value": 42}),
             FrozenValueWrapper(42),
         )
+        self.assertEqual(json_to_object(SimpleValueWrapper, {}), SimpleValueWrapper())
+        self.assertEqual(json_to_object(SimpleValueWrapper, {"value": None}), SimpleValueWrapper())
+        self.assertEqual(json_to_object(SimpleDataclass, {"float_value": 23}), SimpleDataclass(float_value=23.0))
+
+        with self.assertRaises(JsonKeyError):
+            json_to_object(FrozenValueWrapper, {})
+        with self.assertRaises(JsonValueError):
+            json_to_object(FrozenValueWrapper, {"value": None})
+        with self.assertRaises(JsonTypeError):
+            json_to_object(FrozenValueWrapper, {"value": "string"})
+        with self.assertRaises(JsonTypeError):
+            json_to_object(FrozenValueWrapper, [42])
 
     def test_deserialization_composite(self) -> None:
         self.assertEqual(json_to_object(UID, "1.2.3.4567.8900"), UID("1.2.3.4567.8900"))
@@ -173,6 +246,397 @@ class TestDeserialization(unittest.TestCase):
         with self.assertRaises(JsonKeyError):
             json_to_object(OptionalValueWrapper, {"value": 23, "extra": 42})
 
+    def test_deserialization_options(self) -> None:
+        data: JsonType = {"value": 23, "extra": 42}
+        lenient = DeserializerOptions(skip_unassigned=True)
+        strict = DeserializerOptions(skip_unassigned=False)
+
+        self.assertEqual(json_to_object(SimpleValueWrapper, data, options=lenient), SimpleValueWrapper(23))
+        with self.assertRaises(JsonKeyError):
+            json_to_object(SimpleValueWrapper, data, options=strict)
+        with self.assertRaises(JsonKeyError):
+            json_to_object(SimpleValueWrapper, data)
+        self.assertEqual(json_to_object(SimpleValueWrapper, data, options=lenient), SimpleValueWrapper(23))
+
+        self.assertIs(
+            create_deserializer(SimpleValueWrapper, options=DeserializerOptions(skip_unassigned=True)),
+            create_deserializer(SimpleValueWrapper, options=lenient),
+        )
+        self.assertIsNot(
+            create_deserializer(SimpleValueWrapper, options=lenient),
+            create_deserializer(SimpleValueWrapper, options=strict),
+        )
+
+    def test_deserialization_error(self) -> None:
+        with self.assertRaises(JsonTypeError) as cm:
+            json_to_object(list[int], "string")
+        self.assertEqual(str(cm.exception), "type `list[int]` expects JSON `array` data but instead received: string")
+
+        with self.assertRaises(JsonKeyError) as key_cm:
+            json_to_generic(Union[int, SimpleValueWrapper], {"key": "value"})
+        self.assertEqual(
+            str(key_cm.exception),
+            "type `Union[int, SimpleValueWrapper]` could not be instantiated from: {'key': 'value'}",
+        )
+
+        self.assertEqual(str(JsonValueError("a {} message")), "a {} message")
+        self.assertEqual(str(JsonValueError("a {} message", "formatted")), "a formatted message")
+
+    def test_deserialization_probe(self) -> None:
+        parser = create_deserializer(FrozenValueWrapper)
+        self.assertEqual(parser.try_parse({"value": 42}), FrozenValueWrapper(42))
+        self.assertIs(parser.try_parse([42]), FAILURE)
+        self.assertIs(parser.try_parse({}), FAILURE)
+        self.assertIs(parser.try_parse({"value": 42, "extra": 23}), FAILURE)
+        with self.assertRaises(JsonTypeError):
+            parser.try_parse({"value": "string"})
+
+        self.assertIs(create_deserializer(int).try_parse("string"), FAILURE)
+        self.assertIs(create_deserializer(Literal["a", "b"]).try_parse("c"), FAILURE)
+        self.assertIs(create_deserializer(Union[int, str]).try_parse(4.5), FAILURE)
+
+    def test_deserialization_trusted(self) -> None:
+        options = DeserializerOptions(trusted=True)
+
+        for obj in [SimpleDataclass(), SimpleDerivedClass(), NestedDataclass(), FrozenValueWrapper(42)]:
+            with self.subTest(type=type(obj).__name__):
+                self.assertEqual(json_to_object(type(obj), object_to_json(obj), options=options), obj)
+
+        self.assertEqual(json_to_object(list[int], [1, 2, 3], options=options), [1, 2, 3])
+        self.assertEqual(json_to_object(set[str], ["a", "b"], options=options), {"a", "b"})
+        self.assertEqual(json_to_object(dict[str, float], {"a": 1}, options=options), {"a": 1.0})
+        self.assertEqual(json_to_object(dict[Side, int], {"L": 1}, options=options), {Side.LEFT: 1})
+
+        # unrecognized properties are not looked for
+        self.assertEqual(json_to_object(SimpleValueWrapper, {"value": 1, "extra": 2}, options=options).value, 1)
+
+        # member types of a union are still told apart by value type
+        self.assertEqual(
+            json_to_generic(Union[FrozenValueWrapper, LiteralWrapper], {"value": "val1"}, options=options),
+            LiteralWrapper("val1"),
+        )
+
+        @dataclass
+        class ListMember:
+            x: list[str]
+
+        @dataclass
+        class StringMember:
+            x: str
+
+        @dataclass
+        class UnionWrapper:
+            v: Union[ListMember, StringMember]
+
+        # containers are told apart from other types in member types of a union
+        for trusted in [False, True]:
+            with self.subTest(trusted=trusted):
+                trust_options = DeserializerOptions(trusted=trusted)
+                self.assertEqual(
+                    json_to_object(UnionWrapper, {"v": {"x": "ab"}}, options=trust_options),
+                    UnionWrapper(StringMember("ab")),
+                )
+                self.assertEqual(
+                    json_to_object(UnionWrapper, {"v": {"x": ["ab"]}}, options=trust_options),
+                    UnionWrapper(ListMember(["ab"])),
+                )
+                self.assertEqual(json_to_generic(Union[list[str], str], "ab", options=trust_options), "ab")
+                self.assertEqual(json_to_generic(Union[dict[str, int], str], "ab", options=trust_options), "ab")
+                self.assertEqual(json_to_generic(Union[set[int], list[str]], ["ab"], options=trust_options), ["ab"])
+
+    def test_deserialization_value_cache(self) -> None:
+        options = DeserializerOptions(value_cache_size=2)
+        values: list[JsonType] = ["f81d4fae-7dec-11d0-a765-00a0c91e6bf6", "4d6e4fa8-0d4a-4f0e-8e34-5d0ab3b1b5a4"]
+
+        objs = json_to_object(list[uuid.UUID], values + values, options=options)
+        self.assertEqual(objs, [uuid.UUID(str(value)) for value in values + values])
+        self.assertIs(objs[0], objs[2])
+        self.assertIs(objs[1], objs[3])
+
+        timestamps = json_to_object(list[datetime.datetime], ["2024-01-01T00:00:00Z"] * 3, options=options)
+        self.assertIs(timestamps[0], timestamps[2])
+
+        suits = json_to_object(dict[str, Suit], {"a": 1, "b": 1}, options=options)
+        self.assertIs(suits["a"], Suit.Diamonds)
+        self.assertIs(suits["b"], Suit.Diamonds)
+
+        parser = create_deserializer(uuid.UUID, options=options)
+        self.assertIsInstance(parser, CachingDeserializer)
+        info = parser.cache_info()  # type: ignore[attr-defined]
+        self.assertEqual((info.hits, info.misses, info.maxsize), (2, 2, 2))
+
+        # invalid values are not cached
+        with self.assertRaises(JsonTypeError):
+            json_to_object(uuid.UUID, 23, options=options)
+        with self.assertRaises(ValueError):
+            json_to_object(uuid.UUID, "invalid", options=options)
+        with self.assertRaises(ValueError):
+            json_to_object(uuid.UUID, "invalid", options=options)
+        self.assertEqual(parser.cache_info().currsize, 2)  # type: ignore[attr-defined]
+
+        # objects are not shared when the cache is disabled
+        objs = json_to_object(list[uuid.UUID], values + values)
+        self.assertIsNot(objs[0], objs[2])
+
+    def test_deserialization_interned(self) -> None:
+        def fresh(s: str) -> str:
+            "Returns a string with a new identity."
+
+            return "".join(list(s))
+
+        items: list[JsonType] = [
+            {"country": fresh("HU"), "status": fresh("active"), "labels": {fresh("kind"): fresh("home")}}
+            for _ in range(2)
+        ]
+        first, second = json_to_object(list[Address], items)
+        self.assertEqual(first, Address("HU", "active", {"kind": "home"}))
+        self.assertIs(first.country, second.country)
+        self.assertIs(first.status, second.status)
+        self.assertIsNot(first.labels["kind"], second.labels["kind"])
+
+        with self.assertRaises(JsonTypeError):
+            json_to_object(Address, {"country": 1, "status": None, "labels": {}})
+        with self.assertRaises(TypeError):
+            create_deserializer(Annotated[int, Interned()])
+
+        # keys of dictionaries with `str` keys
+        data: list[JsonType] = [{fresh("key"): 1}, {fresh("key"): 2}]
+        for options, interned in [(DeserializerOptions(), False), (DeserializerOptions(intern_keys=True), True)]:
+            for opts in [options, dataclasses.replace(options, trusted=True)]:
+                with self.subTest(options=opts):
+                    first_dict, second_dict = json_to_object(list[dict[str, int]], data, options=opts)
+                    self.assertEqual((first_dict, second_dict), ({"key": 1}, {"key": 2}))
+                    self.assertEqual(next(iter(first_dict)) is next(iter(second_dict)), interned)
+
+    def test_deserialization_shared_frozen(self) -> None:
+        options = DeserializerOptions(frozen_cache_size=2)
+        data: list[JsonType] = [
+            {"amount": 1.5, "currency": {"code": "EUR"}},
+            {"amount": 2.5, "currency": {"code": "EUR"}},
+            {"amount": 3.5, "currency": {"code": "USD"}},
+            {"amount": 4.5, "currency": {"code": "EUR", "decimals": 2.0}},
+        ]
+        prices = json_to_object(list[Price], data, options=options)
+        self.assertEqual(prices, json_to_object(list[Price], data))
+        self.assertIs(prices[0].currency, prices[1].currency)
+        self.assertIsNot(prices[0].currency, prices[2].currency)
+
+        # values that compare equal but have a different type are not shared
+        self.assertEqual(prices[0].currency, prices[3].currency)
+        self.assertIsNot(prices[0].currency, prices[3].currency)
+        self.assertIsInstance(prices[3].currency.decimals, float)
+
+        # values that compare equal but hold different data are not shared
+        stamps = json_to_object(
+            list[Stamp],
+            [
+                {"at": "2024-01-01T12:00:00Z", "weight": 0.0},
+                {"at": "2024-01-01T14:00:00+02:00", "weight": 0.0},
+                {"at": "2024-01-01T12:00:00Z", "weight": -0.0},
+                {"at": "2024-01-01T12:00:00Z", "weight": 0.0},
+            ],
+            options=DeserializerOptions(frozen_cache_size=16),
+        )
+        self.assertEqual(stamps[0], stamps[1])
+        self.assertIsNot(stamps[0], stamps[1])
+        self.assertEqual(stamps[1].at.isoformat(), "2024-01-01T14:00:00+02:00")
+        self.assertIsNot(stamps[0], stamps[2])
+        self.assertEqual(str(stamps[2].weight), "-0.0")
+        self.assertIs(stamps[0], stamps[3])
+
+        # the table does not keep instances alive and its size is bounded
+        parser = create_deserializer(Currency, options=options)
+        assert isinstance(parser, FrozenDataclassDeserializer)
+        assert parser.shared_instances is not None
+        self.assertLessEqual(len(parser.shared_instances), 2)
+        del prices
+        self.assertEqual(len(parser.shared_instances), 0)
+
+        # instances with mutable members are not shared
+        wrappers = json_to_object(list[FrozenListWrapper], [{"values": [1]}, {"values": [1]}], options=options)
+        self.assertIsNot(wrappers[0], wrappers[1])
+
+        # instances are not shared by default
+        prices = json_to_object(list[Price], data)
+        self.assertIsNot(prices[0].currency, prices[1].currency)
+
+    def test_deserialization_lazy(self) -> None:
+        obj = NestedDataclass()
+        data = typing.cast(dict[str, JsonType], object_to_json(obj))
+
+        lazy_obj = json_to_lazy(NestedDataclass, data)
+        self.assertIsInstance(lazy_obj, NestedDataclass)
+        self.assertNotIn("list_value", vars(lazy_obj))
+        self.assertEqual(lazy_obj.list_value, obj.list_value)
+        self.assertIn("list_value", vars(lazy_obj))
+        self.assertIs(lazy_obj.list_value, lazy_obj.list_value)
+        self.assertNotIn("dict_value", vars(lazy_obj))
+
+        # nested data class instances are also lazy
+        self.assertIsInstance(lazy_obj.obj_value, CompositeDataclass)
+        self.assertNotIn("list_value", vars(lazy_obj.obj_value))
+
+        self.assertEqual(lazy_obj, obj)
+        self.assertEqual(obj, lazy_obj)
+        self.assertEqual(repr(lazy_obj), repr(obj))
+        self.assertEqual(object_to_json(lazy_obj), data)
+        self.assertEqual(pickle.loads(pickle.dumps(lazy_obj)), obj)
+
+        # fields of a fundamental type are parsed immediately
+        self.assertEqual(json_to_lazy(SimpleDataclass, object_to_json(SimpleDataclass())), SimpleDataclass())
+        self.assertEqual(
+            json_to_lazy(FrozenValueWrapper, {"value": 42}, options=DeserializerOptions(trusted=True)),
+            FrozenValueWrapper(42),
+        )
+
+        with self.assertRaises(JsonKeyError):
+            json_to_lazy(NestedDataclass, {"list_value": [], "dict_value": {}})
+        with self.assertRaises(JsonKeyError):
+            json_to_lazy(NestedDataclass, {**data, "extra": 1})
+
+        # invalid nested values are reported on access
+        lazy_obj = json_to_lazy(NestedDataclass, {**data, "list_value": "string"})
+        with self.assertRaises(JsonTypeError):
+            _ = lazy_obj.list_value
+
+        @dataclass(frozen=True)
+        class Validated:
+            value: int
+            values: list[int]
+
+            def __post_init__(self) -> None:
+                if self.value < 0:
+                    raise ValueError("negative value")
+
+        # frozen data classes and data classes with `__post_init__` are instantiated eagerly
+        with self.assertRaises(ValueError):
+            json_to_lazy(Validated, {"value": -1, "values": [1]})
+        options = DeserializerOptions(frozen_cache_size=16)
+        currencies = json_to_lazy(list[Currency], [{"code": "EUR"}, {"code": "EUR"}], options=options)
+        self.assertIs(currencies[0], currencies[1])
+
+        @dataclass(order=True)
+        class Ordered:
+            value: int
+            values: list[int] = dataclasses.field(compare=False)
+
+        @dataclass(eq=False)
+        class Identity:
+            values: list[int]
+
+        # comparison follows the parameters of the data class
+        self.assertEqual(json_to_lazy(Ordered, {"value": 1, "values": [1]}), Ordered(1, [2]))
+        self.assertEqual(Ordered(1, [2]), json_to_lazy(Ordered, {"value": 1, "values": [1]}))
+        self.assertLess(json_to_lazy(Ordered, {"value": 1, "values": []}), Ordered(2, []))
+        self.assertLess(Ordered(0, []), json_to_lazy(Ordered, {"value": 1, "values": []}))
+        self.assertGreaterEqual(
+            json_to_lazy(Ordered, {"value": 2, "values": []}), json_to_lazy(Ordered, {"value": 1, "values": []})
+        )
+        self.assertNotEqual(json_to_lazy(Identity, {"values": [1]}), json_to_lazy(Identity, {"values": [1]}))
+
+    def test_deserialization_projection(self) -> None:
+        obj = NestedDataclass()
+        data = object_to_json(obj)
+
+        projected = json_to_object(NestedDataclass, data, include={"list_value.value", "obj_value.dict_value"})
+        self.assertEqual(projected.list_value, obj.list_value)
+        self.assertEqual(projected.obj_value.dict_value, {"key": 42})
+        self.assertEqual(projected.obj_value.list_value, [])
+        self.assertEqual(projected.obj_value.optional_value, None)
+        self.assertIsNone(projected.dict_value)
+
+        # subtrees of excluded properties are not visited
+        self.assertEqual(
+            json_to_object(SimpleDataclass, {"int_value": 1, "guid_value": "invalid"}, include={"int_value"}),
+            SimpleDataclass(int_value=1),
+        )
+        self.assertEqual(
+            json_to_object(
+                dict[str, CompositeDataclass], {"a": {"tuple_value": [False, 1, "one"]}}, include={"tuple_value"}
+            ),
+            {"a": CompositeDataclass(tuple_value=(False, 1, "one"))},
+        )
+
+        # a path that includes a property entirely takes precedence
+        self.assertEqual(
+            json_to_object(NestedDataclass, data, include={"obj_value", "obj_value.dict_value"}).obj_value,
+            obj.obj_value,
+        )
+
+        # member types of a union that cannot apply the projection are de-serialized in full
+        self.assertEqual(
+            json_to_object(
+                list[Optional[SimpleDataclass]],
+                [{"int_value": 1, "guid_value": "invalid"}, None],
+                include={"int_value"},
+            ),
+            [SimpleDataclass(int_value=1), None],
+        )
+        self.assertEqual(
+            json_to_generic(Union[SimpleDataclass, str], "string", include={"int_value"}),
+            "string",
+        )
+        self.assertEqual(
+            json_to_object(
+                Drawing,
+                {"shapes": [{"shape": "circle", "radius": 1.0}, {"shape": "square", "side": 2.0}]},
+                include={"shapes.radius"},
+            ),
+            Drawing([Circle(1.0), Square(2.0)]),
+        )
+        with self.assertRaises(ValueError):
+            json_to_generic(Union[int, str], 1, include={"int_value"})
+
+        class Unhashable:
+            __hash__ = None  # type: ignore[assignment]
+
+        # types with unhashable metadata are not cached
+        self.assertEqual(
+            json_to_object(
+                list[Annotated[SimpleDataclass, Unhashable()]],
+                [{"int_value": 1, "guid_value": "invalid"}],
+                include={"int_value"},
+            ),
+            [SimpleDataclass(int_value=1)],
+        )
+
+        # unrecognized properties are still reported
+        with self.assertRaises(JsonKeyError):
+            json_to_object(SimpleDataclass, {"int_value": 1, "extra": 2}, include={"int_value"})
+
+        with self.assertRaises(ValueError):
+            json_to_object(SimpleDataclass, {}, include={"missing_value"})
+        with self.assertRaises(ValueError):
+            json_to_object(SimpleDataclass, {}, include={"int_value.value"})
+        with self.assertRaises(ValueError):
+            json_to_object(SimpleDataclass, {}, include={"int_value."})
+        with self.assertRaises(ValueError):
+            json_to_object(SimpleDataclass, {}, include=set())
+
+        self.assertIs(
+            create_deserializer(NestedDataclass, include=["list_value", "dict_value"]),
+            create_deserializer(NestedDataclass, include=("dict_value", "list_value")),
+        )
+
+    def test_deserialization_adaptive_union(self) -> None:
+        options = DeserializerOptions(adaptive_union=True)
+        parser = create_deserializer(Union[SimpleDataclass, SimpleValueWrapper, None], options=options)
+        self.assertIsInstance(parser, AdaptiveUnionDeserializer)
+        parser = typing.cast(AdaptiveUnionDeserializer, parser)
+        parser.reorder_interval = 4
+
+        self.assertEqual(parser.parse({"value": 1}), SimpleValueWrapper(1))
+        self.assertEqual(parser.parse({"value": 2}), SimpleValueWrapper(2))
+        self.assertEqual(parser.parse({"int_value": 3}), SimpleDataclass(int_value=3))
+        self.assertIsNone(parser.parse(None))
+        self.assertEqual(parser.hit_counts, [1, 2, 1])
+
+        # most frequent member type is tried first
+        self.assertEqual([index for index, _ in parser.member_table[dict]], [1, 0])
+        self.assertEqual(parser.parse({"int_value": 5}), SimpleDataclass(int_value=5))
+        with self.assertRaises(JsonKeyError):
+            parser.parse("string")
+
     def test_deserialization_literal(self) -> None:
         self.assertEqual(json_to_generic(Literal["val1", "val2", "val3"], "val1"), "val1")
         self.assertEqual(json_to_generic(Literal["val1", "val2", "val3"], "val3"), "val3")
@@ -208,6 +672,19 @@ class TestDeserialization(unittest.TestCase):
         with self.assertRaises(JsonKeyError):
             json_to_generic(Union[int, str], 10.23)
 
+        # order of member types is significant
+        self.assertIs(type(json_to_generic(Union[float, int], 42)), float)
+        self.assertIs(type(json_to_generic(Union[int, float], 42)), int)
+
+        # members that are not compatible with the JSON value type are skipped
+        self.assertEqual(json_to_generic(Union[Side, int], 42), 42)
+        self.assertEqual(json_to_generic(Union[Side, int], "L"), Side.LEFT)
+        self.assertEqual(json_to_generic(Union[Suit, str], "Diamonds"), "Diamonds")
+        self.assertEqual(json_to_generic(Union[uuid.UUID, list[int], None], [1, 2]), [1, 2])
+        self.assertEqual(json_to_generic(Union[Literal["one", "two"], int], 2), 2)
+        with self.assertRaises(JsonKeyError):
+            json_to_generic(Union[int, SimpleValueWrapper], "a string")
+
         # mixed (built-in and user-defined) types
         self.assertEqual(json_to_generic(Union[SimpleValueWrapper, int], 42), 42)
         self.assertEqual(json_to_generic(Union[int, SimpleValueWrapper], 42), 42)
@@ -283,6 +760,171 @@ class TestDeserialization(unittest.TestCase):
             ClassB(name="b", type="B", value="string"),
         )
 
+    def test_deserialization_tagged_union(self) -> None:
+        parser = create_deserializer(Union[ClassA, ClassB, ClassC])
+        assert isinstance(parser, TaggedUnionDeserializer)
+        self.assertEqual(parser.disambiguating_properties, ("name", "type"))
+
+        with self.assertRaises(JsonTypeError):
+            parser.parse({"name": "D", "type": "D", "value": "string"})
+        with self.assertRaises(JsonTypeError):
+            parser.parse({"name": ["A"], "type": "A", "value": "string"})
+        with self.assertRaises(JsonTypeError):
+            parser.parse({"value": "string"})
+
+        # explicitly declared discriminator property
+        self.assertEqual(json_to_generic(Shape, {"shape": "circle", "radius": 1.0}), Circle(1.0))
+        self.assertEqual(json_to_generic(Shape, {"shape": "square", "side": 2.0}), Square(2.0))
+        self.assertEqual(
+            json_to_generic(Shape, {"shape": "triangle", "vertices": [[0, 0], [1, 0], [0, 1]]}),
+            Polygon("triangle", [(0, 0), (1, 0), (0, 1)]),
+        )
+        with self.assertRaises(JsonTypeError):
+            json_to_generic(Shape, {"shape": "ellipse", "radius": 1.0})
+        with self.assertRaises(JsonTypeError):
+            json_to_generic(Shape, {"radius": 1.0})
+
+        drawing = Drawing([Circle(1.0), Square(2.0), Polygon("polygon", [(0, 0), (1, 1)])])
+        self.assertEqual(json_to_object(Drawing, object_to_json(drawing)), drawing)
+
+    def test_message_registry(self) -> None:
+        registry = MessageRegistry("name")
+        self.assertIs(registry.register(ClassA), ClassA)
+        registry.register(ClassB)
+
+        self.assertEqual(
+            registry.parse({"name": "a", "type": "A", "value": "string"}), ClassA(name="a", type="A", value="string")
+        )
+        self.assertEqual(
+            registry.parse({"name": "B", "type": "B", "value": "string"}), ClassB(name="B", type="B", value="string")
+        )
+        with self.assertRaises(JsonTypeError):
+            registry.parse({"name": "C", "type": "C"})
+
+        # types may be registered after messages have been parsed
+        registry.register(ClassC)
+        self.assertEqual(registry.parse({"name": "C", "type": "C"}), ClassC(name="C", type="C"))
+
+        with self.assertRaises(JsonTypeError):
+            registry.parse({"name": ["A"], "type": "A", "value": "string"})
+        with self.assertRaises(JsonTypeError):
+            registry.parse(["A"])
+        with self.assertRaises(TypeError):
+            registry.register(SimpleDataclass)
+
+        @dataclass
+        class ClassD:
+            name: Literal["D", "a"]
+
+        # types that share a discriminator value
+        with self.assertRaises(TypeError):
+            registry.register(ClassD)
+
+    def test_deserialization_cache(self) -> None:
+        self.assertIs(create_deserializer(list[SimpleValueWrapper]), create_deserializer(list[SimpleValueWrapper]))
+        self.assertIs(create_deserializer(Optional[ClassA]), create_deserializer(Optional[ClassA]))
+        self.assertIs(create_deserializer(Literal[1, 2]), create_deserializer(Literal[1, 2]))
+        self.assertIsNot(create_deserializer(Literal[1]), create_deserializer(Literal[True]))
+        self.assertIsNot(create_deserializer(Union[int, str]), create_deserializer(Union[str, int]))
+
+    def test_typed_parser(self) -> None:
+        parser = TypedParser(SimpleValueWrapper)
+        self.assertEqual(parser.parse({"value": 42}), SimpleValueWrapper(42))
+        self.assertEqual(
+            parser.parse_many([{"value": 1}, {}, {"value": 3}]),
+            [SimpleValueWrapper(1), SimpleValueWrapper(), SimpleValueWrapper(3)],
+        )
+        with self.assertRaises(JsonTypeError):
+            parser.parse({"value": "string"})
+
+        lenient = TypedParser(SimpleValueWrapper, options=DeserializerOptions(skip_unassigned=True))
+        self.assertEqual(lenient.parse({"value": 42, "extra": 23}), SimpleValueWrapper(42))
+
+        # forward reference evaluated in the caller's module when the generic class is subscripted
+        forward = TypedParser[SimpleValueWrapper]("SimpleValueWrapper")  # type: ignore[arg-type]
+        self.assertEqual(forward.parse({"value": 42}), SimpleValueWrapper(42))
+
+    def test_load_lines(self) -> None:
+        with io.StringIO('{"value": 1}\n\n{}\n{"value": 3}') as f:
+            self.assertEqual(
+                list(load_lines(SimpleValueWrapper, f)),
+                [SimpleValueWrapper(1), SimpleValueWrapper(), SimpleValueWrapper(3)],
+            )
+
+        with io.StringIO('{"value": 1}\n{"value": "string"}\n') as f:
+            items = load_lines(SimpleValueWrapper, f)
+            self.assertEqual(next(items), SimpleValueWrapper(1))
+            with self.assertRaises(JsonTypeError):
+                next(items)
+
+    def test_load_array(self) -> None:
+        items = [SimpleValueWrapper(k) for k in range(1, 20)] + [SimpleValueWrapper(123456789)]
+        text = '[ {"value": 1}, ' + ", ".join(f'{{"value":{k}}}' for k in range(2, 20)) + ',\n{"value": 123456789}\n]\n'
+        for chunk_size in [1, 2, 7, 65536]:
+            with self.subTest(chunk_size=chunk_size):
+                with io.StringIO(text) as f:
+                    self.assertEqual(list(load_array(SimpleValueWrapper, f, chunk_size=chunk_size)), items)
+                with io.BytesIO(text.encode("utf-8")) as f:
+                    self.assertEqual(list(load_array(SimpleValueWrapper, f, chunk_size=chunk_size)), items)
+
+        # multi-byte characters split across chunks
+        data = json.dumps(["\u00e1rv\u00edzt\u0171r\u0151", "\U0001f600"], ensure_ascii=False).encode("utf-8")
+        for chunk_size in [1, 3, 65536]:
+            self.assertEqual(
+                list(load_array(str, data, chunk_size=chunk_size)),
+                ["\u00e1rv\u00edzt\u0171r\u0151", "\U0001f600"],
+            )
+
+        # numbers split across chunks after a decimal point or an exponent marker
+        data = b"[1.5, 2.25, 3e5, -4.5E-2, 10]"
+        for chunk_size in range(1, len(data) + 1):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    list(load_array(float, io.BytesIO(data), chunk_size=chunk_size)),
+                    [1.5, 2.25, 3e5, -4.5e-2, 10.0],
+                )
+
+        # literals and escape sequences split across chunks
+        data = json.dumps([True, False, 'a\u00e9\n"\U0001f600'] * 2).encode("utf-8")
+        for chunk_size in range(1, 24):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    list(load_array(Union[bool, str], io.BytesIO(data), chunk_size=chunk_size)),  # type: ignore[arg-type]
+                    [True, False, 'a\u00e9\n"\U0001f600'] * 2,
+                )
+
+        # malformed input is reported without reading the rest of the input
+        for malformed in [b"[1, tru, 3", b"[1, 2x, 3", b'[1, {"a" 1}, 3', b'[1, "a\x01", 3']:
+            with self.subTest(malformed=malformed):
+                with io.BytesIO(malformed + b", 3" * 100000 + b"]") as f:
+                    with self.assertRaises(json.JSONDecodeError):
+                        list(load_array(int, f, chunk_size=16))
+                    self.assertLess(f.tell(), 1024)
+
+        self.assertEqual(list(load_array(int, b" [ ] ")), [])
+        self.assertEqual(list(load_array(list[int], bytearray(b"[[1, 2], [], [3]]"))), [[1, 2], [], [3]])
+
+        for invalid in [b"", b"{}", b"[1, 2", b"[1 2]", b"[1,]", b"[1] 2"]:
+            with self.subTest(invalid=invalid):
+                with self.assertRaises(json.JSONDecodeError):
+                    list(load_array(int, invalid, chunk_size=2))
+
+        with self.assertRaises(JsonTypeError):
+            list(load_array(int, b'[1, "two"]'))
+
+    def test_parallel_deserialization(self) -> None:
+        items = [f'{{"value": {k}}}' for k in range(10)]
+        expected = [SimpleValueWrapper(k) for k in range(10)]
+
+        self.assertEqual(json_to_object_many(SimpleValueWrapper, items, chunk_size=3), expected)
+        self.assertEqual(json_to_object_many(SimpleValueWrapper, [item.encode("utf-8") for item in items]), expected)
+        self.assertEqual(json_to_object_many(list[int], ["[1, 2]", "[]"]), [[1, 2], []])
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(json_to_object_many(SimpleValueWrapper, items, executor=executor, chunk_size=4), expected)
+
+        with self.assertRaises(JsonTypeError):
+            json_to_object_many(SimpleValueWrapper, ['{"value": "string"}'])
+
     def test_deserialization_recursive(self) -> None:
         self.assertEqual(json_to_object(NestedJson, {"json": []}), NestedJson([]))
         self.assertEqual(json_to_object(NestedJson, {"json": {}}), NestedJson({}))
@@ -5,7 +5,7 @@ import unittest
 import uuid
 from dataclasses import dataclass
 
-from strong_typing.serialization import json_to_object, object_to_json
+from strong_typing.serialization import SerializerOptions, json_to_object, object_to_json
 
 from .timer import Timer
 
@@ -100,6 +100,18 @@ class TestPerformance(unittest.TestCase):
 
         self.assertListEqual(original_items, deserialized_items)
 
+    def test_compiled_serialization(self) -> None:
+        original_items = [create_randomized_object() for k in range(100000)]
+
+        with Timer("serialization (interpreted)"):
+            interpreted_items = [object_to_json(item) for item in original_items]
+
+        options = SerializerOptions(compiled=True)
+        with Timer("serialization (compiled)"):
+            compiled_items = [object_to_json(item, options=options) for item in original_items]
+
+        self.assertListEqual(interpreted_items, compiled_items)
+
 
 if __name__ == "__main__":
     unittest.main()
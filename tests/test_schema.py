@@ -4,7 +4,7 @@ import unittest
 import uuid
 from typing import Annotated, Any, Union
 
-from strong_typing.auxiliary import IntegerRange, Precision, int32, uint64
+from strong_typing.auxiliary import Discriminator, IntegerRange, Precision, Tag, int32, uint64
 from strong_typing.core import JsonType
 from strong_typing.schema import JsonSchemaGenerator, SchemaOptions, Validator, classdef_to_schema, get_class_docstrings
 
@@ -12,10 +12,12 @@ from .sample_types import (
     UID,
     AnnotatedSimpleDataclass,
     BinaryTree,
+    Circle,
     Side,
     SimpleDataclass,
     SimpleTypedNamedTuple,
     SimpleValueWrapper,
+    Square,
     Suit,
     ValueExample,
 )
@@ -284,6 +286,33 @@ class TestSchema(unittest.TestCase):
             },
         )
 
+    def test_tagged_union(self) -> None:
+        options = SchemaOptions(use_descriptions=False)
+        generator = JsonSchemaGenerator(options)
+        self.assertEqual(
+            generator.type_to_schema(
+                Annotated[
+                    Union[Annotated[Circle, Tag("circle")], Annotated[Square, Tag("square")]], Discriminator("shape")
+                ]
+            ),
+            {
+                "oneOf": [
+                    {
+                        "type": "object",
+                        "properties": {"shape": {"const": "circle"}, "radius": {"type": "number"}},
+                        "additionalProperties": False,
+                        "required": ["shape", "radius"],
+                    },
+                    {
+                        "type": "object",
+                        "properties": {"shape": {"const": "square"}, "side": {"type": "number"}},
+                        "additionalProperties": False,
+                        "required": ["shape", "side"],
+                    },
+                ]
+            },
+        )
+
     def test_fixed_width(self) -> None:
         options = SchemaOptions(use_descriptions=True)
         generator = JsonSchemaGenerator(options)
@@ -1,4 +1,6 @@
+import concurrent.futures
 import datetime
+import io
 import ipaddress
 import typing
 import unittest
@@ -7,11 +9,24 @@ import uuid
 from strong_typing.core import JsonType
 from strong_typing.exception import JsonValueError
 from strong_typing.schema import validate_object
-from strong_typing.serialization import object_to_json
+from strong_typing.serialization import (
+    SerializerOptions,
+    TypedWriter,
+    dump_lines,
+    json_dump_string,
+    object_dump,
+    object_dump_string,
+    object_to_json,
+    object_to_json_bytes,
+    object_to_json_many,
+    object_to_json_string,
+)
+from strong_typing.serializer import create_serializer
 
 from .sample_types import (
     UID,
     AnnotatedSimpleDataclass,
+    BaseClassWrapper,
     BinaryValueWrapper,
     CompositeDataclass,
     FrozenValueWrapper,
@@ -21,6 +36,7 @@ from .sample_types import (
     NestedJson,
     Side,
     SimpleDataclass,
+    SimpleDerivedClass,
     SimpleTypedClass,
     SimpleTypedNamedTuple,
     SimpleUntypedClass,
@@ -127,12 +143,47 @@ class TestSerialization(unittest.TestCase):
             {"int_value": 42, "str_value": "string"},
         )
 
+    def test_serialization_untyped_class(self) -> None:
+        obj = SimpleUntypedClass(42, "string")
+        self.assertEqual(object_to_json(obj), {"int_value": 42, "str_value": "string"})
+
+        # attributes added to an instance
+        obj.extra_value = [1, 2]  # type: ignore[attr-defined]
+        obj.bound_method = self.test_serialization_untyped_class  # type: ignore[attr-defined]
+        self.assertEqual(object_to_json(obj), {"extra_value": [1, 2], "int_value": 42, "str_value": "string"})
+        self.assertEqual(object_to_json(SimpleUntypedClass(23, "other")), {"int_value": 23, "str_value": "other"})
+
+        # attributes reset to None are skipped
+        obj.int_value = None  # type: ignore[assignment]
+        self.assertEqual(object_to_json(obj), {"extra_value": [1, 2], "str_value": "string"})
+
     def test_serialization_collection(self) -> None:
         self.assertEqual(object_to_json([1, 2, 3]), [1, 2, 3])
         self.assertEqual(object_to_json({"a": 1, "b": 2, "c": 3}), {"a": 1, "b": 2, "c": 3})
         self.assertEqual(object_to_json(set([1, 2, 3])), [1, 2, 3])
         self.assertEqual(object_to_json(tuple([1, "two"])), [1, "two"])
 
+    def test_serialization_dynamic(self) -> None:
+        """Test serializing values whose type is only known at run time."""
+
+        value = {
+            "a": 1,
+            "b": [2.5, None, True, "c"],
+            "d": {"e": uuid.UUID("f81d4fae-7dec-11d0-a765-00a0c91e6bf6")},
+            "f": (datetime.date(2020, 1, 1), SimpleValueWrapper()),
+        }
+        expected = {
+            "a": 1,
+            "b": [2.5, None, True, "c"],
+            "d": {"e": "f81d4fae-7dec-11d0-a765-00a0c91e6bf6"},
+            "f": ["2020-01-01", {"value": 23}],
+        }
+        self.assertEqual(object_to_json(value), expected)
+        self.assertEqual(create_serializer(dict[str, typing.Any]).generate(value), expected)
+        self.assertEqual(create_serializer(list[typing.Any]).generate([1, value]), [1, expected])
+        self.assertEqual(create_serializer(typing.Any).generate(SimpleValueWrapper()), {"value": 23})
+        self.assertEqual(object_to_json_string([1, "a", None, datetime.date(2020, 1, 1)]), '[1,"a",null,"2020-01-01"]')
+
     def test_serialization_composite(self) -> None:
         self.assertEqual(object_to_json(UID("1.2.3.4567.8900")), "1.2.3.4567.8900")
         self.assertEqual(object_to_json(BinaryValueWrapper(bytes([65, 78]))), {"value": "QU4="})
@@ -227,6 +278,182 @@ class TestSerialization(unittest.TestCase):
             },
         )
 
+    def test_compiled_serialization(self) -> None:
+        """Test object serialization with functions generated specifically for a data class."""
+
+        options = SerializerOptions(compiled=True)
+        for obj in [
+            SimpleDataclass(),
+            AnnotatedSimpleDataclass(),
+            CompositeDataclass(list_value=["a"], dict_value={"key": 42}, optional_value="value"),
+            MultipleInheritanceDerivedClass(),
+            NestedDataclass(),
+            LiteralWrapper("val1"),
+            BinaryValueWrapper(bytes([65, 78])),
+        ]:
+            with self.subTest(obj=obj):
+                self.assertEqual(object_to_json(obj, options=options), object_to_json(obj))
+
+    def test_projected_serialization(self) -> None:
+        """Test writing only a selection of properties."""
+
+        obj = NestedDataclass()
+        for options in [SerializerOptions(), SerializerOptions(compiled=True)]:
+            with self.subTest(options=options):
+                self.assertEqual(
+                    object_to_json(obj, options=options, include=["list_value.value", "dict_value"]),
+                    {
+                        "list_value": [{"value": 1}, {"value": 2}],
+                        "dict_value": {"a": {"value": 3}, "b": {"value": 4}, "c": {"value": 5}},
+                    },
+                )
+                self.assertEqual(
+                    object_to_json(obj, options=options, exclude=["obj_value", "dict_value.value"]),
+                    {"list_value": [{"value": 1}, {"value": 2}], "dict_value": {"a": {}, "b": {}, "c": {}}},
+                )
+                self.assertEqual(
+                    object_to_json_string(obj, options=options, include=["list_value"]),
+                    '{"list_value":[{"value":1},{"value":2}]}',
+                )
+                self.assertEqual(
+                    object_to_json_bytes(obj, options=options, include=["list_value"], exclude=["list_value.value"]),
+                    b'{"list_value":[{},{}]}',
+                )
+                self.assertEqual(len(object_to_json(obj, options=options)), 3)  # type: ignore[arg-type]
+
+        # items of a top-level container are written with the projection applied
+        self.assertEqual(
+            object_to_json([NestedDataclass(), None, NestedDataclass()], include=["list_value.value"]),
+            [{"list_value": [{"value": 1}, {"value": 2}]}, None, {"list_value": [{"value": 1}, {"value": 2}]}],
+        )
+        self.assertEqual(
+            object_to_json_string({"a": SimpleDataclass(), "b": None}, exclude=["str_value", "guid_value"]),
+            json_dump_string({"a": object_to_json(SimpleDataclass(), exclude=["str_value", "guid_value"]), "b": None}),
+        )
+
+        with self.assertRaises(ValueError):
+            object_to_json(obj, include=["list_value.missing"])
+        with self.assertRaises(ValueError):
+            object_to_json(obj, exclude=["missing"])
+
+        # nested properties of a value that is not written as a JSON object
+        with self.assertRaises(ValueError):
+            object_to_json(SimpleDataclass(), include=["str_value.first"])
+        with self.assertRaises(ValueError):
+            object_to_json(SimpleDataclass(), exclude=["datetime_value.year"])
+        with self.assertRaises(ValueError):
+            object_to_json(obj, include=["obj_value.dict_value.key"])
+
+    def test_json_string_serialization(self) -> None:
+        """Test writing JSON text directly without an intermediate JSON object."""
+
+        for options in [SerializerOptions(), SerializerOptions(compiled=True)]:
+            for obj in [
+                None,
+                True,
+                23,
+                1.5,
+                float("nan"),
+                'quoted "value" with \\ and \u00e1rv\u00edzt\u0171r\u0151',
+                [1, 2, 3],
+                {"key": [1.0, 2.5]},
+                (1, "two"),
+                Suit.Diamonds,
+                SimpleDataclass(),
+                AnnotatedSimpleDataclass(),
+                CompositeDataclass(list_value=["a"], dict_value={"key": 42}, optional_value="value"),
+                CompositeDataclass(),
+                MultipleInheritanceDerivedClass(),
+                NestedDataclass(),
+                LiteralWrapper("val1"),
+                BinaryValueWrapper(bytes([65, 78])),
+                SimpleTypedClass(23, "string"),
+                SimpleTypedNamedTuple(23, "string"),
+                SimpleUntypedClass(23, "string"),
+            ]:
+                with self.subTest(obj=obj, options=options):
+                    expected = json_dump_string(object_to_json(obj, options=options))
+                    self.assertEqual(object_to_json_string(obj, options=options), expected)
+                    self.assertEqual(object_to_json_bytes(obj, options=options), expected.encode("utf-8"))
+
+    def test_json_dump_serialization(self) -> None:
+        """Test writing JSON text with the JSON encoder in the standard library and a serializer hook."""
+
+        for obj in [
+            None,
+            23,
+            "string",
+            [1, 2, 3],
+            {"key": [1.0, 2.5]},
+            {Side.LEFT: 1, Side.RIGHT: 2},
+            (1, "two", UID("1ab4ffd1-ccdf-4311-9a0d-64a8ce1d88d6")),
+            {1, 2},
+            Suit.Diamonds,
+            SimpleDataclass(),
+            AnnotatedSimpleDataclass(),
+            CompositeDataclass(list_value=["a"], dict_value={"key": 42}, set_value={1, 2}, optional_value="value"),
+            MultipleInheritanceDerivedClass(),
+            NestedDataclass(),
+            NestedJson({"array": [1, 2, 3], "object": {"key": "value"}}),
+            LiteralWrapper("val1"),
+            BinaryValueWrapper(bytes([65, 78])),
+            SimpleTypedClass(23, "string"),
+            SimpleTypedNamedTuple(23, "string"),
+            [SimpleTypedNamedTuple(23, "string"), SimpleUntypedNamedTuple(23, "string")],
+            SimpleUntypedClass(23, "string"),
+            BaseClassWrapper(SimpleDerivedClass(), [SimpleDerivedClass()], {"key": SimpleDerivedClass()}),
+        ]:
+            with self.subTest(obj=obj):
+                expected = json_dump_string(object_to_json(obj))
+                self.assertEqual(object_dump_string(obj), expected)
+
+                with io.StringIO() as f:
+                    object_dump(obj, f)
+                    self.assertEqual(f.getvalue(), f"{expected}\n")
+
+    def test_dump_lines(self) -> None:
+        with io.StringIO() as f:
+            dump_lines((SimpleValueWrapper(k) for k in range(5)), f, chunk_size=2)
+            self.assertEqual(f.getvalue(), "".join(f'{{"value":{k}}}\n' for k in range(5)))
+
+        with io.StringIO() as f:
+            dump_lines([], f)
+            self.assertEqual(f.getvalue(), "")
+
+        objs = [
+            SimpleValueWrapper(1),
+            Suit.Hearts,
+            [SimpleDataclass()],
+            BaseClassWrapper(SimpleDerivedClass(), [SimpleDerivedClass()], {"key": SimpleDerivedClass()}),
+        ]
+        with io.StringIO() as f:
+            dump_lines(objs, f)
+            self.assertEqual(f.getvalue().splitlines(), [json_dump_string(object_to_json(obj)) for obj in objs])
+
+    def test_parallel_serialization(self) -> None:
+        objs = [SimpleValueWrapper(k) for k in range(10)] + [SimpleDataclass(), Suit.Hearts, None, [1, 2]]
+        expected = [object_dump_string(obj).encode("utf-8") for obj in objs]
+
+        self.assertEqual(object_to_json_many(objs, chunk_size=3), expected)
+        self.assertEqual(object_to_json_many([]), [])
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(object_to_json_many(objs, executor=executor, chunk_size=4), expected)
+
+    def test_typed_writer(self) -> None:
+        writer = TypedWriter(SimpleValueWrapper)
+        self.assertEqual(writer.write(SimpleValueWrapper(42)), {"value": 42})
+        self.assertEqual(
+            writer.write_many([SimpleValueWrapper(1), SimpleValueWrapper(2)]),
+            [{"value": 1}, {"value": 2}],
+        )
+
+        compiled_writer = TypedWriter(NestedDataclass, options=SerializerOptions(compiled=True))
+        self.assertEqual(compiled_writer.write(NestedDataclass()), object_to_json(NestedDataclass()))
+
+        # forward reference evaluated in the caller's module when the generic class is subscripted
+        forward_writer = TypedWriter[SimpleValueWrapper]("SimpleValueWrapper")  # type: ignore[arg-type]
+        self.assertEqual(forward_writer.write(SimpleValueWrapper(42)), {"value": 42})
+
     def test_recursive_serialization(self) -> None:
         """Test object serialization with types that have a recursive definition, including forward references."""
 